@@ -0,0 +1,72 @@
+"""Markdown → DOCX: in-process fast path vs pandoc, in documents per second.
+
+Usage::
+
+    python benchmarks/md2docx_fast.py [--docs 200] [--seed 0]
+
+Generates simple synthetic Markdown documents (headings, paragraphs,
+emphasis, code, links, nested lists), converts each one with
+``markdown_to_docx_bytes(fast=True)`` and with plain pandoc, and prints the
+throughput of both. The first fast conversion builds the DOCX skeleton and
+is excluded from the timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from docutil.conversions.markdown_to_docx import markdown_to_docx_bytes
+
+WORDS = "alpha beta gamma delta epsilon report draft review owner status".split()
+
+
+def make_document(rng: random.Random) -> str:
+    def sentence() -> str:
+        words = rng.choices(WORDS, k=rng.randint(6, 16))
+        i = rng.randrange(len(words))
+        words[i] = rng.choice(["*{}*", "**{}**", "`{}`", "[{}](https://example.com/{})"]).format(
+            words[i], words[i]
+        )
+        return " ".join(words).capitalize() + "."
+
+    blocks = [f"# {sentence()}"]
+    for section in range(rng.randint(2, 5)):
+        blocks.append(f"## Section {section + 1}")
+        blocks.append("\n".join(sentence() for _ in range(rng.randint(1, 4))))
+        if rng.random() < 0.6:
+            marker = rng.choice(["-", "1."])
+            items = [f"{marker} {sentence()}" for _ in range(rng.randint(2, 6))]
+            items.insert(2, f"   - {sentence()}")
+            blocks.append("\n".join(items))
+    return "\n\n".join(blocks) + "\n"
+
+
+def throughput(docs: list[str], *, fast: bool) -> float:
+    start = time.perf_counter()
+    for text in docs:
+        markdown_to_docx_bytes(text, fast=fast)
+    return len(docs) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    docs = [make_document(rng) for _ in range(args.docs)]
+    markdown_to_docx_bytes(docs[0], fast=True)  # warm the skeleton cache
+
+    fast = throughput(docs, fast=True)
+    pandoc = throughput(docs, fast=False)
+    print(f"documents:  {len(docs)}")
+    print(f"fast path:  {fast:8.1f} docs/s")
+    print(f"pandoc:     {pandoc:8.1f} docs/s")
+    print(f"speed-up:   {fast / pandoc:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""PDF text extraction: sequential vs process pool, in pages per second.
+
+Usage::
+
+    python benchmarks/pdf_extract_parallel.py [--pages 2000] [--workers 1 2 4 8] [--pdf FILE]
+
+Without ``--pdf`` a synthetic document is generated (dense text on every
+page). Each worker count extracts the whole document with
+``iter_pdf_pages(workers=N)``; the output is checked to be byte-identical
+to the sequential run before its throughput is printed.
+
+Requires PyMuPDF (``pip install ".[pdf]"``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from docutil.inspect.pdf_extract import iter_pdf_pages
+
+WORDS = "regulation clause party annex schedule obligation notice term audit record".split()
+
+
+def make_pdf(path: Path, pages: int, seed: int) -> None:
+    import fitz
+
+    rng = random.Random(seed)
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        text = "\n".join(" ".join(rng.choices(WORDS, k=12)) for _ in range(55))
+        page.insert_textbox(page.rect + (36, 36, -36, -36), text, fontsize=9)
+    doc.save(path)
+    doc.close()
+
+
+def run(pdf: Path, workers: int) -> tuple[float, str, int]:
+    digest = hashlib.sha256()
+    count = 0
+    start = time.perf_counter()
+    for page in iter_pdf_pages(pdf, workers=workers):
+        digest.update(page.text.encode("utf-8"))
+        count += 1
+    return time.perf_counter() - start, digest.hexdigest(), count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--pdf", type=Path, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = args.pdf
+        if pdf is None:
+            pdf = Path(tmp) / "synthetic.pdf"
+            make_pdf(pdf, args.pages, args.seed)
+
+        _, reference, pages = run(pdf, 1)
+        print(f"pages:      {pages}")
+        baseline = 0.0
+        for workers in args.workers:
+            elapsed, digest, _ = run(pdf, workers)
+            if digest != reference:
+                raise SystemExit(f"workers={workers}: output differs from sequential run")
+            baseline = baseline or elapsed
+            print(
+                f"workers={workers:<3} {pages / elapsed:9.1f} pages/s"
+                f"   speed-up {baseline / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,536 @@
+from __future__ import annotations
+
+"""
+Batch Benchmarks (bench)
+========================
+
+Reproducible throughput measurements for :func:`batch_convert`.
+
+A benchmark run
+---------------
+1. generates a deterministic synthetic corpus (Markdown or DOCX) whose file
+   sizes follow a configurable distribution;
+2. optionally puts a stub ``pandoc`` first on ``PATH``. The stub answers
+   the version and format probes and copies input to output after a fixed
+   delay, so what is measured is docutil's own orchestration overhead
+   (discovery, planning, subprocess handling, writes) rather than pandoc;
+3. converts the corpus once per worker count, each repeat in a fresh
+   process so that peak RSS is per case;
+4. reports files/s, per-file latency percentiles and peak RSS as JSON that
+   can be diffed between commits (:func:`compare_results`).
+
+The stub is a POSIX shell script; on Windows use ``real_pandoc=True``.
+
+Usage
+-----
+docutil bench md2docx --files 2000 --workers 1 --workers 8 --output bench.json
+docutil bench md2docx --baseline bench.json
+"""
+
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import stat
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Literal
+
+from docutil import __version__
+
+BenchMode = Literal["docx2md", "md2docx"]
+SizeDist = Literal["fixed", "uniform", "lognormal"]
+
+SCHEMA_VERSION = 1
+
+# Input suffix, output suffix per mode.
+_MODES: dict[str, tuple[str, str]] = {
+    "docx2md": (".docx", ".md"),
+    "md2docx": (".md", ".docx"),
+}
+
+_FILES_PER_DIR = 100
+_WORDS = (
+    "alpha beta gamma delta epsilon report draft review owner status contract "
+    "annex schedule notice audit record policy retention clause party"
+).split()
+
+
+# -----------------------------------------------------------------------------
+# Synthetic Corpus
+# -----------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Shape of a synthetic corpus.
+
+    Sizes are the target amount of text per document (before DOCX
+    compression). ``lognormal`` has a long tail of large files, which is
+    what real document folders tend to look like.
+    """
+
+    mode: BenchMode = "md2docx"
+    files: int = 500
+    size_dist: SizeDist = "lognormal"
+    mean_kb: float = 8.0
+    seed: int = 0
+
+
+def file_sizes(spec: CorpusSpec) -> list[int]:
+    """Target byte size of every document in *spec* (deterministic)."""
+    rng = random.Random(spec.seed)
+    mean = spec.mean_kb * 1024
+    sizes: list[float]
+    if spec.size_dist == "fixed":
+        sizes = [mean] * spec.files
+    elif spec.size_dist == "uniform":
+        sizes = [rng.uniform(0, 2 * mean) for _ in range(spec.files)]
+    elif spec.size_dist == "lognormal":
+        sigma = 1.0
+        mu = math.log(mean) - sigma**2 / 2  # keeps the mean at mean_kb
+        sizes = [rng.lognormvariate(mu, sigma) for _ in range(spec.files)]
+    else:
+        raise ValueError(f"Unknown size distribution: {spec.size_dist!r}")
+    return [max(64, int(size)) for size in sizes]
+
+
+def _paragraphs(rng: random.Random, size: int) -> Iterator[str]:
+    written = 0
+    while written < size:
+        text = " ".join(rng.choices(_WORDS, k=rng.randint(20, 80))).capitalize() + "."
+        written += len(text) + 2
+        yield text
+
+
+def _markdown(rng: random.Random, size: int) -> bytes:
+    blocks = [f"# Document {rng.randrange(10**6)}"]
+    for i, para in enumerate(_paragraphs(rng, size)):
+        if i and i % 8 == 0:
+            blocks.append(f"## Section {i // 8}")
+        blocks.append(para)
+    return ("\n\n".join(blocks) + "\n").encode("utf-8")
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/'
+    '2006/relationships/officeDocument" Target="word/document.xml"/>'
+    "</Relationships>"
+)
+
+
+def _docx(rng: random.Random, size: int) -> bytes:
+    body = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{para}</w:t></w:r></w:p>'
+        for para in _paragraphs(rng, size)
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buf = tempfile.SpooledTemporaryFile()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        # Fixed timestamps keep the bytes identical for a given seed.
+        for name, data in (
+            ("[Content_Types].xml", _CONTENT_TYPES),
+            ("_rels/.rels", _RELS),
+            ("word/document.xml", document),
+        ):
+            zf.writestr(zipfile.ZipInfo(name, date_time=(2020, 1, 1, 0, 0, 0)), data)
+    buf.seek(0)
+    return buf.read()
+
+
+def make_corpus(root: Path | str, spec: CorpusSpec) -> list[Path]:
+    """Write the corpus described by *spec* under *root* and return its files.
+
+    Files are spread over subfolders of 100 so discovery walks a tree, not
+    one flat directory. The same spec always produces the same bytes.
+    """
+    root = Path(root)
+    suffix = _MODES[spec.mode][0]
+    render = _docx if spec.mode == "docx2md" else _markdown
+    rng = random.Random(spec.seed)
+
+    paths = []
+    for i, size in enumerate(file_sizes(spec)):
+        path = root / f"d{i // _FILES_PER_DIR:03d}" / f"doc{i:05d}{suffix}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(render(rng, size))
+        paths.append(path)
+    return paths
+
+
+# -----------------------------------------------------------------------------
+# Stub Pandoc
+# -----------------------------------------------------------------------------
+
+_STUB = """#!/bin/sh
+# docutil bench: stand-in for pandoc (copies input to output).
+case "$1" in
+  --version) echo "pandoc 3.1.2"; exit 0;;
+  --list-input-formats|--list-output-formats)
+    printf 'commonmark\\ndocx\\ngfm\\nmarkdown\\nplain\\n'; exit 0;;
+esac
+out=-; src=
+for a; do
+  case $a in
+    --output=*) out=${a#--output=};;
+    -*) ;;
+    *) src=$a;;
+  esac
+done
+%(sleep)s
+if [ -z "$src" ]; then src=/dev/stdin; fi
+if [ "$out" = - ]; then exec cat "$src"; fi
+exec cp "$src" "$out"
+"""
+
+
+@contextmanager
+def stub_pandoc(delay: float = 0.0) -> Iterator[Path]:
+    """Put a stub ``pandoc`` that sleeps *delay* seconds first on ``PATH``.
+
+    ``PYPANDOC_PANDOC`` is pointed at the stub too, so pypandoc does not pick
+    a real (higher-versioned) pandoc. Both are restored on exit.
+    """
+    if os.name == "nt":
+        raise RuntimeError("The stub pandoc needs a POSIX shell; use real pandoc on Windows.")
+
+    saved = {name: os.environ.get(name) for name in ("PATH", "PYPANDOC_PANDOC")}
+    with tempfile.TemporaryDirectory(prefix="docutil-bench-") as tmp:
+        exe = Path(tmp) / "pandoc"
+        exe.write_text(_STUB % {"sleep": f"sleep {delay:g}" if delay > 0 else ""})
+        exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+
+        os.environ["PATH"] = f"{tmp}{os.pathsep}{saved['PATH'] or ''}"
+        os.environ["PYPANDOC_PANDOC"] = str(exe)
+        try:
+            yield exe
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+# -----------------------------------------------------------------------------
+# Measurement
+# -----------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    """Median-of-repeats measurement for one worker count."""
+
+    workers: int
+    files: int
+    failed: int
+    elapsed_s: float
+    files_per_s: float
+    latency_ms: dict[str, float]
+    peak_rss_bytes: int | None
+
+
+@dataclass
+class BenchResult:
+    """A full benchmark run, serializable with :meth:`to_dict`."""
+
+    config: dict[str, Any]
+    cases: list[CaseResult] = field(default_factory=list)
+    environment: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema": SCHEMA_VERSION,
+            "environment": self.environment,
+            "config": self.config,
+            "cases": [asdict(case) for case in self.cases],
+        }
+
+    def write_json(self, path: Path | str) -> Path:
+        """Atomically write the results as JSON and return the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(self.to_dict(), fh, indent=2)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank *q*-th percentile of sorted *values* (0 when empty)."""
+    if not values:
+        return 0.0
+    rank = max(0, math.ceil(q / 100 * len(values)) - 1)
+    return values[rank]
+
+
+def _peak_rss_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _run_case(corpus: str, mode: str, workers: int, out_dir: str) -> dict[str, Any]:
+    """Convert *corpus* once; runs in a fresh process (see :func:`run_benchmark`)."""
+    from docutil.conversions.batch import batch_convert
+    from docutil.conversions.docx_to_markdown import docx_to_markdown
+    from docutil.conversions.markdown_to_docx import markdown_to_docx
+    from docutil.conversions.report import BatchReport
+
+    input_suffix, output_suffix = _MODES[mode]
+    converter = docx_to_markdown if mode == "docx2md" else markdown_to_docx
+    report = BatchReport()
+
+    start = time.perf_counter()
+    batch_convert(
+        corpus,
+        input_suffix,
+        converter,
+        output_folder=out_dir,
+        output_suffix=output_suffix,
+        recursive=True,
+        force=True,
+        progress=False,
+        workers=workers,
+        keep_going=True,
+        report=report,
+    )
+    elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed": elapsed,
+        "converted": report.converted,
+        "failed": report.failed,
+        "latencies": sorted(r.duration for r in report.results if r.status == "converted"),
+        "peak_rss": _peak_rss_bytes(),
+    }
+
+
+def _summarize(workers: int, runs: list[dict[str, Any]]) -> CaseResult:
+    run = sorted(runs, key=lambda r: r["elapsed"])[len(runs) // 2]  # median elapsed
+    latencies = [d * 1000 for d in run["latencies"]]
+    rss = [r["peak_rss"] for r in runs if r["peak_rss"] is not None]
+    return CaseResult(
+        workers=workers,
+        files=run["converted"],
+        failed=run["failed"],
+        elapsed_s=round(run["elapsed"], 4),
+        files_per_s=round(run["converted"] / run["elapsed"], 2) if run["elapsed"] else 0.0,
+        latency_ms={
+            "p50": round(percentile(latencies, 50), 3),
+            "p90": round(percentile(latencies, 90), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "max": round(latencies[-1], 3) if latencies else 0.0,
+            "mean": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+        },
+        peak_rss_bytes=max(rss) if rss else None,
+    )
+
+
+def _environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "docutil": __version__,
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+_CORPUS_MARKER = ".docutil-bench.json"
+
+
+def _check_corpus_dir(corpus: Path) -> None:
+    # The corpus folder is wiped when regenerated, so only accept a folder
+    # this module created (it has the marker), an empty one or a new path.
+    if corpus.is_dir() and not (corpus / _CORPUS_MARKER).is_file() and any(corpus.iterdir()):
+        raise ValueError(
+            f"{corpus} is not empty and does not hold a docutil bench corpus; "
+            "choose an empty or new folder."
+        )
+    if corpus.exists() and not corpus.is_dir():
+        raise ValueError(f"{corpus} is not a folder.")
+
+
+def run_benchmark(
+    spec: CorpusSpec,
+    *,
+    workers: Sequence[int] = (1, 2, 4, 8),
+    repeat: int = 3,
+    pandoc_delay: float = 0.0,
+    real_pandoc: bool = False,
+    corpus_dir: Path | str | None = None,
+) -> BenchResult:
+    """
+    Benchmark ``batch_convert`` over a synthetic corpus.
+
+    Parameters
+    ----------
+    spec
+        Corpus to generate.
+    workers
+        Worker counts to measure, in order.
+    repeat
+        Runs per worker count; the run with the median elapsed time is
+        reported. Every run happens in a fresh process.
+    pandoc_delay
+        Seconds the stub pandoc sleeps per conversion (ignored with
+        *real_pandoc*).
+    real_pandoc
+        Use the installed pandoc instead of the stub.
+    corpus_dir
+        Where to generate the corpus. It is reused if it already holds a
+        corpus for the same spec and regenerated if it holds another bench
+        corpus; by default a temporary folder is used. A non-empty folder
+        that is not a bench corpus is never touched.
+
+    Returns
+    -------
+    BenchResult
+
+    Raises
+    ------
+    ValueError
+        Invalid settings, or *corpus_dir* is a non-empty folder without a
+        bench corpus marker.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1.")
+    if not workers or min(workers) < 1:
+        raise ValueError("worker counts must be positive integers.")
+    if corpus_dir is not None:
+        _check_corpus_dir(Path(corpus_dir))
+
+    result = BenchResult(
+        config={
+            **asdict(spec),
+            "workers": list(workers),
+            "repeat": repeat,
+            "pandoc": "real" if real_pandoc else "stub",
+            "pandoc_delay_s": None if real_pandoc else pandoc_delay,
+        },
+        environment=_environment(),
+    )
+
+    with tempfile.TemporaryDirectory(prefix="docutil-bench-") as tmp:
+        corpus = Path(corpus_dir) if corpus_dir is not None else Path(tmp) / "corpus"
+        marker = corpus / _CORPUS_MARKER
+        wanted = json.dumps(asdict(spec), sort_keys=True)
+        if not (marker.exists() and marker.read_text(encoding="utf-8") == wanted):
+            shutil.rmtree(corpus, ignore_errors=True)
+            make_corpus(corpus, spec)
+            marker.write_text(wanted, encoding="utf-8")
+
+        with nullcontext() if real_pandoc else stub_pandoc(pandoc_delay):
+            for count in workers:
+                runs = []
+                for n in range(repeat):
+                    out_dir = Path(tmp) / f"out-{count}-{n}"
+                    with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as ex:
+                        runs.append(
+                            ex.submit(
+                                _run_case, str(corpus), spec.mode, count, str(out_dir)
+                            ).result()
+                        )
+                    shutil.rmtree(out_dir, ignore_errors=True)
+                result.cases.append(_summarize(count, runs))
+
+    return result
+
+
+# -----------------------------------------------------------------------------
+# Reporting
+# -----------------------------------------------------------------------------
+
+
+def format_results(result: BenchResult | dict[str, Any]) -> str:
+    """Human-readable table of a result (or its JSON form)."""
+    data = result.to_dict() if isinstance(result, BenchResult) else result
+    lines = [
+        f"{'workers':>7} {'files/s':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'RSS MiB':>8}"
+    ]
+    for case in data["cases"]:
+        rss = case["peak_rss_bytes"]
+        lat = case["latency_ms"]
+        lines.append(
+            f"{case['workers']:>7} {case['files_per_s']:>9.1f} {lat['p50']:>8.2f} "
+            f"{lat['p90']:>8.2f} {lat['p99']:>8.2f} "
+            f"{rss / 2**20 if rss is not None else float('nan'):>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def compare_results(baseline: dict[str, Any], current: dict[str, Any]) -> str:
+    """Per-worker-count change in files/s and p99 latency versus *baseline*.
+
+    Only worker counts present in both results are compared; a config
+    mismatch (corpus, pandoc delay) is reported on the first line.
+    """
+    lines = []
+    keys = ("mode", "files", "size_dist", "mean_kb", "seed", "pandoc", "pandoc_delay_s")
+    if any(baseline["config"].get(k) != current["config"].get(k) for k in keys):
+        lines.append("warning: configurations differ; numbers are not directly comparable")
+
+    before = {case["workers"]: case for case in baseline["cases"]}
+    for case in current["cases"]:
+        old = before.get(case["workers"])
+        if old is None:
+            continue
+        lines.append(
+            f"workers={case['workers']}: "
+            f"files/s {old['files_per_s']:.1f} -> {case['files_per_s']:.1f} "
+            f"({_change(old['files_per_s'], case['files_per_s'])}), "
+            f"p99 {old['latency_ms']['p99']:.2f} -> {case['latency_ms']['p99']:.2f} ms "
+            f"({_change(old['latency_ms']['p99'], case['latency_ms']['p99'])})"
+        )
+    return "\n".join(lines)
+
+
+def _change(old: float, new: float) -> str:
+    return f"{(new - old) / old:+.1%}" if old else "n/a"
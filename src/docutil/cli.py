@@ -15,26 +15,27 @@ Design Goals
 • Human-readable output
 • Machine-readable (JSON) where appropriate
 • Zero external system dependencies
+
+Heavy dependencies (pypandoc, tqdm, sqlite3, PyMuPDF, ...) are imported inside
+the command that needs them, so ``docutil version`` and ``--help`` start fast.
 """
 
 import json
 import logging
+import sys
 from collections.abc import Callable
+from dataclasses import asdict
+from functools import partial
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import typer
 
 from docutil import __version__
-from docutil.conversions.batch import batch_convert
-from docutil.conversions.docx_to_markdown import docx_to_markdown
-from docutil.conversions.markdown_to_docx import markdown_to_docx
-from docutil.doctor import run_doctor
-from docutil.inspect.docx_metadata import inspect_docx_metadata
-from docutil.logging_utils import configure_logging
-from docutil.templates import scaffold_project
-from docutil.utils.version_bump import bump_version
-from docutil.utils.versioning import generate_versioned_path
+from docutil.logging_utils import configure_logging, shutdown_logging
+
+if TYPE_CHECKING:
+    from docutil.inspect.docx_metadata import DocxMetadata, InspectFailure
 
 # -----------------------------------------------------------------------------
 # Typer App Setup
@@ -57,8 +58,14 @@ Common Commands:
 )
 
 inspect_app = typer.Typer(add_completion=False)
+cache_app = typer.Typer(add_completion=False, help="Manage the conversion cache.")
+index_app = typer.Typer(add_completion=False, help="Query a persistent DOCX metadata index.")
+search_app = typer.Typer(add_completion=False, help="Full-text search over Markdown and PDFs.")
 
 app.add_typer(inspect_app, name="inspect")
+app.add_typer(cache_app, name="cache")
+app.add_typer(index_app, name="index")
+app.add_typer(search_app, name="search")
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +83,8 @@ def doctor() -> None:
 
     Safe to run in CI environments.
     """
+    from docutil.doctor import run_doctor
+
     run_doctor()
 
 
@@ -86,6 +95,7 @@ def doctor() -> None:
 
 @app.callback()
 def _main(
+    ctx: typer.Context,
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -96,9 +106,33 @@ def _main(
         "--log-file",
         help="Optional log file path.",
     ),
+    log_format: Literal["text", "json"] = typer.Option(
+        "text",
+        "--log-format",
+        help="Log line format: human-readable text or JSON Lines.",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Print a per-stage timing breakdown to stderr when the command ends.",
+    ),
+    profile_out: Path | None = typer.Option(
+        None,
+        "--profile-out",
+        help="Implies --profile; also write a Chrome trace (.json) or cProfile stats (.prof).",
+    ),
 ) -> None:
     """Global CLI options."""
-    configure_logging(level=logging.DEBUG if verbose else logging.INFO, log_file=log_file)
+    configure_logging(
+        level=logging.DEBUG if verbose else logging.INFO, log_file=log_file, fmt=log_format
+    )
+    ctx.call_on_close(shutdown_logging)  # flush the background log queue
+
+    if profile or profile_out is not None:
+        from docutil.profiling import profiling
+
+        profiler = ctx.with_resource(profiling(profile_out))
+        ctx.call_on_close(lambda: typer.echo(profiler.format_summary(), err=True))
 
 
 # -----------------------------------------------------------------------------
@@ -117,16 +151,67 @@ def version() -> None:
 # -----------------------------------------------------------------------------
 
 
+def _is_dash(path: Path | None) -> bool:
+    return path is not None and str(path) == "-"
+
+
+def _pipe(
+    input_path: Path,
+    output_path: Path | None,
+    convert: Callable[[bytes], bytes],
+    *,
+    overwrite: bool,
+    versioned: bool,
+    binary_output: bool,
+) -> None:
+    """Convert in memory when stdin (``-``) and/or stdout (``-``) is involved.
+
+    Reading stdin without an output path writes to stdout.
+    """
+    from docutil.utils.versioning import generate_versioned_path
+
+    to_stdout = output_path is None or _is_dash(output_path)
+
+    if to_stdout and binary_output and sys.stdout.isatty():
+        typer.echo("Refusing to write binary DOCX to a terminal; redirect stdout.", err=True)
+        raise typer.Exit(code=1)
+
+    if not to_stdout:
+        assert output_path is not None
+        if versioned:
+            output_path = generate_versioned_path(output_path)
+        if output_path.exists() and not overwrite:
+            typer.echo("Output exists. Use --force or --versioned.")
+            raise typer.Exit(code=1)
+
+    data = sys.stdin.buffer.read() if _is_dash(input_path) else input_path.read_bytes()
+    result = convert(data)
+
+    if to_stdout:
+        sys.stdout.buffer.write(result)
+        sys.stdout.buffer.flush()
+        return
+
+    assert output_path is not None
+    output_path.write_bytes(result)
+    typer.echo(output_path)
+
+
 @app.command("docx2md")
 def cli_docx2md(
     input_path: Path = typer.Argument(
         ...,
         exists=True,
-        help="Path to the input DOCX file.",
+        allow_dash=True,
+        help="Path to the input DOCX file, or - to read stdin.",
     ),
     output_path: Path | None = typer.Argument(
         None,
-        help="Optional output path. Defaults to input filename with .md extension.",
+        allow_dash=True,
+        help=(
+            "Optional output path, or - for stdout. Defaults to input filename with "
+            ".md extension (stdout when reading stdin)."
+        ),
     ),
     force: bool = typer.Option(
         False,
@@ -138,6 +223,16 @@ def cli_docx2md(
         "--versioned",
         help="Append date + per-day version suffix (e.g., _2026-02-14_v1).",
     ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Convert simple documents in-process; falls back to pandoc.",
+    ),
+    media_dir: Path | None = typer.Option(
+        None,
+        "--media-dir",
+        help="Extract images into this shared, content-addressed folder.",
+    ),
 ) -> None:
     """
     Convert DOCX → Markdown.
@@ -145,7 +240,26 @@ def cli_docx2md(
     Examples:
       docutil docx2md input.docx
       docutil docx2md input.docx output.md --versioned
+      docutil docx2md input.docx --fast
+      docutil docx2md input.docx --media-dir ./media
+      cat input.docx | docutil docx2md - > output.md
     """
+    from docutil.conversions.docx_to_markdown import docx_to_markdown, docx_to_markdown_bytes
+    from docutil.conversions.media import MediaStore
+    from docutil.utils.versioning import generate_versioned_path
+
+    if _is_dash(input_path) or _is_dash(output_path):
+        if media_dir is not None:
+            raise typer.BadParameter("requires file input and output.", param_hint="--media-dir")
+        _pipe(
+            input_path,
+            output_path,
+            lambda data: docx_to_markdown_bytes(data, fast=fast).encode("utf-8"),
+            overwrite=force or versioned,
+            versioned=versioned,
+            binary_output=False,
+        )
+        return
 
     if output_path is None:
         output_path = input_path.with_suffix(".md")
@@ -157,7 +271,8 @@ def cli_docx2md(
         typer.echo("Output exists. Use --force or --versioned.")
         raise typer.Exit(code=1)
 
-    typer.echo(docx_to_markdown(input_path, output_path))
+    media = MediaStore(media_dir) if media_dir is not None else None
+    typer.echo(docx_to_markdown(input_path, output_path, fast=fast, media=media))
 
 
 @app.command("md2docx")
@@ -165,11 +280,16 @@ def cli_md2docx(
     input_path: Path = typer.Argument(
         ...,
         exists=True,
-        help="Path to the input Markdown file.",
+        allow_dash=True,
+        help="Path to the input Markdown file, or - to read stdin.",
     ),
     output_path: Path | None = typer.Argument(
         None,
-        help="Optional output path. Defaults to input filename with .docx extension.",
+        allow_dash=True,
+        help=(
+            "Optional output path, or - for stdout. Defaults to input filename with "
+            ".docx extension (stdout when reading stdin)."
+        ),
     ),
     force: bool = typer.Option(
         False,
@@ -181,6 +301,11 @@ def cli_md2docx(
         "--versioned",
         help="Append date + per-day version suffix (e.g., _2026-02-14_v1).",
     ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Write simple documents in-process; falls back to pandoc.",
+    ),
 ) -> None:
     """
     Convert Markdown → DOCX.
@@ -188,7 +313,22 @@ def cli_md2docx(
     Examples:
       docutil md2docx input.md
       docutil md2docx input.md output.docx --versioned
+      docutil md2docx input.md --fast
+      generate-notes | docutil md2docx - notes.docx
     """
+    from docutil.conversions.markdown_to_docx import markdown_to_docx, markdown_to_docx_bytes
+    from docutil.utils.versioning import generate_versioned_path
+
+    if _is_dash(input_path) or _is_dash(output_path):
+        _pipe(
+            input_path,
+            output_path,
+            partial(markdown_to_docx_bytes, fast=fast),
+            overwrite=force,
+            versioned=versioned,
+            binary_output=True,
+        )
+        return
 
     if output_path is None:
         output_path = input_path.with_suffix(".docx")
@@ -200,7 +340,7 @@ def cli_md2docx(
         typer.echo("Output exists. Use --force or --versioned.")
         raise typer.Exit(code=1)
 
-    typer.echo(markdown_to_docx(input_path, output_path))
+    typer.echo(markdown_to_docx(input_path, output_path, fast=fast))
 
 
 # -----------------------------------------------------------------------------
@@ -208,9 +348,34 @@ def cli_md2docx(
 # -----------------------------------------------------------------------------
 
 
+def _check_size(value: str | None) -> str | None:
+    """Option callback: reject sizes :func:`parse_size` cannot read."""
+    if value is None:
+        return None
+    from docutil.conversions.cache import parse_size
+
+    try:
+        parse_size(value)
+    except ValueError as exc:
+        raise typer.BadParameter(f"{exc} Use bytes or a K/M/G/T suffix, e.g. 500M.") from exc
+    return value
+
+
+def _parse_workers(value: str) -> int | Literal["auto"]:
+    if value.strip().lower() == "auto":
+        return "auto"
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        raise typer.BadParameter("must be a positive integer or 'auto'.", param_hint="--workers")
+    return count
+
+
 @app.command("batch")
 def cli_batch(
-    mode: Literal["docx2md", "md2docx"] = typer.Argument(
+    mode: Literal["docx2md", "md2docx", "pdf2txt"] = typer.Argument(
         ...,
         help="Conversion mode.",
     ),
@@ -222,6 +387,16 @@ def cli_batch(
         help="Folder containing files to convert.",
     ),
     recursive: bool = typer.Option(False, "--recursive", help="Search folders recursively."),
+    exclude: list[str] | None = typer.Option(
+        None,
+        "--exclude",
+        help="Gitignore-style pattern to skip (repeatable), e.g. --exclude node_modules.",
+    ),
+    use_gitignore: bool = typer.Option(
+        False,
+        "--gitignore",
+        help="Honour .gitignore files while scanning (and skip .git).",
+    ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview work without writing files."),
     force: bool = typer.Option(False, "--force", help="Overwrite existing outputs."),
     versioned: bool = typer.Option(
@@ -231,23 +406,171 @@ def cli_batch(
     ),
     out_folder: Path | None = typer.Option(None, "--out-folder", help="Optional output folder."),
     no_progress: bool = typer.Option(False, "--no-progress", help="Disable progress bar."),
-    workers: int = typer.Option(1, "--workers", min=1, help="Number of parallel workers."),
+    workers: str = typer.Option(
+        "1",
+        "--workers",
+        help="Number of parallel workers, or 'auto' to adapt to throughput and memory.",
+    ),
+    min_workers: int = typer.Option(1, "--min-workers", min=1, help="Lower bound for auto."),
+    max_workers: int | None = typer.Option(
+        None,
+        "--max-workers",
+        min=1,
+        help="Upper bound for auto (default: CPU count).",
+    ),
+    pages: str | None = typer.Option(
+        None, "--pages", help="pdf2txt: 1-based pages to extract, e.g. 1-3,7,10-."
+    ),
+    engine: Literal["subprocess", "server"] = typer.Option(
+        "subprocess",
+        "--engine",
+        help="Pandoc engine: 'subprocess' (one process per file) or 'server' (warm pool).",
+    ),
+    use_cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse cached outputs for identical inputs (content-addressed).",
+    ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Cache directory (default: $DOCUTIL_CACHE_DIR or ~/.cache/docutil).",
+    ),
+    cache_max_size: str | None = typer.Option(
+        None,
+        "--cache-max-size",
+        callback=_check_size,
+        help="Cache size limit, e.g. 500M or 2G (default: $DOCUTIL_CACHE_MAX_SIZE or 1G).",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only convert new or changed sources (tracked in .docutil-manifest.json).",
+    ),
+    delete_orphans: bool = typer.Option(
+        False,
+        "--delete-orphans",
+        help="With --incremental, delete outputs whose sources were removed.",
+    ),
+    keep_going: bool = typer.Option(
+        False,
+        "--keep-going",
+        help="Record failures and continue instead of aborting on the first error.",
+    ),
+    retries: int = typer.Option(
+        0,
+        "--retries",
+        min=0,
+        help="Retry transient failures this many times (exponential backoff).",
+    ),
+    report_path: Path | None = typer.Option(
+        None,
+        "--report",
+        help="Write a JSON report with per-file status, timings and byte counts.",
+    ),
+    metrics_file: Path | None = typer.Option(
+        None,
+        "--metrics-file",
+        help="Write run metrics atomically to this textfile (e.g. for node_exporter).",
+    ),
+    metrics_format: Literal["openmetrics", "prometheus"] = typer.Option(
+        "openmetrics",
+        "--metrics-format",
+        help="Metrics exposition format.",
+    ),
+    metrics_label: list[str] | None = typer.Option(
+        None,
+        "--metrics-label",
+        help="KEY=VALUE label added to every metric (repeatable); mode is always set.",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip files already converted by an interrupted run (.docutil-journal.jsonl).",
+    ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Convert simple documents in-process; falls back to pandoc.",
+    ),
+    media_dir: Path | None = typer.Option(
+        None,
+        "--media-dir",
+        help="docx2md: extract images into one shared, content-addressed folder.",
+    ),
+    log_every: int | None = typer.Option(
+        None,
+        "--log-every",
+        min=0,
+        help="Log one in N per-file INFO lines (0: first only) plus a summary.",
+    ),
 ) -> None:
     """Batch convert files inside a folder.
 
     Examples:
       docutil batch docx2md ./docs
       docutil batch docx2md ./docs --recursive
+      docutil batch md2docx ./repo --recursive --gitignore --exclude node_modules
       docutil batch docx2md ./docs --out-folder ./converted
       docutil batch docx2md ./docs --versioned
+      docutil batch docx2md ./docs --workers 8 --engine server
+      docutil batch docx2md ./docs --workers auto --max-workers 16
+      docutil batch md2docx ./docs --out-folder ./out --cache
+      docutil batch md2docx ./docs --out-folder ./out --incremental --delete-orphans
+      docutil batch docx2md ./docs --keep-going --retries 2 --report report.json
+      docutil batch md2docx ./docs --out-folder ./out --resume
+      docutil batch docx2md ./docs --fast
+      docutil batch md2docx ./docs --fast
+      docutil batch docx2md ./docs --out-folder ./out --media-dir ./out/media
+      docutil batch pdf2txt ./filings --recursive --out-folder ./text --cache
+      docutil batch md2docx ./docs --metrics-file /var/lib/node_exporter/docutil.prom
+      docutil --log-format json batch docx2md ./archive --recursive --log-every 1000
+
+    Exits with code 2 if any file failed.
     """
+    from docutil.conversions.batch import batch_convert
+    from docutil.conversions.cache import ConversionCache
+    from docutil.conversions.docx_to_markdown import docx_to_markdown
+    from docutil.conversions.markdown_to_docx import markdown_to_docx
+    from docutil.conversions.media import MediaStore
+    from docutil.conversions.pdf_to_text import pdf_to_text
+    from docutil.conversions.report import BatchReport
+
+    if pages is not None and mode != "pdf2txt":
+        raise typer.BadParameter("only applies to pdf2txt.", param_hint="--pages")
+    if mode == "pdf2txt":
+        from docutil.inspect.pdf_extract import parse_page_spec
+
+        if engine != "subprocess":
+            raise typer.BadParameter("pdf2txt does not use pandoc.", param_hint="--engine")
+        if fast:
+            raise typer.BadParameter("does not apply to pdf2txt.", param_hint="--fast")
+        try:
+            # Check the syntax up front; page numbers are checked per document.
+            parse_page_spec(pages, sys.maxsize)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--pages") from exc
+
+    from docutil.conversions.metrics import parse_labels
+
+    try:
+        labels = {"mode": mode, **parse_labels(metrics_label or ())}
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--metrics-label") from exc
+
+    media = MediaStore(media_dir) if media_dir is not None else None
     modes: dict[str, tuple[str, str, Callable[[Path, Path | None], Path]]] = {
-        "docx2md": (".docx", ".md", docx_to_markdown),
-        "md2docx": (".md", ".docx", markdown_to_docx),
+        "docx2md": (".docx", ".md", partial(docx_to_markdown, fast=fast, media=media)),
+        "md2docx": (".md", ".docx", partial(markdown_to_docx, fast=fast)),
+        "pdf2txt": (".pdf", ".txt", partial(pdf_to_text, pages=pages)),
     }
 
     input_suffix, output_suffix, converter = modes[mode]
 
+    worker_count = _parse_workers(workers)
+    cache = ConversionCache(cache_dir, max_size=cache_max_size) if use_cache else None
+    report = BatchReport()
+
     batch_convert(
         folder,
         input_suffix,
@@ -255,25 +578,471 @@ def cli_batch(
         output_folder=out_folder,
         output_suffix=output_suffix if out_folder else None,
         recursive=recursive,
+        exclude=exclude or (),
+        use_gitignore=use_gitignore,
         dry_run=dry_run,
         force=force,
         versioned=versioned,
         progress=not no_progress,
-        workers=workers,
+        workers=worker_count,
+        min_workers=min_workers,
+        max_workers=max_workers,
+        engine=engine,
+        cache=cache,
+        incremental=incremental,
+        delete_orphans=delete_orphans,
+        keep_going=keep_going,
+        retries=retries,
+        report=report,
+        report_path=report_path,
+        resume=resume,
+        metrics_path=metrics_file,
+        metrics_labels=labels,
+        metrics_format=metrics_format,
+        log_every=log_every,
     )
 
+    if media is not None and mode == "docx2md":
+        logger.info("Media | %s | %s", media.root, media.summary())
 
-@inspect_app.command("docx")
-def cli_inspect_docx(
-    path: Path = typer.Argument(..., exists=True, help="DOCX file to inspect."),
+    if report.failed:
+        typer.echo(f"{report.failed} file(s) failed.", err=True)
+        raise typer.Exit(code=2)
+
+
+# -----------------------------------------------------------------------------
+# Watch Mode
+# -----------------------------------------------------------------------------
+
+
+@app.command("watch")
+def cli_watch(
+    mode: Literal["docx2md", "md2docx"] = typer.Argument(
+        ...,
+        help="Conversion mode.",
+    ),
+    folder: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Folder to watch.",
+    ),
+    recursive: bool = typer.Option(False, "--recursive", help="Watch folders recursively."),
+    versioned: bool = typer.Option(
+        False,
+        "--versioned",
+        help="Append date + per-day version suffix to each output file.",
+    ),
+    out_folder: Path | None = typer.Option(None, "--out-folder", help="Optional output folder."),
+    debounce: float = typer.Option(
+        0.25,
+        "--debounce",
+        min=0.0,
+        help="Seconds of quiet required before converting a burst of changes.",
+    ),
+    poll: bool = typer.Option(False, "--poll", help="Use stat polling instead of inotify."),
+    poll_interval: float = typer.Option(
+        1.0,
+        "--poll-interval",
+        min=0.05,
+        help="Polling interval in seconds (polling watcher only).",
+    ),
+) -> None:
+    """Reconvert files whenever they change (Ctrl+C to stop).
+
+    Examples:
+      docutil watch md2docx ./docs
+      docutil watch md2docx ./docs --recursive --out-folder ./review
+    """
+    from docutil.conversions.docx_to_markdown import docx_to_markdown
+    from docutil.conversions.markdown_to_docx import markdown_to_docx
+    from docutil.conversions.watch import watch_convert
+
+    modes: dict[str, tuple[str, str, Callable[[Path, Path | None], Path]]] = {
+        "docx2md": (".docx", ".md", docx_to_markdown),
+        "md2docx": (".md", ".docx", markdown_to_docx),
+    }
+
+    input_suffix, output_suffix, converter = modes[mode]
+
+    watch_convert(
+        folder,
+        input_suffix,
+        converter,
+        output_folder=out_folder,
+        output_suffix=output_suffix if out_folder else None,
+        recursive=recursive,
+        versioned=versioned,
+        debounce=debounce,
+        poll_interval=poll_interval,
+        polling=poll,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Conversion Cache
+# -----------------------------------------------------------------------------
+
+_CACHE_DIR_OPTION = typer.Option(None, "--cache-dir", help="Cache directory.")
+
+
+@cache_app.command("stats")
+def cli_cache_stats(
+    cache_dir: Path | None = _CACHE_DIR_OPTION,
     json_flag: bool = typer.Option(False, "--json", help="Output JSON."),
 ) -> None:
-    """Inspect DOCX metadata (requires optional extra `docx`)."""
-    meta = inspect_docx_metadata(path)
+    """Show cache location, entry count and size."""
+    from docutil.conversions.cache import ConversionCache
+
+    stats = ConversionCache(cache_dir).stats()
     if json_flag:
-        typer.echo(json.dumps(meta.__dict__, indent=2))
+        typer.echo(json.dumps(stats.__dict__, indent=2))
     else:
-        typer.echo(meta)
+        typer.echo(f"path: {stats.path}")
+        typer.echo(f"entries: {stats.entries}")
+        typer.echo(f"size: {stats.size_bytes} / {stats.max_size_bytes} bytes")
+
+
+@cache_app.command("prune")
+def cli_cache_prune(
+    cache_dir: Path | None = _CACHE_DIR_OPTION,
+    max_size: str | None = typer.Option(
+        None,
+        "--max-size",
+        callback=_check_size,
+        help="Target size, e.g. 500M (default: configured cache max size).",
+    ),
+) -> None:
+    """Evict least-recently-used entries until the cache fits its size limit."""
+    from docutil.conversions.cache import ConversionCache
+
+    cache = ConversionCache(cache_dir, max_size=max_size)
+    removed, freed = cache.prune()
+    typer.echo(f"Removed {removed} entries ({freed} bytes).")
+
+
+@cache_app.command("clear")
+def cli_cache_clear(cache_dir: Path | None = _CACHE_DIR_OPTION) -> None:
+    """Delete every cache entry."""
+    from docutil.conversions.cache import ConversionCache
+
+    removed = ConversionCache(cache_dir).clear()
+    typer.echo(f"Removed {removed} entries.")
+
+
+# docProps/app.xml fields; only emitted with --app so the JSON schema is unchanged.
+_DOCX_APP_FIELDS = ("application", "company", "pages", "words")
+
+
+def _docx_record(record: DocxMetadata | InspectFailure, include_app: bool) -> dict[str, object]:
+    data = asdict(record)
+    if not include_app:
+        for name in _DOCX_APP_FIELDS:
+            data.pop(name, None)
+    return data
+
+
+@inspect_app.command("docx")
+def cli_inspect_docx(
+    path: Path = typer.Argument(..., exists=True, help="DOCX file or folder to inspect."),
+    json_flag: bool = typer.Option(False, "--json", help="Output JSON."),
+    app_props: bool = typer.Option(
+        False, "--app", help="Also read docProps/app.xml (application, company, pages, words)."
+    ),
+    recursive: bool = typer.Option(False, "--recursive", help="Search folders recursively."),
+    exclude: list[str] | None = typer.Option(
+        None, "--exclude", help="Gitignore-style pattern to skip (repeatable)."
+    ),
+    workers: int = typer.Option(8, "--workers", min=1, help="Files read in parallel."),
+) -> None:
+    """
+    Inspect DOCX metadata.
+
+    A folder is scanned in parallel and printed as JSON Lines, one record per
+    file in sorted order; unreadable files produce {"path", "error"} records
+    and exit code 2.
+
+    Examples:
+      docutil inspect docx report.docx --json
+      docutil inspect docx ./deliverables --recursive --app > metadata.jsonl
+    """
+    from docutil.inspect.docx_metadata import (
+        InspectFailure,
+        inspect_docx_folder,
+        inspect_docx_metadata,
+    )
+
+    if not path.is_dir():
+        meta = inspect_docx_metadata(path, include_app=app_props)
+        if json_flag:
+            typer.echo(json.dumps(_docx_record(meta, app_props), indent=2))
+        else:
+            typer.echo(meta)
+        return
+
+    failed = 0
+    for record in inspect_docx_folder(
+        path,
+        recursive=recursive,
+        workers=workers,
+        include_app=app_props,
+        exclude=exclude or (),
+    ):
+        failed += isinstance(record, InspectFailure)
+        typer.echo(json.dumps(_docx_record(record, app_props), ensure_ascii=False))
+    if failed:
+        logger.error("Inspect | %s file(s) could not be read", failed)
+        raise typer.Exit(code=2)
+
+
+@inspect_app.command("pdf")
+def cli_inspect_pdf(
+    path: Path = typer.Argument(..., exists=True, dir_okay=False, help="PDF file to read."),
+    pages: str | None = typer.Option(
+        None, "--pages", help="1-based pages to extract, e.g. 1-3,7,10- (default: all)."
+    ),
+    workers: int = typer.Option(1, "--workers", min=1, help="Processes extracting pages."),
+    json_flag: bool = typer.Option(False, "--json", help="Output one JSON object."),
+    jsonl: bool = typer.Option(False, "--jsonl", help="Stream one JSON object per page."),
+) -> None:
+    """
+    Extract text from a PDF (requires optional extra `pdf`).
+
+    Plain and --jsonl output are streamed page by page.
+
+    Examples:
+      docutil inspect pdf report.pdf --pages 1-5
+      docutil inspect pdf filing.pdf --jsonl --workers 8 > pages.jsonl
+    """
+    from docutil.inspect.pdf_extract import extract_pdf_text, iter_pdf_pages, write_pdf_jsonl
+
+    if path.suffix.lower() != ".pdf":
+        raise typer.BadParameter("must be a .pdf document.", param_hint="PATH")
+
+    try:
+        if jsonl:
+            write_pdf_jsonl(path, sys.stdout, pages=pages, workers=workers)
+        elif json_flag:
+            result = extract_pdf_text(path, pages=pages, workers=workers)
+            typer.echo(json.dumps(asdict(result), indent=2, ensure_ascii=False))
+        else:
+            for page in iter_pdf_pages(path, pages=pages, workers=workers):
+                typer.echo(page.text)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--pages") from exc
+
+
+_INDEX_DB_OPTION = typer.Option(
+    None, "--db", help="Index database (default: index.sqlite in the cache directory)."
+)
+
+
+@index_app.command("build")
+def cli_index_build(
+    folder: Path = typer.Argument(..., exists=True, file_okay=False, help="Folder to index."),
+    recursive: bool = typer.Option(False, "--recursive", help="Search folders recursively."),
+    exclude: list[str] | None = typer.Option(
+        None, "--exclude", help="Gitignore-style pattern to skip (repeatable)."
+    ),
+    workers: int = typer.Option(8, "--workers", min=1, help="Files read in parallel."),
+    db: Path | None = _INDEX_DB_OPTION,
+) -> None:
+    """Register FOLDER and (re)index every DOCX in it."""
+    from docutil.inspect.index import MetadataIndex
+
+    with MetadataIndex(db) as index:
+        stats = index.build(folder, recursive=recursive, exclude=exclude or (), workers=workers)
+    typer.echo(f"Indexed {folder}: {stats}")
+
+
+@index_app.command("update")
+def cli_index_update(
+    folder: Path | None = typer.Argument(
+        None, help="Indexed folder to refresh (default: all of them)."
+    ),
+    workers: int = typer.Option(8, "--workers", min=1, help="Files read in parallel."),
+    db: Path | None = _INDEX_DB_OPTION,
+) -> None:
+    """Re-inspect only the files that changed since the last build/update."""
+    from docutil.inspect.index import MetadataIndex
+
+    with MetadataIndex(db) as index:
+        try:
+            stats = index.update(folder, workers=workers)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="FOLDER") from exc
+    typer.echo(f"Updated: {stats}")
+
+
+@index_app.command("query")
+def cli_index_query(
+    author: str | None = typer.Option(None, "--author", help="Author (case-insensitive, * ok)."),
+    title: str | None = typer.Option(None, "--title", help="Title (case-insensitive, * ok)."),
+    modified_after: str | None = typer.Option(
+        None, "--modified-after", help="ISO date/time, inclusive (naive = UTC)."
+    ),
+    modified_before: str | None = typer.Option(
+        None, "--modified-before", help="ISO date/time, exclusive (naive = UTC)."
+    ),
+    limit: int | None = typer.Option(None, "--limit", min=1, help="Maximum rows."),
+    db: Path | None = _INDEX_DB_OPTION,
+) -> None:
+    """
+    Print matching documents from the index as JSON Lines.
+
+    No document is opened: answers come from the index only.
+
+    Examples:
+      docutil index query --author "ada*"
+      docutil index query --modified-after 2024-01-01 --modified-before 2024-04-01
+    """
+    from docutil.inspect.index import MetadataIndex
+
+    with MetadataIndex(db) as index:
+        try:
+            for meta in index.query(
+                author=author,
+                title=title,
+                modified_after=modified_after,
+                modified_before=modified_before,
+                limit=limit,
+            ):
+                typer.echo(json.dumps(asdict(meta), ensure_ascii=False))
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+
+
+_SEARCH_DB_OPTION = typer.Option(
+    None, "--db", help="Search index database (default: search.sqlite in the cache directory)."
+)
+
+
+@search_app.command("build")
+def cli_search_build(
+    folder: Path = typer.Argument(..., exists=True, file_okay=False, help="Folder to index."),
+    recursive: bool = typer.Option(False, "--recursive", help="Search folders recursively."),
+    exclude: list[str] | None = typer.Option(
+        None, "--exclude", help="Gitignore-style pattern to skip (repeatable)."
+    ),
+    workers: int = typer.Option(8, "--workers", min=1, help="Files read in parallel."),
+    db: Path | None = _SEARCH_DB_OPTION,
+) -> None:
+    """Register FOLDER and (re)index every .md and .pdf file in it."""
+    from docutil.search import SearchIndex
+
+    with SearchIndex(db) as index:
+        stats = index.build(folder, recursive=recursive, exclude=exclude or (), workers=workers)
+    typer.echo(f"Indexed {folder}: {stats}")
+
+
+@search_app.command("update")
+def cli_search_update(
+    folder: Path | None = typer.Argument(
+        None, help="Indexed folder to refresh (default: all of them)."
+    ),
+    workers: int = typer.Option(8, "--workers", min=1, help="Files read in parallel."),
+    db: Path | None = _SEARCH_DB_OPTION,
+) -> None:
+    """Re-index only the documents that changed since the last build/update."""
+    from docutil.search import SearchIndex
+
+    with SearchIndex(db) as index:
+        try:
+            stats = index.update(folder, workers=workers)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="FOLDER") from exc
+    typer.echo(f"Updated: {stats}")
+
+
+@search_app.command("query")
+def cli_search_query(
+    query: str = typer.Argument(..., help='Terms and "quoted phrases"; all must match.'),
+    limit: int | None = typer.Option(None, "--limit", min=1, help="Maximum results."),
+    json_flag: bool = typer.Option(False, "--json", help="Output JSON Lines."),
+    db: Path | None = _SEARCH_DB_OPTION,
+) -> None:
+    """
+    Print path:line for every match of QUERY.
+
+    Exits with code 1 when nothing matches (like grep).
+
+    Examples:
+      docutil search query retention
+      docutil search query '"data retention" policy' --limit 20
+    """
+    from docutil.search import SearchIndex
+
+    with SearchIndex(db) as index:
+        hits = index.search(query, limit=limit)
+    for hit in hits:
+        typer.echo(json.dumps(asdict(hit)) if json_flag else f"{hit.path}:{hit.line}")
+    if not hits:
+        raise typer.Exit(code=1)
+
+
+@app.command("bench")
+def cli_bench(
+    mode: Literal["docx2md", "md2docx"] = typer.Argument("md2docx", help="Conversion mode."),
+    files: int = typer.Option(500, "--files", min=1, help="Documents in the synthetic corpus."),
+    size_dist: Literal["fixed", "uniform", "lognormal"] = typer.Option(
+        "lognormal", "--size-dist", help="Distribution of document sizes."
+    ),
+    mean_kb: float = typer.Option(8.0, "--mean-kb", min=0.1, help="Mean document size in KiB."),
+    seed: int = typer.Option(0, "--seed", help="Corpus random seed."),
+    workers: list[int] = typer.Option(
+        [1, 2, 4, 8], "--workers", min=1, help="Worker count to measure (repeatable)."
+    ),
+    repeat: int = typer.Option(3, "--repeat", min=1, help="Runs per worker count (median)."),
+    pandoc_delay: float = typer.Option(
+        0.0, "--pandoc-delay", min=0.0, help="Seconds the stub pandoc spends per file."
+    ),
+    real_pandoc: bool = typer.Option(
+        False, "--real-pandoc", help="Use the installed pandoc instead of the stub."
+    ),
+    corpus_dir: Path | None = typer.Option(
+        None, "--corpus-dir", help="Keep (and reuse) the generated corpus here."
+    ),
+    output: Path | None = typer.Option(None, "--output", "-o", help="Write results as JSON."),
+    baseline: Path | None = typer.Option(
+        None, "--baseline", exists=True, dir_okay=False, help="Compare with earlier results."
+    ),
+    json_flag: bool = typer.Option(False, "--json", help="Print results as JSON."),
+) -> None:
+    """
+    Measure batch throughput on a synthetic corpus.
+
+    By default pandoc is replaced by a stub that copies input to output, so
+    the numbers isolate docutil's own overhead; --pandoc-delay simulates
+    conversion cost and --real-pandoc measures end to end.
+
+    Examples:
+      docutil bench md2docx --files 2000 --output bench.json
+      docutil bench docx2md --workers 1 --workers 8 --pandoc-delay 0.05
+      docutil bench md2docx --files 2000 --baseline bench.json
+    """
+    from docutil.bench import CorpusSpec, compare_results, format_results, run_benchmark
+
+    spec = CorpusSpec(mode=mode, files=files, size_dist=size_dist, mean_kb=mean_kb, seed=seed)
+    try:
+        result = run_benchmark(
+            spec,
+            workers=workers,
+            repeat=repeat,
+            pandoc_delay=pandoc_delay,
+            real_pandoc=real_pandoc,
+            corpus_dir=corpus_dir,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    if output is not None:
+        result.write_json(output)
+    typer.echo(json.dumps(result.to_dict(), indent=2) if json_flag else format_results(result))
+
+    if baseline is not None:
+        previous = json.loads(baseline.read_text(encoding="utf-8"))
+        typer.echo(compare_results(previous, result.to_dict()), err=json_flag)
 
 
 @app.command("scaffold")
@@ -291,6 +1060,8 @@ def cli_scaffold(
     Example:
       docutil scaffold project MyProject ./output
     """
+    from docutil.templates import scaffold_project
+
     if kind != "project":
         raise typer.BadParameter("Only 'project' supported.")
 
@@ -307,6 +1078,7 @@ def cli_bump_version(
     """
     Bump semantic version in pyproject.toml.
     """
+    from docutil.utils.version_bump import bump_version
 
     new_version = bump_version(Path("pyproject.toml"), part)
     typer.echo(f"Version bumped to {new_version}")
@@ -13,12 +13,51 @@ All converters:
 
 from __future__ import annotations
 
-from .batch import batch_convert
-from .docx_to_markdown import docx_to_markdown
-from .markdown_to_docx import markdown_to_docx
+import importlib
+from typing import Any
+
+# These submodules share their name with the function they export, so the
+# function must be bound eagerly or ``docutil.conversions.pdf_to_text`` would
+# resolve to the module after its first import. They are cheap: pandoc and the
+# fast paths are imported on first use.
+from .docx_to_markdown import docx_to_markdown, docx_to_markdown_bytes
+from .markdown_to_docx import markdown_to_docx, markdown_to_docx_bytes
+from .pdf_to_text import pdf_to_text
+
+# Everything else loads on first attribute access (PEP 562), so importing one
+# converter does not pull in asyncio, tqdm or the pandoc server client.
+_LAZY = {
+    "batch_convert": ".batch",
+    "docx_to_markdown_async": ".aio",
+    "markdown_to_docx_async": ".aio",
+    "batch_convert_async": ".aio",
+    "ConversionCache": ".cache",
+    "PandocServerPool": ".pandoc_server",
+    "BatchReport": ".report",
+    "FileResult": ".report",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "docx_to_markdown",
     "markdown_to_docx",
+    "docx_to_markdown_bytes",
+    "markdown_to_docx_bytes",
+    "pdf_to_text",
     "batch_convert",
+    "docx_to_markdown_async",
+    "markdown_to_docx_async",
+    "batch_convert_async",
+    "ConversionCache",
+    "PandocServerPool",
+    "BatchReport",
+    "FileResult",
 ]
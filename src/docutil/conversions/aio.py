@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+"""Asyncio Conversion API
+
+Non-blocking counterparts of the converters and of :func:`batch_convert`,
+for services that already run an event loop.
+
+Design
+------
+- pandoc runs via ``asyncio.create_subprocess_exec``
+  (:func:`~docutil.conversions.engine.run_pandoc_async`), so no thread is
+  tied up per conversion.
+- ``batch_convert_async`` bounds concurrency with a semaphore and creates
+  tasks as discovery streams, so at most ``concurrency`` conversions (and
+  tasks) exist at any time.
+- Blocking work (the pandoc probe, input checks, the discovery walk and
+  output path planning) runs in worker threads via ``asyncio.to_thread``.
+- Cancelling the batch (or a single converter call) cancels every
+  in-flight task and kills its pandoc process.
+
+Input validation and pandoc arguments are shared with the synchronous
+converters, so outputs are identical to ``docx_to_markdown`` /
+``markdown_to_docx``.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+
+from docutil.conversions.batch import _size, build_output_path, iter_files
+from docutil.conversions.cache import ConversionCache
+from docutil.conversions.docx_to_markdown import PANDOC_ARGS as DOCX_MD_ARGS
+from docutil.conversions.docx_to_markdown import PANDOC_FROM as DOCX_MD_FROM
+from docutil.conversions.docx_to_markdown import PANDOC_TO as DOCX_MD_TO
+from docutil.conversions.docx_to_markdown import prepare_conversion as prepare_docx_to_markdown
+from docutil.conversions.engine import conversion_cache, run_pandoc_async
+from docutil.conversions.markdown_to_docx import PANDOC_ARGS as MD_DOCX_ARGS
+from docutil.conversions.markdown_to_docx import PANDOC_FROM as MD_DOCX_FROM
+from docutil.conversions.markdown_to_docx import PANDOC_TO as MD_DOCX_TO
+from docutil.conversions.markdown_to_docx import prepare_conversion as prepare_markdown_to_docx
+from docutil.conversions.report import BatchReport, FileResult, FileStatus
+
+logger = logging.getLogger(__name__)
+
+AsyncConverter = Callable[[Path, Path | None], Awaitable[Path]]
+
+
+async def docx_to_markdown_async(
+    input_path: Path | str, output_path: Path | str | None = None
+) -> Path:
+    """Async :func:`~docutil.conversions.docx_to_markdown`."""
+    src, out = await asyncio.to_thread(prepare_docx_to_markdown, input_path, output_path)
+    await run_pandoc_async(
+        src,
+        out,
+        to=DOCX_MD_TO,
+        format=DOCX_MD_FROM,
+        extra_args=list(DOCX_MD_ARGS),
+    )
+    return out
+
+
+async def markdown_to_docx_async(
+    input_path: Path | str, output_path: Path | str | None = None
+) -> Path:
+    """Async :func:`~docutil.conversions.markdown_to_docx`."""
+    src, out = await asyncio.to_thread(prepare_markdown_to_docx, input_path, output_path)
+    await run_pandoc_async(
+        src,
+        out,
+        to=MD_DOCX_TO,
+        format=MD_DOCX_FROM,
+        extra_args=list(MD_DOCX_ARGS),
+    )
+    return out
+
+
+async def batch_convert_async(
+    input_folder: Path | str,
+    input_suffix: str,
+    converter: AsyncConverter,
+    *,
+    output_folder: Path | str | None = None,
+    output_suffix: str | None = None,
+    recursive: bool = False,
+    exclude: Iterable[str] = (),
+    use_gitignore: bool = False,
+    dry_run: bool = False,
+    force: bool = False,
+    versioned: bool = False,
+    concurrency: int = 8,
+    cache: ConversionCache | None = None,
+    keep_going: bool = False,
+    report: BatchReport | None = None,
+) -> list[Path]:
+    """Batch convert files on the running event loop.
+
+    Parameters have the same meaning as for :func:`batch_convert`;
+    *converter* is an async callable such as :func:`docx_to_markdown_async`.
+
+    Parameters
+    ----------
+    concurrency
+        Maximum number of conversions in flight.
+
+    Incremental mode, resume journals, the server engine and autoscaling are
+    only available in the synchronous :func:`batch_convert`.
+
+    Returns
+    -------
+    list[Path]
+        Output paths (or sources, for dry runs) of every file that did not fail,
+        in completion order.
+    """
+    input_folder = Path(input_folder).resolve()
+
+    if not input_folder.exists():
+        raise FileNotFoundError(input_folder)
+
+    if output_folder and not output_suffix:
+        raise ValueError("output_suffix is required when output_folder is provided.")
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1.")
+
+    out_root = Path(output_folder).resolve() if output_folder else None
+    report = report if report is not None else BatchReport()
+    results: list[Path] = []
+
+    logger.info(
+        "Async batch start | folder=%s | recursive=%s | dry_run=%s | concurrency=%s",
+        input_folder,
+        recursive,
+        dry_run,
+        concurrency,
+    )
+
+    def plan(src: Path) -> tuple[Path | None, bool]:
+        out = build_output_path(src, input_folder, out_root, output_suffix, versioned=versioned)
+        return out, out is not None and out.exists()
+
+    async def task(src: Path) -> tuple[FileStatus, Path]:
+        # Path planning stats the disk and may create folders.
+        out, exists = await asyncio.to_thread(plan, src)
+
+        if out and exists and not (force or versioned):
+            logger.debug("Skipping existing: %s", out)
+            return "skipped", out
+
+        if dry_run:
+            logger.info("DRY RUN: %s", src)
+            return "dry_run", src
+
+        return "converted", await converter(src, out)
+
+    async def process(src: Path) -> None:
+        started = time.perf_counter()
+        try:
+            status, out = await task(src)
+        except Exception as exc:
+            failure = FileResult(
+                source=str(src),
+                status="failed",
+                duration=time.perf_counter() - started,
+                input_bytes=_size(src),
+                error=f"{type(exc).__name__}: {exc}",
+                stderr=getattr(exc, "stderr", None),
+            )
+            report.add(failure)
+            if not keep_going:
+                raise
+            logger.error("Conversion failed | %s | %s", src, failure.error)
+            return
+
+        report.add(
+            FileResult(
+                source=str(src),
+                status=status,
+                output=str(out),
+                duration=time.perf_counter() - started,
+                input_bytes=_size(src),
+                output_bytes=_size(out) if status == "converted" else 0,
+            )
+        )
+        results.append(out)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks: set[asyncio.Task[None]] = set()
+    error: BaseException | None = None
+
+    def done(t: asyncio.Task[None]) -> None:
+        nonlocal error
+        tasks.discard(t)
+        semaphore.release()
+        if not t.cancelled() and t.exception() is not None and error is None:
+            error = t.exception()
+
+    with conversion_cache(None if dry_run else cache):
+        try:
+            # The scandir walk blocks, so each step runs in a worker thread.
+            discovered = iter_files(
+                input_folder, input_suffix, recursive, exclude=exclude, use_gitignore=use_gitignore
+            )
+            while (src := await asyncio.to_thread(next, discovered, None)) is not None:
+                # Acquire before creating the task so only `concurrency` exist.
+                await semaphore.acquire()
+                if error is not None:
+                    semaphore.release()
+                    break
+                t = asyncio.create_task(process(src))
+                tasks.add(t)
+                t.add_done_callback(done)
+
+            while tasks and error is None:
+                await asyncio.wait(set(tasks), return_when=asyncio.FIRST_EXCEPTION)
+        except BaseException:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            report.finish()
+
+        if error is not None:
+            # Fail fast: cancel the rest and surface the first failure.
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise error
+
+    summary = report.summary()
+    logger.info(
+        "Async batch complete | outputs=%s | converted=%s | skipped=%s | failed=%s | %.2f files/s",
+        len(results),
+        summary["converted"],
+        summary["skipped"],
+        summary["failed"],
+        summary["files_per_second"],
+    )
+    return results
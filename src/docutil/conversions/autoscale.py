@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+"""Adaptive Worker Autoscaling
+
+Hill-climbing concurrency controller used by ``batch_convert(workers="auto")``.
+
+Every ``window`` seconds the controller compares throughput (completed
+files per second) with the previous window:
+
+- throughput improved  → keep moving in the same direction
+- throughput dropped   → reverse direction
+- roughly unchanged    → hold
+
+Memory pressure overrides throughput: when the fraction of available
+system memory falls below ``min_mem_available``, concurrency shrinks
+regardless. The target always stays within ``[min_workers, max_workers]``
+and every window is logged so runners can be tuned from the history.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_MEMINFO = "/proc/meminfo"
+
+
+def available_memory_ratio() -> float | None:
+    """Return MemAvailable / MemTotal on Linux, or None if unknown."""
+    try:
+        with open(_MEMINFO, encoding="ascii") as fh:
+            fields = dict(line.split(":", 1) for line in fh if ":" in line)
+        total = int(fields["MemTotal"].split()[0])
+        available = int(fields["MemAvailable"].split()[0])
+    except (OSError, KeyError, ValueError):
+        return None
+    return available / total if total else None
+
+
+def default_max_workers() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class ScalingSample:
+    """One controller decision (logged and kept in ``Autoscaler.history``)."""
+
+    elapsed: float
+    workers: int
+    throughput: float
+    mem_available: float | None
+
+
+class Autoscaler:
+    """Thread-safe concurrency target that adapts to throughput and memory."""
+
+    def __init__(
+        self,
+        min_workers: int = 1,
+        max_workers: int | None = None,
+        *,
+        window: float = 2.0,
+        tolerance: float = 0.05,
+        min_mem_available: float = 0.10,
+    ) -> None:
+        max_workers = max_workers or default_max_workers()
+        if min_workers < 1 or max_workers < min_workers:
+            raise ValueError("Require 1 <= min_workers <= max_workers.")
+
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.window = window
+        self.tolerance = tolerance
+        self.min_mem_available = min_mem_available
+
+        # Start in the middle of the allowed range and probe upwards first.
+        self.target = max(min_workers, min(max_workers, (min_workers + max_workers) // 2))
+        self.history: list[ScalingSample] = []
+
+        self._direction = 1
+        self._last_throughput: float | None = None
+        self._completed = 0
+        self._started = time.monotonic()
+        self._window_start = self._started
+        self._lock = threading.Lock()
+
+    def record_completion(self) -> None:
+        with self._lock:
+            self._completed += 1
+
+    def update(self, now: float | None = None) -> int:
+        """Re-evaluate the target if a window has elapsed; return the target."""
+        now = time.monotonic() if now is None else now
+
+        with self._lock:
+            elapsed = now - self._window_start
+            if elapsed < self.window:
+                return self.target
+
+            throughput = self._completed / elapsed
+            self._completed = 0
+            self._window_start = now
+
+            mem = available_memory_ratio()
+            previous = self.target
+
+            if mem is not None and mem < self.min_mem_available:
+                self._direction = -1
+                self.target -= 1
+            elif throughput == 0:
+                # No file finished this window (e.g. one huge document): no signal.
+                pass
+            elif self._last_throughput is None:
+                self.target += self._direction
+            else:
+                change = (throughput - self._last_throughput) / self._last_throughput
+                if change < -self.tolerance:
+                    self._direction = -self._direction
+                    self.target += self._direction
+                elif change > self.tolerance:
+                    self.target += self._direction
+
+            self.target = min(self.max_workers, max(self.min_workers, self.target))
+            if throughput > 0:
+                self._last_throughput = throughput
+
+            sample = ScalingSample(
+                elapsed=now - self._started,
+                workers=self.target,
+                throughput=throughput,
+                mem_available=mem,
+            )
+            self.history.append(sample)
+
+        logger.info(
+            "Autoscale | t=%.1fs | workers=%s→%s | throughput=%.2f files/s | mem_available=%s",
+            sample.elapsed,
+            previous,
+            sample.workers,
+            throughput,
+            f"{mem:.0%}" if mem is not None else "n/a",
+        )
+        return sample.workers
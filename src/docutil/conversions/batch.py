@@ -9,29 +9,212 @@ Features
 - dry-run support
 - force overwrite control
 - progress bars (TTY aware)
-- parallel workers
+- parallel workers (fixed count or adaptive ``workers="auto"``)
+- streaming discovery with bounded in-flight work (constant memory per batch)
+- exclude globs and ``.gitignore``-aware pruning
+- fault tolerance: keep-going mode, transient-error retries, JSON batch report
 - out-folder structure preservation
 - deterministic behavior
 - optional date+version suffixing (per output file)
+- selectable pandoc engine (per-file subprocess or warm server pool)
+- optional content-addressed conversion cache (hit rate reported per batch)
+- incremental mode driven by a persistent manifest in the output root
+- crash-safe checkpoint journal and ``resume`` for interrupted runs
 """
 
+import errno
 import logging
+import os
 import sys
-from collections.abc import Callable, Iterable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Literal, TypeVar
 
 from tqdm import tqdm
 
+from docutil.conversions.autoscale import Autoscaler
+from docutil.conversions.cache import ConversionCache
+from docutil.conversions.engine import Engine, conversion_cache, pandoc_engine
+from docutil.conversions.journal import BatchJournal
+from docutil.conversions.manifest import BatchManifest
+from docutil.conversions.metrics import MetricsFormat, render_metrics, write_metrics
+from docutil.conversions.report import BatchReport, FileResult, FileStatus
+from docutil.errors import PandocServerError
+from docutil.logging_utils import sampled_logging
+from docutil.profiling import profiled_iter, span
+from docutil.utils.ignore import GITIGNORE_NAME, IgnoreRules
 from docutil.utils.versioning import generate_versioned_path
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
 
-def iter_files(folder: Path, suffix: str, recursive: bool) -> Iterable[Path]:
-    """Yield files in *folder* matching *suffix*."""
-    pattern = f"**/*{suffix}" if recursive else f"*{suffix}"
-    yield from folder.glob(pattern)
+_TRANSIENT_ERRNOS = frozenset(
+    {errno.EAGAIN, errno.EBUSY, errno.EMFILE, errno.ENFILE, errno.ENOMEM, errno.ETXTBSY}
+)
+
+
+def _is_ignored(
+    rel: str,
+    is_dir: bool,
+    excludes: IgnoreRules,
+    layers: tuple[tuple[str, IgnoreRules], ...],
+) -> bool:
+    if excludes.match(rel, is_dir=is_dir):
+        return True
+
+    # Deeper .gitignore files override shallower ones.
+    ignored: bool | None = None
+    for base, rules in layers:
+        verdict = rules.match(rel[len(base) + 1 :] if base else rel, is_dir=is_dir)
+        if verdict is not None:
+            ignored = verdict
+    return bool(ignored)
+
+
+def iter_files(
+    folder: Path,
+    suffix: str | tuple[str, ...],
+    recursive: bool,
+    *,
+    exclude: Iterable[str] = (),
+    use_gitignore: bool = False,
+) -> Iterator[Path]:
+    """Stream files in *folder* matching *suffix* (or any of several suffixes).
+
+    Walks with ``os.scandir`` (entries sorted per directory for deterministic
+    order) and yields matches as soon as they are found. Excluded directories
+    are pruned, i.e. never descended into.
+
+    Parameters
+    ----------
+    exclude
+        ``.gitignore``-style patterns relative to *folder* (e.g. ``node_modules``,
+        ``build/``, ``drafts/**/*.md``).
+    use_gitignore
+        Also honour ``.gitignore`` files found while walking (and skip ``.git``).
+
+    Symlinked directories are not followed.
+    """
+    excludes = IgnoreRules(exclude)
+    stack: list[tuple[Path, str, tuple[tuple[str, IgnoreRules], ...]]] = [(folder, "", ())]
+
+    while stack:
+        directory, rel_dir, layers = stack.pop()
+
+        if use_gitignore:
+            rules = IgnoreRules.from_file(directory / GITIGNORE_NAME)
+            if rules:
+                layers = (*layers, (rel_dir, rules))
+
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as exc:
+            logger.warning("Cannot scan %s: %s", directory, exc)
+            continue
+
+        subdirs: list[tuple[Path, str, tuple[tuple[str, IgnoreRules], ...]]] = []
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if (
+                        recursive
+                        and not (use_gitignore and entry.name == ".git")
+                        and not _is_ignored(rel, True, excludes, layers)
+                    ):
+                        subdirs.append((Path(entry.path), rel, layers))
+                elif (
+                    entry.name.endswith(suffix)
+                    and entry.is_file()
+                    and not _is_ignored(rel, False, excludes, layers)
+                ):
+                    yield Path(entry.path)
+            except OSError:
+                continue
+
+        stack.extend(reversed(subdirs))
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return True for failures worth retrying (resource exhaustion, timeouts, I/O hiccups).
+
+    Deterministic failures such as invalid input or pandoc rejecting a
+    document are not retried.
+    """
+    if isinstance(exc, (TimeoutError, ConnectionError, PandocServerError, InterruptedError)):
+        return True
+    if isinstance(exc, OSError):
+        return exc.errno in _TRANSIENT_ERRNOS
+    return False
+
+
+def _iter_bounded(
+    ex: ThreadPoolExecutor,
+    fn: Callable[[Path], _T],
+    items: Iterable[Path],
+    limit: Callable[[], int],
+) -> Iterator[Future[_T]]:
+    """Submit *items* to *ex* keeping at most ``limit()`` in flight.
+
+    Futures are yielded as they complete. ``limit`` is re-read before every
+    submission, so the concurrency can change while the batch runs.
+    """
+    it = iter(items)
+    pending: set[Future[_T]] = set()
+    exhausted = False
+
+    while True:
+        while not exhausted and len(pending) < limit():
+            item = next(it, None)
+            if item is None:
+                exhausted = True
+                break
+            pending.add(ex.submit(fn, item))
+
+        if not pending:
+            return
+
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        yield from done
+
+
+def build_output_path(
+    src: Path,
+    input_folder: Path,
+    out_root: Path | None,
+    output_suffix: str | None,
+    *,
+    versioned: bool = False,
+) -> Path | None:
+    """Mirror *src* from *input_folder* into *out_root* (creating parent folders).
+
+    Returns None when *out_root* is None, i.e. the converter picks its default
+    output location next to the source.
+    """
+    if out_root is None:
+        return None
+
+    rel = src.relative_to(input_folder)
+    out = (out_root / rel).with_suffix(output_suffix or "")
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    if versioned:
+        with span("plan.versioned"):
+            out = generate_versioned_path(out)
+
+    return out
 
 
 def batch_convert(
@@ -42,11 +225,29 @@ def batch_convert(
     output_folder: Path | str | None = None,
     output_suffix: str | None = None,
     recursive: bool = False,
+    exclude: Iterable[str] = (),
+    use_gitignore: bool = False,
     dry_run: bool = False,
     force: bool = False,
     versioned: bool = False,
     progress: bool = True,
-    workers: int = 1,
+    workers: int | Literal["auto"] = 1,
+    min_workers: int = 1,
+    max_workers: int | None = None,
+    engine: Engine = "subprocess",
+    cache: ConversionCache | None = None,
+    incremental: bool = False,
+    delete_orphans: bool = False,
+    keep_going: bool = False,
+    retries: int = 0,
+    retry_backoff: float = 0.5,
+    report: BatchReport | None = None,
+    report_path: Path | str | None = None,
+    resume: bool = False,
+    metrics_path: Path | str | None = None,
+    metrics_labels: Mapping[str, str] | None = None,
+    metrics_format: MetricsFormat = "openmetrics",
+    log_every: int | None = None,
 ) -> list[Path]:
     """Batch convert files.
 
@@ -65,6 +266,11 @@ def batch_convert(
         *output_folder* so outputs get correct file extensions.
     recursive
         Whether to search subfolders.
+    exclude
+        ``.gitignore``-style patterns (relative to *input_folder*) for files and
+        folders to skip; excluded folders are never descended into.
+    use_gitignore
+        Honour ``.gitignore`` files found under *input_folder* (and skip ``.git``).
     dry_run
         Only log planned conversions; do not write files.
     force
@@ -75,7 +281,62 @@ def batch_convert(
     progress
         Show tqdm progress if stdout is a TTY and not dry-run.
     workers
-        Parallel worker count.
+        Parallel worker count, or ``"auto"`` to adapt concurrency to measured
+        throughput and memory pressure (see :class:`Autoscaler`).
+    min_workers, max_workers
+        Concurrency bounds for ``workers="auto"`` (*max_workers* defaults to the
+        CPU count).
+    engine
+        Pandoc engine used by the built-in converters: ``"subprocess"`` (default)
+        or ``"server"`` (one warm ``pandoc server`` per worker, falling back to
+        subprocess if the server cannot start).
+    cache
+        Optional :class:`ConversionCache`. Identical inputs converted with the same
+        pandoc version and arguments are copied from the cache instead of reconverted.
+    incremental
+        Only convert sources that are new or changed since the last incremental run,
+        as recorded in ``.docutil-manifest.json`` in the output root (*output_folder*,
+        or *input_folder* when outputs sit next to their sources). Changed sources
+        overwrite the output they produced last time; outputs for sources the manifest
+        has never seen still follow the *force* rule.
+    delete_orphans
+        With *incremental*, delete recorded outputs whose sources no longer exist.
+    keep_going
+        Record per-file failures (exception + pandoc stderr) in the report and continue
+        instead of aborting on the first failure. Failed files are left out of the
+        returned list.
+    retries
+        Retry transient failures (see :func:`is_transient_error`) up to this many times,
+        with exponential backoff starting at *retry_backoff* seconds.
+    report
+        Optional :class:`BatchReport` to populate with per-file status, duration and
+        byte counts (also filled when the batch aborts).
+    report_path
+        If provided, the report is written there as JSON at the end of the run.
+    resume
+        Skip sources recorded in the checkpoint journal (``.docutil-journal.jsonl`` in
+        the output root) by a previous, interrupted run, provided the source is
+        unchanged and its output still exists. Every non-dry run appends completed
+        files to the journal; it is deleted once a batch finishes without failures.
+    metrics_path
+        If provided, file counts, byte totals, cache hits and a per-file latency
+        histogram are written there atomically at the end of the run (also when it
+        aborts), for node_exporter's textfile collector. See
+        :mod:`docutil.conversions.metrics`.
+    metrics_labels
+        Constant labels for every metric sample (e.g. ``{"job": "nightly"}``).
+    metrics_format
+        ``"openmetrics"`` or ``"prometheus"`` (text format 0.0.4).
+    log_every
+        Sample per-file INFO lines while the batch runs: only one in *log_every*
+        records of each message is logged (``0``: only the first), followed by a
+        summary of what was suppressed. Warnings and errors are never dropped.
+        See :func:`docutil.logging_utils.sampled_logging`.
+
+    Returns
+    -------
+    list[Path]
+        Output paths (or sources, for dry runs) of every file that did not fail.
     """
 
     input_folder = Path(input_folder).resolve()
@@ -86,67 +347,244 @@ def batch_convert(
     if output_folder and not output_suffix:
         raise ValueError("output_suffix is required when output_folder is provided.")
 
-    files = list(iter_files(input_folder, input_suffix, recursive))
+    if workers != "auto" and workers < 1:
+        raise ValueError("workers must be >= 1 or 'auto'.")
+
+    if retries < 0:
+        raise ValueError("retries must be >= 0.")
+
+    if delete_orphans and not incremental:
+        raise ValueError("delete_orphans requires incremental=True.")
+
+    # Discovery is streamed: conversion starts with the first match and memory
+    # does not grow with the size of the tree.
+    files = profiled_iter(
+        "discover",
+        iter_files(
+            input_folder,
+            input_suffix,
+            recursive,
+            exclude=exclude,
+            use_gitignore=use_gitignore,
+        ),
+    )
 
     logger.info(
         (
-            "Batch start | folder=%s | files=%s | "
+            "Batch start | folder=%s | "
             "recursive=%s | dry_run=%s | "
-            "workers=%s | versioned=%s"
+            "workers=%s | versioned=%s | engine=%s"
         ),
         input_folder,
-        len(files),
         recursive,
         dry_run,
         workers,
         versioned,
+        engine,
     )
 
-    if not files:
-        return []
-
     out_root = Path(output_folder).resolve() if output_folder else None
-    use_progress = progress and sys.stdout.isatty() and not dry_run
+    manifest = BatchManifest.load(out_root or input_folder, input_folder) if incremental else None
 
-    results: list[Path] = []
+    if manifest is not None and delete_orphans:
+        manifest.delete_orphans(dry_run=dry_run)
+        if not dry_run:
+            manifest.save()
 
-    def build_output_path(src: Path) -> Path | None:
-        if out_root is None:
-            return None
+    journal = (
+        None if dry_run else BatchJournal(out_root or input_folder, input_folder, resume=resume)
+    )
+    if journal is not None and journal.completed:
+        logger.info("Resuming | journaled=%s | journal=%s", len(journal.completed), journal.path)
 
-        rel = src.relative_to(input_folder)
-        out = (out_root / rel).with_suffix(output_suffix or "")
+    use_progress = progress and sys.stdout.isatty() and not dry_run
 
-        out.parent.mkdir(parents=True, exist_ok=True)
+    report = report if report is not None else BatchReport()
 
-        if versioned:
-            out = generate_versioned_path(out)
+    def task(src: Path) -> tuple[FileStatus, Path]:
+        digest: str | None = None
+        overwrite = force or versioned
 
-        return out
+        if journal is not None and (done := journal.is_done(src)) is not None:
+            logger.debug("Already converted: %s", src)
+            return "resumed", done
 
-    def task(src: Path) -> Path:
-        out = build_output_path(src)
+        if manifest is not None:
+            entry, digest = manifest.lookup(src)
+            if entry is not None:
+                logger.debug("Unchanged: %s", src)
+                return "unchanged", manifest.output_path(entry)
+            overwrite = overwrite or manifest.tracks(src)
 
-        if out and out.exists() and not (force or versioned):
+        with span("plan"):
+            out = build_output_path(src, input_folder, out_root, output_suffix, versioned=versioned)
+
+        if out and out.exists() and not overwrite:
             logger.debug("Skipping existing: %s", out)
-            return out
+            return "skipped", out
 
         if dry_run:
             logger.info("DRY RUN: %s", src)
-            return src
-
-        return converter(src, out)
-
-    if workers <= 1:
-        iterable = tqdm(files, disable=not use_progress)
-        for f in iterable:
-            results.append(task(f))
-    else:
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futures = [ex.submit(task, f) for f in files]
-            iterable = tqdm(as_completed(futures), total=len(futures), disable=not use_progress)
-            for fut in iterable:
-                results.append(fut.result())
-
-    logger.info("Batch complete | outputs=%s", len(results))
+            return "dry_run", src
+
+        with span("convert"):
+            result = converter(src, out)
+
+        with span("record"):
+            if manifest is not None:
+                manifest.record(src, result, digest)
+            if journal is not None:
+                journal.record(src, result)
+
+        return "converted", result
+
+    def process(src: Path) -> FileResult:
+        started = time.perf_counter()
+        attempts = 0
+
+        while True:
+            attempts += 1
+            try:
+                status, out = task(src)
+                break
+            except Exception as exc:
+                if attempts <= retries and is_transient_error(exc):
+                    delay = retry_backoff * 2 ** (attempts - 1)
+                    logger.warning(
+                        "Transient failure | %s | attempt=%s | retry_in=%.2fs | %s",
+                        src,
+                        attempts,
+                        delay,
+                        exc,
+                    )
+                    time.sleep(delay)
+                    continue
+
+                failure = FileResult(
+                    source=str(src),
+                    status="failed",
+                    duration=time.perf_counter() - started,
+                    input_bytes=_size(src),
+                    attempts=attempts,
+                    error=f"{type(exc).__name__}: {exc}",
+                    stderr=getattr(exc, "stderr", None),
+                )
+                report.add(failure)
+                if not keep_going:
+                    raise
+                logger.error("Conversion failed | %s | %s", src, failure.error)
+                return failure
+
+        result = FileResult(
+            source=str(src),
+            status=status,
+            output=str(out),
+            duration=time.perf_counter() - started,
+            input_bytes=_size(src),
+            output_bytes=_size(out) if status == "converted" else 0,
+            attempts=attempts,
+        )
+        report.add(result)
+        return result
+
+    results: list[Path] = []
+
+    def collect(result: FileResult) -> None:
+        if result.status != "failed" and result.output is not None:
+            results.append(Path(result.output))
+
+    hits_before = cache.hits if cache else 0
+    misses_before = cache.misses if cache else 0
+
+    scaler = Autoscaler(min_workers, max_workers) if workers == "auto" else None
+    pool_size = scaler.max_workers if scaler else int(workers)
+
+    completed = False
+    with (
+        pandoc_engine("subprocess" if dry_run else engine, workers=pool_size),
+        conversion_cache(None if dry_run else cache),
+        sampled_logging(log_every),
+    ):
+        try:
+            if scaler is not None:
+                with ThreadPoolExecutor(max_workers=scaler.max_workers) as ex:
+                    futures = tqdm(
+                        _iter_bounded(ex, process, files, scaler.update),
+                        disable=not use_progress,
+                    )
+                    for fut in futures:
+                        scaler.record_completion()
+                        collect(fut.result())
+            elif pool_size <= 1:
+                for f in tqdm(files, disable=not use_progress):
+                    collect(process(f))
+            else:
+                with ThreadPoolExecutor(max_workers=pool_size) as ex:
+                    # Keep a small backlog so workers never idle while discovery
+                    # runs, without holding one future per file.
+                    futures = tqdm(
+                        _iter_bounded(ex, process, files, lambda: 2 * pool_size),
+                        disable=not use_progress,
+                    )
+                    for fut in futures:
+                        collect(fut.result())
+            completed = True
+        finally:
+            # Persist whatever was converted, even if the batch aborts midway.
+            if manifest is not None and not dry_run:
+                manifest.save()
+            if journal is not None:
+                # Keep the journal whenever there is work left for a resume.
+                journal.close(delete=completed and report.failed == 0)
+            report.finish()
+            if report_path is not None:
+                report.write_json(report_path)
+            if metrics_path is not None:
+                write_metrics(
+                    metrics_path,
+                    render_metrics(
+                        report,
+                        cache_hits=cache.hits - hits_before if cache else None,
+                        cache_misses=cache.misses - misses_before if cache else None,
+                        labels=metrics_labels,
+                        fmt=metrics_format,
+                    ),
+                )
+
+    summary = report.summary()
+    logger.info(
+        "Batch complete | outputs=%s | converted=%s | skipped=%s | failed=%s | %.2f files/s",
+        len(results),
+        summary["converted"],
+        summary["skipped"],
+        summary["failed"],
+        summary["files_per_second"],
+    )
+
+    if scaler is not None and scaler.history:
+        logger.info(
+            "Autoscale summary | workers_over_time=%s",
+            ",".join(str(sample.workers) for sample in scaler.history),
+        )
+
+    if summary["resumed"]:
+        logger.info("Resume | already_converted=%s", summary["resumed"])
+
+    if manifest is not None:
+        logger.info(
+            "Incremental | unchanged=%s | processed=%s",
+            summary["unchanged"],
+            summary["files"] - summary["unchanged"],
+        )
+
+    if cache is not None and not dry_run:
+        hits = cache.hits - hits_before
+        lookups = hits + cache.misses - misses_before
+        logger.info(
+            "Cache | hits=%s | misses=%s | hit_rate=%.1f%%",
+            hits,
+            lookups - hits,
+            100.0 * hits / lookups if lookups else 0.0,
+        )
+
     return results
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+"""Conversion Cache
+
+Content-addressed, size-bounded on-disk cache of conversion outputs.
+
+Keys
+----
+A cache key is the SHA-256 of:
+
+- the input document's SHA-256
+- the pandoc version
+- the conversion arguments (``to`` / ``format`` / ``extra_args``)
+
+so any change to the input, the toolchain, or the flags is a miss.
+
+Layout
+------
+::
+
+    <cache dir>/
+    ├── objects/ab/abcdef...   # one file per cached output
+    └── tmp/                   # staging area for atomic inserts
+
+Eviction
+--------
+Each object's mtime is bumped on every hit, so pruning removes the
+least-recently-used objects first until the cache fits ``max_size``.
+Automatic eviction on insert goes further, down to ``LOW_WATER`` of
+``max_size``, so a full cache is rescanned once per batch of evictions
+rather than on every insert.
+
+Configuration
+-------------
+- ``DOCUTIL_CACHE_DIR`` (default: ``$XDG_CACHE_HOME/docutil`` or ``~/.cache/docutil``)
+- ``DOCUTIL_CACHE_MAX_SIZE`` (default: ``1G``; accepts ``K``/``M``/``G`` suffixes)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 1024**3
+
+# Fraction of ``max_size`` that automatic eviction prunes down to.
+LOW_WATER = 0.9
+
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(value: str | int) -> int:
+    """Parse ``"500M"`` / ``"2G"`` / ``"1048576"`` into a byte count."""
+    if isinstance(value, int):
+        return value
+
+    text = value.strip().upper().removesuffix("IB").removesuffix("B")
+    number, unit = (text[:-1], text[-1]) if text and text[-1] in _SIZE_UNITS else (text, "")
+
+    try:
+        size = int(float(number) * _SIZE_UNITS[unit])
+    except ValueError as exc:
+        raise ValueError(f"Invalid size: {value!r}") from exc
+
+    if size < 0:
+        raise ValueError(f"Invalid size: {value!r}")
+    return size
+
+
+def default_cache_dir() -> Path:
+    """Resolve the cache directory from the environment."""
+    if env := os.getenv("DOCUTIL_CACHE_DIR"):
+        return Path(env).expanduser()
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "docutil"
+
+
+def default_max_size() -> int:
+    env = os.getenv("DOCUTIL_CACHE_MAX_SIZE")
+    return parse_size(env) if env else DEFAULT_MAX_SIZE
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache usage.
+
+    ``hits`` / ``misses`` count lookups made through this
+    :class:`ConversionCache` instance (i.e. the current process).
+    """
+
+    path: str
+    entries: int
+    size_bytes: int
+    max_size_bytes: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ConversionCache:
+    """Content-addressed store of conversion outputs with LRU eviction."""
+
+    def __init__(self, root: Path | str | None = None, *, max_size: int | str | None = None):
+        self.root = Path(root).expanduser() if root else default_cache_dir()
+        self.max_size = parse_size(max_size) if max_size is not None else default_max_size()
+        self.hits = 0
+        self.misses = 0
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def objects_dir(self) -> Path:
+        return self.root / "objects"
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(
+        input_digest: str,
+        *,
+        pandoc_version: str | None,
+        to: str,
+        format: str,
+        extra_args: list[str],
+    ) -> str:
+        """Build the cache key for one conversion."""
+        material = json.dumps(
+            {
+                "input": input_digest,
+                "pandoc": pandoc_version,
+                "to": to,
+                "format": format,
+                "extra_args": list(extra_args),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _object_path(self, key: str) -> Path:
+        return self.objects_dir / key[:2] / key
+
+    # ------------------------------------------------------------------
+    # Lookup / insert
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, dest: Path) -> bool:
+        """Materialize the cached output for *key* at *dest*.
+
+        Returns True on a hit. Misses leave *dest* untouched.
+        """
+        obj = self._object_path(key)
+        try:
+            shutil.copyfile(obj, dest)
+            os.utime(obj)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        logger.debug("Cache hit | %s → %s", key[:12], dest.name)
+        return True
+
+    def put(self, key: str, src: Path) -> None:
+        """Store *src* under *key* and evict old entries if over budget."""
+        obj = self._object_path(key)
+        if obj.exists():
+            return
+
+        tmp_dir = self.root / "tmp"
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=tmp_dir)
+        os.close(fd)
+        try:
+            shutil.copyfile(src, tmp_name)
+            os.replace(tmp_name, obj)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        size = obj.stat().st_size
+        with self._lock:
+            if self._size is not None:
+                self._size += size
+            over_budget = self._current_size() > self.max_size
+
+        if over_budget:
+            self.prune(int(self.max_size * LOW_WATER))
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _iter_objects(self) -> Iterator[os.DirEntry[str]]:
+        if not self.objects_dir.exists():
+            return
+        for shard in os.scandir(self.objects_dir):
+            if shard.is_dir():
+                yield from (e for e in os.scandir(shard.path) if e.is_file())
+
+    def _current_size(self) -> int:
+        if self._size is None:
+            self._size = sum(e.stat().st_size for e in self._iter_objects())
+        return self._size
+
+    def stats(self) -> CacheStats:
+        entries = 0
+        size = 0
+        for entry in self._iter_objects():
+            entries += 1
+            size += entry.stat().st_size
+
+        with self._lock:
+            self._size = size
+            return CacheStats(
+                path=str(self.root),
+                entries=entries,
+                size_bytes=size,
+                max_size_bytes=self.max_size,
+                hits=self.hits,
+                misses=self.misses,
+            )
+
+    def prune(self, max_size: int | None = None) -> tuple[int, int]:
+        """Evict least-recently-used entries until the cache fits *max_size*.
+
+        Returns
+        -------
+        tuple[int, int]
+            (entries removed, bytes freed)
+        """
+        limit = self.max_size if max_size is None else max_size
+
+        entries = []
+        for entry in self._iter_objects():
+            st = entry.stat()
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+
+        removed = 0
+        freed = 0
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            removed += 1
+            freed += size
+
+        with self._lock:
+            self._size = total
+
+        if removed:
+            logger.info("Cache prune | removed=%s | freed_bytes=%s", removed, freed)
+        return removed, freed
+
+    def clear(self) -> int:
+        """Delete every cache entry. Returns the number of entries removed."""
+        removed = sum(1 for _ in self._iter_objects())
+        shutil.rmtree(self.objects_dir, ignore_errors=True)
+        shutil.rmtree(self.root / "tmp", ignore_errors=True)
+        with self._lock:
+            self._size = 0
+        return removed
@@ -0,0 +1,893 @@
+from __future__ import annotations
+
+"""In-process DOCX → GFM Fast Path
+
+Converts simple Word documents to GitHub-Flavored Markdown without
+starting pandoc, producing the same bytes ``docx_to_markdown`` gets from
+``pandoc -f docx -t gfm --wrap=none --markdown-headings=atx``.
+
+Supported
+---------
+- headings 1–6, body paragraphs
+- bold / italic runs (merged and space-normalized like pandoc's docx reader)
+- external hyperlinks (including URL and email autolinks)
+- bullet and decimal lists (direct or style-based numbering, nesting)
+- simple tables (one paragraph per cell, no merged cells, ≤ 1 header row)
+
+Anything else (images, fields, footnotes, tracked changes, tab stops,
+line breaks, custom styles, indented blocks, checkbox lists, ...) raises
+:class:`~docutil.errors.UnsupportedContentError` so the caller falls back
+to pandoc. Escaping also bails out on the few cases where pandoc's rules
+are context dependent, so the fast path never guesses.
+
+Design
+------
+``word/document.xml`` is streamed with ``iterparse``; each top-level
+block is converted, rendered and then released (only a run of list
+paragraphs is buffered until the list ends), so the parsed XML and block
+model stay small for large documents; the Markdown text itself is built in
+memory. Styles, numbering and relationships are small and read up
+front.
+"""
+
+import re
+import unicodedata
+import zipfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+from xml.etree import ElementTree as ET
+
+from docutil.errors import UnsupportedContentError
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_EXTERNAL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+
+# Paragraph/run properties that do not change pandoc's output.
+_IGNORED_PPR = {
+    "pStyle", "numPr", "spacing", "jc", "rPr", "keepNext", "keepLines", "widowControl",
+    "contextualSpacing", "snapToGrid", "autoSpaceDE", "autoSpaceDN", "adjustRightInd",
+    "textAlignment", "suppressAutoHyphens", "tabs", "sectPr", "pBdr", "shd", "ind",
+    "pageBreakBefore", "suppressLineNumbers", "wordWrap", "overflowPunct", "kinsoku",
+}  # fmt: skip
+_IGNORED_RPR = {
+    "rFonts", "b", "bCs", "i", "iCs", "sz", "szCs", "color", "lang", "kern", "noProof",
+    "rStyle", "spacing", "w", "position", "shd", "eastAsianLayout",
+}  # fmt: skip
+_IGNORED_RUN = {"rPr", "lastRenderedPageBreak"}
+_IGNORED_PARA = {"pPr", "proofErr", "bookmarkEnd", "permStart", "permEnd"}
+
+# Paragraph styles pandoc renders as plain body text (lowercased names).
+_BODY_STYLES = {"normal", "body text", "first paragraph", "compact", "list paragraph"}
+_LIST_STYLE = re.compile(r"^list (bullet|number)( [2-9])?$")
+_HEADING_STYLE = re.compile(r"^heading ([1-6])$")
+
+# pandoc's default --columns; wider pipe tables are not aligned.
+_COLUMNS = 72
+
+# Bullet glyphs Word and pandoc's writer use (incl. Symbol/Wingdings
+# private-use code points). pandoc turns ☐/☒ bullets (or items starting with
+# them) into GFM task lists, so anything unknown goes to pandoc.
+_BULLET_GLYPHS = {
+    "", " ", "•", "◦", "▪", "▫", "■", "‣", "⁃", "∙", "·", "o", "-", "–", "—", "*",
+    "\uf0b7", "\uf0a7", "\uf0a8", "\uf0d8", "\uf076", "\uf06e", "\uf071",
+}  # fmt: skip
+_CHECKBOXES = ("☐", "☑", "☒")
+
+_ON = {"true", "1", "on"}
+_OFF = {"false", "0", "off"}
+
+# ---------------------------------------------------------------------------
+# Inline model (mirrors the subset of pandoc's AST we produce)
+#   ("str", text) | ("space",) | ("emph", [..]) | ("strong", [..]) | ("link", url, [..])
+# ---------------------------------------------------------------------------
+
+Inline = tuple
+Inlines = list
+
+_SPACE: Inline = ("space",)
+# Wrappers pandoc's docx reader stacks and merges; the children come last.
+_MODIFIERS = ("emph", "strong", "link")
+
+
+def _unsupported(what: str) -> UnsupportedContentError:
+    return UnsupportedContentError(f"unsupported DOCX construct: {what}")
+
+
+def _meld(xs: Inlines, ys: Inlines) -> Inlines:
+    """Concatenate like pandoc's ``Inlines`` semigroup (merges at the seam)."""
+    if not xs:
+        return list(ys)
+    if not ys:
+        return list(xs)
+    x, y = xs[-1], ys[0]
+    if x[0] == "str" and y[0] == "str":
+        mid = [("str", x[1] + y[1])]
+    elif x[0] == "space" and y[0] == "space":
+        mid = [_SPACE]
+    elif x[0] == y[0] and x[0] in ("emph", "strong"):
+        mid = [(x[0], _meld(x[1], y[1]))]
+    else:
+        mid = [x, y]
+    return xs[:-1] + mid + ys[1:]
+
+
+def _text(s: str) -> Inlines:
+    out: Inlines = []
+    for chunk in re.findall(r"[ \t\r]+|[^ \t\r]+", s):
+        out.append(_SPACE if chunk[0] in " \t\r" else ("str", chunk))
+    return out
+
+
+def _unstack(ils: Inlines) -> tuple[list[Inline], Inlines]:
+    mods: list[Inline] = []
+    while len(ils) == 1 and ils[0][0] in _MODIFIERS:
+        mods.append(ils[0][:-1])
+        ils = ils[0][-1]
+    return mods, ils
+
+
+def _stack(mods: list[Inline], ils: Inlines) -> Inlines:
+    if not ils:
+        return []
+    for mod in reversed(mods):
+        ils = [(*mod, ils)]
+    return ils
+
+
+def _trim(ils: Inlines) -> Inlines:
+    start, end = 0, len(ils)
+    while start < end and ils[start][0] == "space":
+        start += 1
+    while end > start and ils[end - 1][0] == "space":
+        end -= 1
+    return ils[start:end]
+
+
+def _space_out(ils: Inlines) -> tuple[Inlines, Inlines, Inlines]:
+    mods, inner = _unstack(ils)
+    left = [_SPACE] if inner and inner[0][0] == "space" else []
+    right = [_SPACE] if inner and inner[-1][0] == "space" else []
+    return left, _stack(mods, _trim(inner)), right
+
+
+def _space_out_left(ils: Inlines) -> tuple[Inlines, Inlines]:
+    left, middle, right = _space_out(ils)
+    mods, inner = _unstack(middle)
+    return left, _stack(mods, _meld(inner, right))
+
+
+def _space_out_right(ils: Inlines) -> tuple[Inlines, Inlines]:
+    left, middle, right = _space_out(ils)
+    mods, inner = _unstack(middle)
+    return _stack(mods, _meld(left, inner)), right
+
+
+def _minus(xs: list[Inline], ys: list[Inline]) -> list[Inline]:
+    out = list(xs)
+    for y in ys:
+        if y in out:
+            out.remove(y)
+    return out
+
+
+def _combine_single(x: Inlines, y: Inlines) -> Inlines:
+    xfs, xs = _unstack(x)
+    yfs, ys = _unstack(y)
+    shared = [f for f in xfs if f in yfs]
+
+    if shared:
+        return _stack(
+            shared,
+            _combine(_stack(_minus(xfs, shared), xs), _stack(_minus(yfs, shared), ys)),
+        )
+    if not xs and not ys:
+        return []
+    if not xs:
+        sp, y2 = _space_out_left(y)
+        return _meld(sp, y2)
+    if not ys:
+        x2, sp = _space_out_right(x)
+        return _meld(x2, sp)
+    x2, xsp = _space_out_right(x)
+    ysp, y2 = _space_out_left(y)
+    return _meld(x2, _meld(xsp, _meld(ysp, y2)))
+
+
+def _combine(x: Inlines, y: Inlines) -> Inlines:
+    """pandoc's docx ``combineInlines``: merge shared formatting across the seam."""
+    return _meld(x[:-1], _meld(_combine_single(x[-1:], y[:1]), y[1:]))
+
+
+def _smush(parts: list[Inlines]) -> Inlines:
+    out: Inlines = []
+    for part in parts:
+        out = _combine(out, part)
+    # The final combine with nothing moves a trailing space out of formatting.
+    return _combine(out, [])
+
+
+# ---------------------------------------------------------------------------
+# Package parts: styles, numbering, relationships
+# ---------------------------------------------------------------------------
+
+
+def _on_off(el: ET.Element | None) -> bool | None:
+    if el is None:
+        return None
+    val = el.get(f"{_W}val")
+    if val is None or val.lower() in _ON:
+        return True
+    if val.lower() in _OFF:
+        return False
+    return None
+
+
+@dataclass(frozen=True)
+class _Style:
+    name: str
+    based_on: str | None
+    num: tuple[str, int] | None
+    indented: bool
+
+
+@dataclass(frozen=True)
+class _Level:
+    fmt: str
+    text: str
+    start: int
+
+
+class _Package:
+    def __init__(self, zf: zipfile.ZipFile) -> None:
+        names = set(zf.namelist())
+        if "word/document.xml" not in names:
+            raise _unsupported("missing word/document.xml")
+
+        self.styles: dict[str, _Style] = {}
+        self.default_paragraph: str | None = None
+        if "word/styles.xml" in names:
+            self._read_styles(ET.fromstring(zf.read("word/styles.xml")))
+
+        self.levels: dict[tuple[str, int], _Level] = {}
+        if "word/numbering.xml" in names:
+            self._read_numbering(ET.fromstring(zf.read("word/numbering.xml")))
+
+        self.links: dict[str, str] = {}
+        if "word/_rels/document.xml.rels" in names:
+            rels = ET.fromstring(zf.read("word/_rels/document.xml.rels"))
+            for rel in rels.iter(f"{_REL}Relationship"):
+                if rel.get("Type") == _EXTERNAL:
+                    self.links[rel.get("Id", "")] = rel.get("Target", "")
+
+    def _read_styles(self, root: ET.Element) -> None:
+        for st in root.iter(f"{_W}style"):
+            sid = st.get(f"{_W}styleId", "")
+            name_el = st.find(f"{_W}name")
+            name = name_el.get(f"{_W}val", sid) if name_el is not None else sid
+            based = st.find(f"{_W}basedOn")
+            ppr = st.find(f"{_W}pPr")
+            num = None
+            indented = False
+            if ppr is not None:
+                num = _num_pr(ppr.find(f"{_W}numPr"))
+                ind = ppr.find(f"{_W}ind")
+                indented = ind is not None and _indent(ind) > 0
+            self.styles[sid] = _Style(
+                name=name.lower(),
+                based_on=based.get(f"{_W}val") if based is not None else None,
+                num=num,
+                indented=indented,
+            )
+            if st.get(f"{_W}type") == "paragraph" and st.get(f"{_W}default") in _ON:
+                self.default_paragraph = sid
+
+    def _read_numbering(self, root: ET.Element) -> None:
+        abstract: dict[str, dict[int, _Level]] = {}
+        for an in root.iter(f"{_W}abstractNum"):
+            if an.find(f"{_W}numStyleLink") is not None or an.find(f"{_W}styleLink") is not None:
+                continue
+            levels: dict[int, _Level] = {}
+            for lvl in an.iter(f"{_W}lvl"):
+                fmt = lvl.find(f"{_W}numFmt")
+                text = lvl.find(f"{_W}lvlText")
+                start = lvl.find(f"{_W}start")
+                levels[int(lvl.get(f"{_W}ilvl", "0"))] = _Level(
+                    fmt=fmt.get(f"{_W}val", "") if fmt is not None else "",
+                    text=text.get(f"{_W}val", "") if text is not None else "",
+                    start=int(start.get(f"{_W}val", "1")) if start is not None else 1,
+                )
+            abstract[an.get(f"{_W}abstractNumId", "")] = levels
+
+        for num in root.iter(f"{_W}num"):
+            starts: dict[int, int] = {}
+            for override in num.iter(f"{_W}lvlOverride"):
+                start = override.find(f"{_W}startOverride")
+                if override.find(f"{_W}lvl") is not None or start is None:
+                    break
+                starts[int(override.get(f"{_W}ilvl", "0"))] = int(start.get(f"{_W}val", "1"))
+            else:
+                ref = num.find(f"{_W}abstractNumId")
+                levels = abstract.get(ref.get(f"{_W}val", "") if ref is not None else "", {})
+                for ilvl, level in levels.items():
+                    if ilvl in starts:
+                        level = _Level(fmt=level.fmt, text=level.text, start=starts[ilvl])
+                    self.levels[(num.get(f"{_W}numId", ""), ilvl)] = level
+
+    def style_chain(self, sid: str | None) -> Iterator[_Style]:
+        seen: set[str] = set()
+        while sid and sid not in seen and sid in self.styles:
+            seen.add(sid)
+            style = self.styles[sid]
+            yield style
+            sid = style.based_on
+
+
+def _num_pr(el: ET.Element | None) -> tuple[str, int] | None:
+    if el is None:
+        return None
+    num_id = el.find(f"{_W}numId")
+    ilvl = el.find(f"{_W}ilvl")
+    if num_id is None:
+        return None
+    return num_id.get(f"{_W}val", "0"), int(ilvl.get(f"{_W}val", "0")) if ilvl is not None else 0
+
+
+def _indent(ind: ET.Element) -> int:
+    value = ind.get(f"{_W}left") or ind.get(f"{_W}start") or "0"
+    try:
+        return int(value)
+    except ValueError:
+        return 1
+
+
+# ---------------------------------------------------------------------------
+# Reader: document.xml → blocks
+#   ("header", level, ils) | ("para", ils) | ("plain", ils) | ("table", header, rows)
+#   ("bullet", items) | ("ordered", start, items)       items: list[list[block]]
+# ---------------------------------------------------------------------------
+
+Block = tuple
+
+
+@dataclass
+class _Item:
+    """A list paragraph before list structure is rebuilt."""
+
+    num_id: str
+    level: int
+    ordered: bool
+    start: int
+    block: Block
+
+
+class _Reader:
+    def __init__(self, pkg: _Package) -> None:
+        self.pkg = pkg
+        self.list_state: dict[tuple[str, int], int] = {}
+
+    # -- runs ---------------------------------------------------------------
+
+    def run(self, r: ET.Element) -> Inlines:
+        italic = bold = False
+        parts: list[Inlines] = []
+        for child in r:
+            tag = child.tag.removeprefix(_W)
+            if tag == "rPr":
+                italic, bold = self.run_props(child)
+            elif tag == "t":
+                text = child.text or ""
+                if "\n" in text:
+                    raise _unsupported("newline in text")
+                parts.append(_text(text))
+            elif tag == "tab":
+                parts.append([_SPACE])
+            elif tag not in _IGNORED_RUN:
+                raise _unsupported(f"w:{tag}")
+
+        ils = _smush(parts)
+        if bold:
+            ils = [("strong", ils)]
+        if italic:
+            ils = [("emph", ils)]
+        return ils
+
+    def run_props(self, rpr: ET.Element) -> tuple[bool, bool]:
+        for child in rpr:
+            tag = child.tag.removeprefix(_W)
+            if tag == "u" and child.get(f"{_W}val", "single") == "none":
+                continue
+            if tag == "vertAlign" and child.get(f"{_W}val") == "baseline":
+                continue
+            if tag in ("strike", "dstrike", "caps", "smallCaps", "vanish") and (
+                _on_off(child) is False
+            ):
+                continue
+            if tag not in _IGNORED_RPR:
+                raise _unsupported(f"run property w:{tag}")
+
+        rstyle = rpr.find(f"{_W}rStyle")
+        if rstyle is not None:
+            names = [s.name for s in self.pkg.style_chain(rstyle.get(f"{_W}val"))]
+            if names and names[0] != "hyperlink":
+                raise _unsupported("character style")
+
+        return bool(_on_off(rpr.find(f"{_W}i"))), bool(_on_off(rpr.find(f"{_W}b")))
+
+    # -- paragraphs ---------------------------------------------------------
+
+    def inlines(self, p: ET.Element, *, heading: bool) -> Inlines:
+        parts: list[Inlines] = []
+        for child in p:
+            tag = child.tag.removeprefix(_W)
+            if tag == "r":
+                parts.append(self.run(child))
+            elif tag == "hyperlink":
+                parts.append(self.hyperlink(child))
+            elif tag == "bookmarkStart":
+                if not heading and child.get(f"{_W}name") != "_GoBack":
+                    raise _unsupported("bookmark")
+            elif tag not in _IGNORED_PARA:
+                raise _unsupported(f"w:{tag}")
+        ils = _smush(parts)
+        # Headings keep their outer spaces; paragraphs are trimmed.
+        return ils if heading else _trim(ils)
+
+    def hyperlink(self, h: ET.Element) -> Inlines:
+        rid = h.get(f"{_R}id")
+        if rid is None or h.get(f"{_W}anchor") is not None or rid not in self.pkg.links:
+            raise _unsupported("internal hyperlink")
+        url = self.pkg.links[rid]
+        if not re.fullmatch(r"[A-Za-z][A-Za-z0-9+.-]*:[\x21-\x7e]*", url) or re.search(
+            r"[()<>\\]", url
+        ):
+            raise _unsupported("hyperlink target")
+
+        runs: list[Inlines] = []
+        for child in h:
+            tag = child.tag.removeprefix(_W)
+            if tag == "r":
+                runs.append(self.run(child))
+            elif tag not in _IGNORED_PARA:
+                raise _unsupported(f"w:{tag} in hyperlink")
+        return [("link", url, _smush(runs))]
+
+    def paragraph(self, p: ET.Element, *, in_cell: bool = False) -> Block | _Item | None:
+        ppr = p.find(f"{_W}pPr")
+        sid = self.pkg.default_paragraph
+        num: tuple[str, int] | None = None
+        indented = False
+
+        if ppr is not None:
+            for child in ppr:
+                if child.tag.removeprefix(_W) not in _IGNORED_PPR:
+                    raise _unsupported(f"paragraph property w:{child.tag.removeprefix(_W)}")
+            pstyle = ppr.find(f"{_W}pStyle")
+            if pstyle is not None:
+                sid = pstyle.get(f"{_W}val")
+            num = _num_pr(ppr.find(f"{_W}numPr"))
+            ind = ppr.find(f"{_W}ind")
+            indented = ind is not None and _indent(ind) > 0
+
+        chain = list(self.pkg.style_chain(sid))
+        name = chain[0].name if chain else "normal"
+        if num is None:
+            num = next((s.num for s in chain if s.num is not None), None)
+        indented = indented or any(s.indented for s in chain)
+
+        heading = _HEADING_STYLE.match(name)
+        if heading:
+            if num is not None:
+                raise _unsupported("numbered heading")
+            ils = self.inlines(p, heading=True)
+            if not _trim(ils):
+                raise _unsupported("empty heading")
+            return ("header", int(heading.group(1)), ils)
+
+        if name not in _BODY_STYLES and not _LIST_STYLE.match(name):
+            raise _unsupported(f"paragraph style {name!r}")
+
+        ils = self.inlines(p, heading=False)
+        level = self.pkg.levels.get(num) if num is not None and num[0] != "0" else None
+
+        if level is None:
+            if (name in ("compact", "list paragraph") and not in_cell) or indented:
+                raise _unsupported(f"{name} paragraph outside a list")
+            return ("para", ils) if ils else None
+
+        if not ils:
+            raise _unsupported("empty list item")
+        if level.fmt == "bullet":
+            if level.text in _CHECKBOXES or (ils[0][0] == "str" and ils[0][1][:1] in _CHECKBOXES):
+                raise _unsupported("checkbox list")
+            if level.text not in _BULLET_GLYPHS:
+                raise _unsupported(f"bullet glyph {level.text!r}")
+            ordered = False
+        elif level.fmt == "decimal" and re.fullmatch(r"%[1-9]\.", level.text):
+            ordered = True
+        else:
+            raise _unsupported(f"list format {level.fmt!r}")
+
+        # Continue numbering across lists that share a numId, like pandoc.
+        assert num is not None
+        num_id, ilvl = num
+        previous = self.list_state.get((num_id, ilvl))
+        start = previous + 1 if previous is not None else level.start
+        self.list_state = {
+            k: v for k, v in self.list_state.items() if k[0] != num_id or k[1] <= ilvl
+        }
+        self.list_state[(num_id, ilvl)] = start
+
+        block = ("plain", ils) if name == "compact" else ("para", ils)
+        return _Item(num_id=num_id, level=ilvl, ordered=ordered, start=start, block=block)
+
+    # -- tables -------------------------------------------------------------
+
+    def table(self, tbl: ET.Element) -> Block:
+        header_rows = 0
+        first_row = False
+        rows: list[list[Inlines]] = []
+        ncols: int | None = None
+
+        for child in tbl:
+            tag = child.tag.removeprefix(_W)
+            if tag == "tblPr":
+                look = child.find(f"{_W}tblLook")
+                if look is not None:
+                    flag = look.get(f"{_W}firstRow")
+                    if flag is not None:
+                        first_row = flag in _ON
+                    else:
+                        first_row = bool(int(look.get(f"{_W}val", "0"), 16) & 0x0020)
+                if child.find(f"{_W}tblCaption") is not None:
+                    raise _unsupported("table caption")
+            elif tag == "tblGrid":
+                ncols = len(child.findall(f"{_W}gridCol"))
+            elif tag == "tr":
+                cells, is_header = self.row(child)
+                if is_header and header_rows == len(rows):
+                    header_rows += 1
+                rows.append(cells)
+            elif tag not in ("bookmarkStart", "bookmarkEnd"):
+                raise _unsupported(f"w:{tag} in table")
+
+        if not rows or any(len(r) != len(rows[0]) for r in rows):
+            raise _unsupported("irregular table")
+        if ncols is not None and ncols != len(rows[0]):
+            raise _unsupported("table grid mismatch")
+        if header_rows == 0 and first_row:
+            header_rows = 1
+        if header_rows > 1:
+            raise _unsupported("table header layout")
+
+        header = rows[0] if header_rows else None
+        return ("table", header, rows[header_rows:])
+
+    def row(self, tr: ET.Element) -> tuple[list[Inlines], bool]:
+        cells: list[Inlines] = []
+        is_header = False
+        for child in tr:
+            tag = child.tag.removeprefix(_W)
+            if tag == "trPr":
+                for prop in child:
+                    ptag = prop.tag.removeprefix(_W)
+                    if ptag == "tblHeader":
+                        is_header = bool(_on_off(prop))
+                    elif ptag in ("gridBefore", "gridAfter", "hidden"):
+                        raise _unsupported(f"w:{ptag}")
+            elif tag == "tc":
+                cells.append(self.cell(child))
+            elif tag not in ("bookmarkStart", "bookmarkEnd"):
+                raise _unsupported(f"w:{tag} in table row")
+        return cells, is_header
+
+    def cell(self, tc: ET.Element) -> Inlines:
+        content: list[Inlines] = []
+        for child in tc:
+            tag = child.tag.removeprefix(_W)
+            if tag == "tcPr":
+                if child.find(f"{_W}gridSpan") is not None or child.find(f"{_W}vMerge") is not None:
+                    raise _unsupported("merged cell")
+            elif tag == "p":
+                block = self.paragraph(child, in_cell=True)
+                if isinstance(block, _Item) or (block is not None and block[0] == "header"):
+                    raise _unsupported("structured cell")
+                if block is not None:
+                    content.append(block[1])
+            else:
+                raise _unsupported(f"w:{tag} in table cell")
+        if len(content) > 1:
+            raise _unsupported("multi-paragraph cell")
+        return content[0] if content else []
+
+
+def _listify(flat: list[Block | _Item], level: int = -1) -> list[Block]:
+    """Rebuild nested lists from flat list paragraphs (pandoc's ``flatToBullets``)."""
+    out: list[Block] = []
+    i = 0
+    while i < len(flat):
+        b = flat[i]
+        b_level = b.level if isinstance(b, _Item) else -1
+        if b_level == level or not isinstance(b, _Item):
+            out.append(b.block if isinstance(b, _Item) else b)
+            i += 1
+            continue
+
+        j = i
+        while j < len(flat):
+            c = flat[j]
+            if not isinstance(c, _Item):
+                break
+            if not (c.level > b.level or (c.level == b.level and c.num_id == b.num_id)):
+                break
+            j += 1
+
+        items: list[list[Block]] = []
+        for block in _listify(flat[i:j], b.level):
+            if block[0] in ("bullet", "ordered") and items:
+                items[-1].append(block)
+            else:
+                items.append([block])
+
+        out.append(("ordered", b.start, items) if b.ordered else ("bullet", items))
+        i = j
+    return out
+
+
+def _top_level(flat: Iterable[Block | _Item]) -> Iterator[Block]:
+    """Stream top-level blocks, nesting each run of list paragraphs as it ends.
+
+    Lists never span a non-list block, so only the current run is buffered.
+    """
+    run: list[Block | _Item] = []
+    for b in flat:
+        if isinstance(b, _Item):
+            run.append(b)
+            continue
+        if run:
+            yield from _listify(run)
+            run = []
+        yield b
+    if run:
+        yield from _listify(run)
+
+
+def _read_blocks(stream: IO[bytes], reader: _Reader) -> Iterator[Block | _Item]:
+    depth = 0
+    body: ET.Element | None = None
+    for event, el in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 2 and el.tag == f"{_W}body":
+                body = el
+            continue
+
+        depth -= 1
+        if depth != 2 or body is None:
+            continue
+
+        tag = el.tag.removeprefix(_W)
+        if tag == "p":
+            block = reader.paragraph(el)
+            if block is not None:
+                yield block
+        elif tag == "tbl":
+            yield reader.table(el)
+        elif tag not in ("sectPr", "bookmarkStart", "bookmarkEnd", "proofErr"):
+            raise _unsupported(f"w:{tag}")
+        body.remove(el)
+
+
+# ---------------------------------------------------------------------------
+# Writer: blocks → GFM (pandoc's markdown writer conventions)
+# ---------------------------------------------------------------------------
+
+_ALWAYS_ESCAPE = set("*<>[]`|$")
+_ROMAN = re.compile(r"M*(?:CM)?D?(?:CD)?C*(?:XC)?L?(?:XL)?X*(?:IX)?V?(?:IV)?I*", re.IGNORECASE)
+
+
+def _is_roman(s: str) -> bool:
+    return bool(s) and bool(_ROMAN.fullmatch(s)) and (s.islower() or s.isupper())
+
+
+def _is_list_marker(text: str) -> bool:
+    """pandoc's ``beginsWithOrderedListMarker`` for the gfm writer."""
+    text = text[:10]
+    m = re.fullmatch(r"\((.+)\)|(.+)([.)])", text)
+    if not m:
+        return False
+    if m.group(1) is not None:
+        num, delim = m.group(1), "()"
+    else:
+        num, delim = m.group(2), m.group(3)
+
+    if re.fullmatch(r"[0-9]+", num) or num == "#" or re.fullmatch(r"@[\w-]*", num):
+        return True
+    if re.fullmatch(r"[a-z]", num) or (num.islower() and _is_roman(num)):
+        return True
+    # Upper-case letters/numerals only count with ")" or "(...)".
+    return delim != "." and (re.fullmatch(r"[A-Z]", num) is not None or _is_roman(num))
+
+
+def _escape(text: str) -> str:
+    if "\\" in text or "~~" in text:
+        raise _unsupported("ambiguous escaping")
+    out: list[str] = []
+    for i, c in enumerate(text):
+        if c in _ALWAYS_ESCAPE or (c == "#" and i == 0):
+            out.append("\\" + c)
+        elif c == "_":
+            intraword = 0 < i < len(text) - 1 and text[i - 1].isalnum() and text[i + 1].isalnum()
+            out.append(c if intraword else "\\_")
+        else:
+            out.append(c)
+    return "".join(out)
+
+
+def _render_inlines(ils: Inlines) -> str:
+    out: list[str] = []
+    for i, node in enumerate(ils):
+        kind = node[0]
+        if kind == "str":
+            text = _escape(node[1])
+            if text.endswith("!") and i + 1 < len(ils) and ils[i + 1][0] == "link":
+                text = text[:-1] + "\\!"  # not an image
+            out.append(text)
+        elif kind == "space":
+            out.append(" ")
+        elif kind in ("emph", "strong"):
+            # The writer moves edge spaces outside the delimiters.
+            inner = _render_inlines(node[1])
+            core = inner.strip(" ")
+            if not core:
+                raise _unsupported("empty emphasis")
+            mark = "*" if kind == "emph" else "**"
+            lead = len(inner) - len(inner.lstrip(" "))
+            trail = len(inner) - len(inner.rstrip(" "))
+            out.append(" " * lead + mark + core + mark + " " * trail)
+        else:
+            url, children = node[1], node[2]
+            if children == [("str", url)] and re.match(r"https?://", url):
+                out.append(f"<{url}>")
+            elif children == [("str", url)]:
+                raise _unsupported("autolink")
+            elif url.startswith("mailto:") and children == [("str", url[7:])]:
+                # pandoc writes an email autolink when the text is the address.
+                if not re.fullmatch(r"[\w.+-]+@[\w-]+(\.[\w-]+)+", url[7:], re.ASCII):
+                    raise _unsupported("autolink")
+                out.append(f"<{url[7:]}>")
+            else:
+                out.append(f"[{_render_inlines(children)}]({url})")
+    return "".join(out)
+
+
+def _render_plain(ils: Inlines) -> str:
+    """Render paragraph text, escaping a leading list marker as pandoc does.
+
+    Unlike headings, paragraph text is reflowed: runs of spaces collapse and
+    the ends are trimmed.
+    """
+    return _reflow(_render_marked(ils))
+
+
+def _reflow(text: str) -> str:
+    return re.sub(" {2,}", " ", text).strip(" ")
+
+
+def _render_marked(ils: Inlines) -> str:
+    if len(ils) > 1 and ils[0][0] == "str" and ils[1][0] in _MODIFIERS:
+        if _render_inlines(ils[1:2]).startswith(" "):
+            raise _unsupported("ambiguous escaping")
+    if ils and ils[0][0] == "str" and (len(ils) == 1 or ils[1][0] == "space"):
+        first: str = ils[0][1]
+        if _is_list_marker(first):
+            if "\\" in first:
+                raise _unsupported("ambiguous escaping")
+            return re.sub(r"([.()])", r"\\\1", first) + _render_inlines(ils[1:])
+        if first in ("+", "-"):
+            return "\\" + first + _render_inlines(ils[1:])
+    elif ils and ils[0][0] == "str" and ils[0][1] in ("+", "-"):
+        raise _unsupported("ambiguous escaping")
+    return _render_inlines(ils)
+
+
+def _width(text: str) -> int:
+    width = 0
+    for c in text:
+        if unicodedata.combining(c):
+            continue
+        width += 2 if unicodedata.east_asian_width(c) in ("W", "F") else 1
+    return width
+
+
+def _render_table(header: list[Inlines] | None, rows: list[list[Inlines]]) -> str:
+    ncols = len(rows[0]) if rows else len(header or [])
+    head = [_render_marked(c) for c in header] if header is not None else [""] * ncols
+    body = [[_render_marked(c) for c in row] for row in rows]
+    if any(c != c.strip(" ") for c in [*head, *(c for r in body for c in r)]):
+        raise _unsupported("cell edge spaces")
+    # Columns are sized from the raw text but aligned cells are reflowed.
+    widths = [max(3, *(_width(r[i]) for r in [head, *body])) for i in range(ncols)]
+
+    if sum(widths) > _COLUMNS:
+        # Too wide to align: pandoc emits the raw cells with minimal rules.
+        def line(cells: list[str]) -> str:
+            return "|" + "|".join(f" {c} " for c in cells) + "|"
+
+        rule = "|" + "|".join("----" for _ in widths) + "|"
+    else:
+
+        def line(cells: list[str]) -> str:
+            pads = (" " * (w - _width(_reflow(c))) for c, w in zip(cells, widths))
+            return "|" + "|".join(f" {_reflow(c)}{pad} " for c, pad in zip(cells, pads)) + "|"
+
+        rule = "|" + "|".join("-" * (w + 2) for w in widths) + "|"
+
+    lines = [line(head), rule]
+    lines.extend(line(r) for r in body)
+    return "\n".join(lines)
+
+
+def _render_list(block: Block) -> str:
+    if block[0] == "bullet":
+        items, markers = block[1], ["- "] * len(block[1])
+    else:
+        start, items = block[1], block[2]
+        markers = [f"{start + n}.".ljust(3) + " " for n in range(len(items))]
+
+    rendered: list[str] = []
+    for marker, item in zip(markers, items):
+        pad = " " * len(marker)
+        lines = _render_blocks(item).split("\n")
+        rendered.append(
+            "\n".join([marker + lines[0]] + [pad + ln if ln else "" for ln in lines[1:]])
+        )
+
+    tight = all(item[0][0] == "plain" for item in items)
+    return ("\n" if tight else "\n\n").join(rendered)
+
+
+def _render_block(block: Block) -> str:
+    kind = block[0]
+    if kind == "header":
+        level: int = block[1]
+        return "#" * level + " " + _render_inlines(block[2])
+    if kind in ("para", "plain"):
+        return _render_plain(block[1])
+    if kind == "table":
+        return _render_table(block[1], block[2])
+    return _render_list(block)
+
+
+def _render_blocks(blocks: Iterable[Block]) -> str:
+    out: list[str] = []
+    previous: Block | None = None
+    for block in blocks:
+        if previous is not None:
+            out.append("\n" if previous[0] == "plain" else "\n\n")
+            if block[0] in ("bullet", "ordered") and previous[0] == block[0]:
+                out.append("<!-- -->\n\n")
+        out.append(_render_block(block))
+        previous = block
+    return "".join(out)
+
+
+def docx_to_gfm(source: Path | str | IO[bytes]) -> str:
+    """Convert a simple DOCX file (path or binary stream) to GFM text in-process.
+
+    Raises
+    ------
+    UnsupportedContentError
+        If the document uses anything outside the supported subset.
+    """
+    try:
+        with zipfile.ZipFile(source) as zf:
+            reader = _Reader(_Package(zf))
+            with zf.open("word/document.xml") as stream:
+                return _render_blocks(_top_level(_read_blocks(stream, reader))) + "\n"
+    except (zipfile.BadZipFile, ET.ParseError, KeyError, ValueError) as exc:
+        raise UnsupportedContentError(f"cannot parse DOCX package: {exc}") from exc
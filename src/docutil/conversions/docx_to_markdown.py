@@ -1,16 +1,31 @@
 from __future__ import annotations
 
+import io
 import logging
 from pathlib import Path
+from typing import BinaryIO
 
-import pypandoc
-
+from docutil.conversions.engine import run_pandoc, run_pandoc_bytes
+from docutil.conversions.media import MediaStore
+from docutil.errors import UnsupportedContentError
 from docutil.pandoc_utils import require_pandoc
+from docutil.profiling import span
 
 logger = logging.getLogger(__name__)
 
+# Pandoc settings shared by the sync and async converters.
+PANDOC_FROM = "docx"
+PANDOC_TO = "gfm"
+PANDOC_ARGS = ("--wrap=none", "--markdown-headings=atx")
+
 
-def docx_to_markdown(input_path: Path | str, output_path: Path | str | None = None) -> Path:
+def docx_to_markdown(
+    input_path: Path | str,
+    output_path: Path | str | None = None,
+    *,
+    fast: bool = False,
+    media: MediaStore | None = None,
+) -> Path:
     """
     Convert a .docx file to GitHub-Flavored Markdown (GFM).
 
@@ -18,11 +33,57 @@ def docx_to_markdown(input_path: Path | str, output_path: Path | str | None = No
         • ATX headings
         • no line wrapping
 
+    With ``fast=True`` simple documents are converted in-process
+    (:mod:`docutil.conversions.docx_fast`); anything the fast path does not
+    support falls back to pandoc, so the output is the same either way.
+
+    With *media*, embedded images are extracted into that shared
+    :class:`~docutil.conversions.media.MediaStore` and linked relative to
+    the Markdown file.
+
     Returns
     -------
     Path
         Path to generated Markdown file
     """
+    input_path, output_path = prepare_conversion(input_path, output_path)
+
+    if fast:
+        text = _try_fast(input_path, input_path.name)
+        if text is not None:
+            with span("write"):
+                output_path.write_bytes(text.encode("utf-8"))
+            return output_path
+
+    if media is not None:
+        media.convert(
+            input_path,
+            output_path,
+            to=PANDOC_TO,
+            format=PANDOC_FROM,
+            extra_args=list(PANDOC_ARGS),
+        )
+        return output_path
+
+    run_pandoc(
+        input_path,
+        output_path,
+        to=PANDOC_TO,
+        format=PANDOC_FROM,
+        extra_args=list(PANDOC_ARGS),
+    )
+
+    return output_path
+
+
+def prepare_conversion(input_path: Path | str, output_path: Path | str | None) -> tuple[Path, Path]:
+    """
+    Check pandoc and the input, resolve the output path and log the request.
+
+    Shared by :func:`docx_to_markdown` and
+    :func:`~docutil.conversions.aio.docx_to_markdown_async` (which runs it in
+    a worker thread), so both validate the same way.
+    """
     require_pandoc()
 
     input_path = Path(input_path).expanduser()
@@ -36,13 +97,48 @@ def docx_to_markdown(input_path: Path | str, output_path: Path | str | None = No
     output_path = Path(output_path).resolve() if output_path else input_path.with_suffix(".md")
 
     logger.info("DOCX → Markdown | %s → %s", input_path.name, output_path.name)
+    return input_path, output_path
+
+
+def docx_to_markdown_bytes(data: bytes | BinaryIO, *, fast: bool = False) -> str:
+    """
+    Convert an in-memory DOCX document (bytes or binary stream) to GFM text.
+
+    The document is piped through pandoc's stdin/stdout; nothing is written
+    to disk. Output matches :func:`docx_to_markdown` (including ``fast``).
+    """
+    require_pandoc()
 
-    pypandoc.convert_file(
-        str(input_path),
-        to="gfm",
-        format="docx",
-        outputfile=str(output_path),
-        extra_args=["--wrap=none", "--markdown-headings=atx"],
+    if not isinstance(data, bytes):
+        data = data.read()
+
+    # DOCX is a ZIP container.
+    if not data.startswith(b"PK"):
+        raise ValueError("Input must be a .docx document.")
+
+    logger.info("DOCX → Markdown | <memory> (%s bytes)", len(data))
+
+    if fast:
+        text = _try_fast(io.BytesIO(data), "<memory>")
+        if text is not None:
+            return text
+
+    out = run_pandoc_bytes(
+        data,
+        to=PANDOC_TO,
+        format=PANDOC_FROM,
+        extra_args=list(PANDOC_ARGS),
     )
+    return out.decode("utf-8")
 
-    return output_path
+
+def _try_fast(source: Path | BinaryIO, name: str) -> str | None:
+    """Run the in-process converter; None means "use pandoc"."""
+    from docutil.conversions.docx_fast import docx_to_gfm
+
+    try:
+        with span("fast"):
+            return docx_to_gfm(source)
+    except UnsupportedContentError as exc:
+        logger.debug("Fast path declined %s, using pandoc | %s", name, exc)
+        return None
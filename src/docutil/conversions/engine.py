@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+"""Pandoc Execution Engines
+
+Single choke point through which the converters run pandoc.
+
+Engines
+-------
+- ``subprocess`` (default): one ``pypandoc.convert_file`` call per document
+- ``server``: requests are sent to a warm :class:`PandocServerPool`
+
+The server engine is activated for the duration of a ``with
+pandoc_engine("server", workers=N)`` block (``batch_convert`` does this for
+you). If the pool cannot start, or a single request fails, conversion
+falls back to the subprocess path so results never depend on the engine.
+
+Caching
+-------
+Inside a ``with conversion_cache(cache)`` block, every conversion first
+looks up a :class:`~docutil.conversions.cache.ConversionCache` and, on a
+hit, copies the stored output into place without running pandoc.
+
+Async
+-----
+:func:`run_pandoc_async` runs pandoc with ``asyncio.create_subprocess_exec``
+so event loops are never blocked. It honours the active cache but always
+uses a subprocess (the server pool client is synchronous). Cancelling the
+awaiting task kills the pandoc process.
+
+Side files
+----------
+When pandoc has to write files next to the output (``--extract-media``),
+pass ``cwd`` to :func:`run_pandoc`: pandoc then always runs as a local
+subprocess in that directory, bypassing the cache and the server pool,
+which only reproduce the main output.
+
+In-memory
+---------
+:func:`run_pandoc_bytes` pipes a document through pandoc's stdin/stdout
+(``--output=-``) without touching the filesystem. It uses the active
+server pool when there is one; the file-based cache does not apply.
+"""
+
+import logging
+import subprocess
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from docutil.conversions.cache import ConversionCache, file_digest
+from docutil.errors import ConversionError, PandocNotFoundError, PandocServerError
+from docutil.pandoc_utils import get_pandoc_status
+from docutil.profiling import span
+
+if TYPE_CHECKING:
+    from docutil.conversions.pandoc_server import PandocServerPool
+
+logger = logging.getLogger(__name__)
+
+Engine = Literal["subprocess", "server"]
+ENGINES: tuple[Engine, ...] = ("subprocess", "server")
+
+_active_pool: PandocServerPool | None = None
+_active_cache: ConversionCache | None = None
+
+
+@contextmanager
+def pandoc_engine(engine: Engine = "subprocess", *, workers: int = 1) -> Iterator[None]:
+    """Route conversions inside the block through *engine*.
+
+    Parameters
+    ----------
+    engine
+        ``"subprocess"`` or ``"server"``.
+    workers
+        Number of server instances to keep warm (server engine only).
+    """
+    global _active_pool
+
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown pandoc engine: {engine!r}")
+
+    if engine == "subprocess" or _active_pool is not None:
+        yield
+        return
+
+    # Imported here so the subprocess engine never loads the HTTP client.
+    from docutil.conversions.pandoc_server import PandocServerPool
+
+    pool = PandocServerPool(size=max(1, workers))
+    try:
+        pool.start()
+    except PandocServerError as exc:
+        logger.warning("pandoc server unavailable, using subprocess engine | %s", exc)
+        yield
+        return
+
+    _active_pool = pool
+    try:
+        yield
+    finally:
+        _active_pool = None
+        pool.close()
+
+
+@contextmanager
+def conversion_cache(cache: ConversionCache | None) -> Iterator[None]:
+    """Serve conversions inside the block from *cache* (no-op when None)."""
+    global _active_cache
+
+    if cache is None or _active_cache is not None:
+        yield
+        return
+
+    _active_cache = cache
+    try:
+        yield
+    finally:
+        _active_cache = None
+
+
+def active_cache() -> ConversionCache | None:
+    """The cache of the enclosing :func:`conversion_cache` block, if any.
+
+    For converters that do not run pandoc but should still be cached.
+    """
+    return _active_cache
+
+
+def run_pandoc(
+    input_path: Path,
+    output_path: Path,
+    *,
+    to: str,
+    format: str,
+    extra_args: list[str],
+    cwd: Path | None = None,
+) -> None:
+    """Convert *input_path* into *output_path* using the active cache and engine.
+
+    With *cwd*, pandoc runs as a subprocess in that directory and neither the
+    cache nor the server pool is used (see "Side files" above).
+    """
+    if cwd is not None:
+        _convert(input_path, output_path, to=to, format=format, extra_args=extra_args, cwd=cwd)
+        return
+
+    cache = _active_cache
+    key: str | None = None
+    if cache is not None:
+        with span("cache.lookup"):
+            key = cache.make_key(
+                file_digest(input_path),
+                pandoc_version=get_pandoc_status().version,
+                to=to,
+                format=format,
+                extra_args=extra_args,
+            )
+            hit = cache.get(key, output_path)
+        if hit:
+            return
+
+    _convert(input_path, output_path, to=to, format=format, extra_args=extra_args)
+
+    if cache is not None and key is not None:
+        with span("cache.store"):
+            cache.put(key, output_path)
+
+
+async def run_pandoc_async(
+    input_path: Path,
+    output_path: Path,
+    *,
+    to: str,
+    format: str,
+    extra_args: list[str],
+) -> None:
+    """Async counterpart of :func:`run_pandoc`."""
+    import asyncio  # already loaded by the running event loop
+
+    cache = _active_cache
+    key: str | None = None
+    if cache is not None:
+        digest = await asyncio.to_thread(file_digest, input_path)
+        key = cache.make_key(
+            digest,
+            pandoc_version=get_pandoc_status().version,
+            to=to,
+            format=format,
+            extra_args=extra_args,
+        )
+        if await asyncio.to_thread(cache.get, key, output_path):
+            return
+
+    pandoc = get_pandoc_status().path
+    if pandoc is None:
+        raise PandocNotFoundError("Pandoc is not installed or not on PATH.")
+
+    proc = await asyncio.create_subprocess_exec(
+        pandoc,
+        f"--from={format}",
+        f"--to={to}",
+        *extra_args,
+        f"--output={output_path}",
+        str(input_path),
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, err = await proc.communicate()
+    except asyncio.CancelledError:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    if proc.returncode != 0:
+        stderr = err.decode("utf-8", errors="replace").strip()
+        raise ConversionError(
+            f"pandoc failed converting {input_path.name}: "
+            f"{stderr or f'exit code {proc.returncode}'}",
+            stderr=stderr or None,
+        )
+
+    if cache is not None and key is not None:
+        await asyncio.to_thread(cache.put, key, output_path)
+
+
+def run_pandoc_bytes(
+    data: bytes,
+    *,
+    to: str,
+    format: str,
+    extra_args: list[str],
+    name: str = "<stdin>",
+) -> bytes:
+    """Convert *data* in memory and return pandoc's output.
+
+    *name* only labels log and error messages.
+    """
+    with span("pandoc.run"):
+        return _convert_bytes(data, to=to, format=format, extra_args=extra_args, name=name)
+
+
+def _convert_bytes(data: bytes, *, to: str, format: str, extra_args: list[str], name: str) -> bytes:
+    pool = _active_pool
+    if pool is not None:
+        from docutil.conversions.pandoc_server import args_to_options
+
+        try:
+            return pool.convert(
+                data, from_format=format, to_format=to, options=args_to_options(extra_args)
+            )
+        except PandocServerError as exc:
+            logger.warning("pandoc server failed for %s, retrying via subprocess | %s", name, exc)
+
+    pandoc = get_pandoc_status().path
+    if pandoc is None:
+        raise PandocNotFoundError("Pandoc is not installed or not on PATH.")
+
+    proc = subprocess.run(
+        [pandoc, f"--from={format}", f"--to={to}", *extra_args, "--output=-"],
+        input=data,
+        capture_output=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        stderr = proc.stderr.decode("utf-8", errors="replace").strip()
+        raise ConversionError(
+            f"pandoc failed converting {name}: {stderr or f'exit code {proc.returncode}'}",
+            stderr=stderr or None,
+        )
+    return proc.stdout
+
+
+def _convert(
+    input_path: Path,
+    output_path: Path,
+    *,
+    to: str,
+    format: str,
+    extra_args: list[str],
+    cwd: Path | None = None,
+) -> None:
+    pool = _active_pool
+    if pool is not None and cwd is None:
+        from docutil.conversions.pandoc_server import args_to_options
+
+        try:
+            with span("pandoc.run"):
+                data = pool.convert(
+                    input_path.read_bytes(),
+                    from_format=format,
+                    to_format=to,
+                    options=args_to_options(extra_args),
+                )
+        except PandocServerError as exc:
+            logger.warning(
+                "pandoc server failed for %s, retrying via subprocess | %s", input_path.name, exc
+            )
+        else:
+            with span("write"):
+                output_path.write_bytes(data)
+            return
+
+    import pypandoc  # deferred: costly to import, unused on the server path
+
+    where = {"cworkdir": str(cwd)} if cwd is not None else {}
+    try:
+        with span("pandoc.run"):
+            pypandoc.convert_file(
+                str(input_path),
+                to=to,
+                format=format,
+                outputfile=str(output_path),
+                extra_args=extra_args,
+                **where,
+            )
+    except RuntimeError as exc:
+        # pypandoc reports failures as 'Pandoc died with exitcode "N" during
+        # conversion: <stderr>'.
+        _, _, stderr = str(exc).partition("during conversion: ")
+        stderr = stderr.strip()
+        raise ConversionError(
+            f"pandoc failed converting {input_path.name}: {stderr or str(exc).strip()}",
+            stderr=stderr or None,
+        ) from exc
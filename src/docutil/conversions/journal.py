@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+"""Batch Journal
+
+Append-only checkpoint log that lets an interrupted batch resume.
+
+Each converted file appends one JSON line to ``.docutil-journal.jsonl`` in
+the output root::
+
+    {"src": "guide/intro.md", "out": "/out/guide/intro.docx", "size": 812, "mtime_ns": ...}
+
+Writes go through a buffered file and are flushed + ``fsync``-ed every
+``sync_every`` records or ``sync_interval`` seconds (whichever comes
+first), so the hot loop never waits on the disk for each file. At most
+the last unsynced window is lost on a crash, and those files are simply
+converted again on resume.
+
+A batch that finishes without failures deletes its journal; a journal is
+only left behind by runs that were interrupted or had failures.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_NAME = ".docutil-journal.jsonl"
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    out: str
+    size: int
+    mtime_ns: int
+
+
+def load_journal(path: Path) -> dict[str, JournalEntry]:
+    """Read completed entries, ignoring a torn final line from a crash."""
+    entries: dict[str, JournalEntry] = {}
+    try:
+        fh = path.open(encoding="utf-8")
+    except FileNotFoundError:
+        return entries
+
+    with fh:
+        for line_no, line in enumerate(fh, 1):
+            try:
+                record = json.loads(line)
+                entries[record["src"]] = JournalEntry(
+                    out=record["out"], size=record["size"], mtime_ns=record["mtime_ns"]
+                )
+            except (ValueError, KeyError, TypeError):
+                logger.debug("Skipping malformed journal line %s in %s", line_no, path)
+    return entries
+
+
+def _drop_torn_tail(path: Path, chunk: int = 8192) -> None:
+    """Truncate *path* after its last newline, dropping a partial final record.
+
+    Appending after a torn line would glue the next record onto it, and
+    :func:`load_journal` would then skip both.
+    """
+    try:
+        fh = path.open("r+b")
+    except FileNotFoundError:
+        return
+
+    with fh:
+        end = fh.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            start = max(0, pos - chunk)
+            fh.seek(start)
+            block = fh.read(pos - start)
+            newline = block.rfind(b"\n")
+            if newline != -1:
+                pos = start + newline + 1
+                break
+            pos = start
+        if pos != end:
+            logger.debug("Dropping %s bytes of torn journal tail in %s", end - pos, path)
+            fh.truncate(pos)
+
+
+class BatchJournal:
+    """Thread-safe, buffered, periodically fsync-ed journal writer."""
+
+    def __init__(
+        self,
+        root: Path,
+        input_folder: Path,
+        *,
+        resume: bool = False,
+        sync_every: int = 64,
+        sync_interval: float = 1.0,
+    ) -> None:
+        self.path = root / JOURNAL_NAME
+        self.input_folder = input_folder
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.completed = load_journal(self.path) if resume else {}
+
+        root.mkdir(parents=True, exist_ok=True)
+        if resume:
+            _drop_torn_tail(self.path)
+        self._fh: TextIO | None = self.path.open("a" if resume else "w", encoding="utf-8")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+
+    def key(self, src: Path) -> str:
+        return src.relative_to(self.input_folder).as_posix()
+
+    def is_done(self, src: Path) -> Path | None:
+        """Return the journaled output if *src* is unchanged and its output exists."""
+        entry = self.completed.get(self.key(src))
+        if entry is None:
+            return None
+
+        st = src.stat()
+        out = Path(entry.out)
+        if st.st_size != entry.size or st.st_mtime_ns != entry.mtime_ns or not out.exists():
+            return None
+        return out
+
+    def record(self, src: Path, out: Path) -> None:
+        st = src.stat()
+        line = json.dumps(
+            {
+                "src": self.key(src),
+                "out": str(out.resolve()),
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+            }
+        )
+        with self._lock:
+            if self._fh is None:
+                return
+            self._fh.write(line + "\n")
+            self._unsynced += 1
+            now = time.monotonic()
+            if self._unsynced >= self.sync_every or now - self._last_sync >= self.sync_interval:
+                self._sync(now)
+
+    def _sync(self, now: float) -> None:
+        assert self._fh is not None
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._unsynced = 0
+        self._last_sync = now
+
+    def close(self, *, delete: bool = False) -> None:
+        """Flush and close; optionally delete the journal (clean completion)."""
+        with self._lock:
+            if self._fh is None:
+                return
+            self._sync(time.monotonic())
+            self._fh.close()
+            self._fh = None
+
+        if delete:
+            self.path.unlink(missing_ok=True)
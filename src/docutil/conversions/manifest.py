@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+"""Batch Manifest
+
+Persistent record of what an incremental batch run produced, stored as
+``.docutil-manifest.json`` in the output root.
+
+For every source (keyed by its path relative to the input folder) the
+manifest keeps the size, mtime and SHA-256 it had when converted, plus the
+output that was written. A later run treats a source as unchanged when:
+
+1. its output still exists, and
+2. size + mtime match (no hashing needed), or the content hash matches
+   (e.g. the file was touched or re-checked-out without edits)
+
+Writes are atomic (temp file + ``os.replace``) so an interrupted run never
+leaves a truncated manifest behind.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from docutil.conversions.cache import file_digest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".docutil-manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """State of one source file at the time it was converted."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    output: str
+
+
+class BatchManifest:
+    """Thread-safe, JSON-backed source → output manifest."""
+
+    def __init__(self, root: Path, input_folder: Path) -> None:
+        self.root = root
+        self.input_folder = input_folder
+        self.path = root / MANIFEST_NAME
+        self.entries: dict[str, ManifestEntry] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, root: Path, input_folder: Path) -> BatchManifest:
+        manifest = cls(root, input_folder)
+        if not manifest.path.exists():
+            return manifest
+
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable manifest: %s", manifest.path)
+            return manifest
+
+        if data.get("version") != MANIFEST_VERSION:
+            logger.warning("Ignoring manifest with unknown version: %s", manifest.path)
+            return manifest
+
+        manifest.entries = {
+            rel: ManifestEntry(**entry) for rel, entry in data.get("files", {}).items()
+        }
+        return manifest
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    def key(self, src: Path) -> str:
+        return src.relative_to(self.input_folder).as_posix()
+
+    def output_path(self, entry: ManifestEntry) -> Path:
+        return self.root / entry.output
+
+    def _store_output(self, out: Path) -> str:
+        out = out.resolve()
+        try:
+            return out.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(out)
+
+    # ------------------------------------------------------------------
+    # Change detection
+    # ------------------------------------------------------------------
+
+    def tracks(self, src: Path) -> bool:
+        """Return True if *src* has been converted by a previous run."""
+        with self._lock:
+            return self.key(src) in self.entries
+
+    def lookup(self, src: Path) -> tuple[ManifestEntry | None, str | None]:
+        """Return ``(entry, digest)`` for *src*.
+
+        ``entry`` is the manifest entry if *src* is unchanged and its output
+        still exists, else None. ``digest`` is the content hash if it had to be
+        computed, so callers can pass it on to :meth:`record`.
+        """
+        rel = self.key(src)
+        with self._lock:
+            entry = self.entries.get(rel)
+
+        if entry is None or not self.output_path(entry).exists():
+            return None, None
+
+        st = src.stat()
+        if st.st_size == entry.size and st.st_mtime_ns == entry.mtime_ns:
+            return entry, None
+
+        if st.st_size != entry.size:
+            return None, None
+
+        digest = file_digest(src)
+        if digest != entry.sha256:
+            return None, digest
+
+        # Same content, new mtime: refresh so the next run takes the fast path.
+        refreshed = ManifestEntry(st.st_size, st.st_mtime_ns, digest, entry.output)
+        with self._lock:
+            self.entries[rel] = refreshed
+            self._dirty = True
+        return refreshed, digest
+
+    def record(self, src: Path, out: Path, digest: str | None = None) -> None:
+        """Record that *src* was converted into *out*."""
+        st = src.stat()
+        entry = ManifestEntry(
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            sha256=digest or file_digest(src),
+            output=self._store_output(out),
+        )
+        with self._lock:
+            self.entries[self.key(src)] = entry
+            self._dirty = True
+
+    def delete_orphans(self, *, dry_run: bool = False) -> list[Path]:
+        """Delete outputs whose sources no longer exist.
+
+        Returns the list of (would-be) deleted output paths.
+        """
+        with self._lock:
+            orphans = [
+                (rel, entry)
+                for rel, entry in self.entries.items()
+                if not (self.input_folder / rel).exists()
+            ]
+
+        removed: list[Path] = []
+        for rel, entry in orphans:
+            out = self.output_path(entry)
+            if dry_run:
+                logger.info("DRY RUN: delete orphan %s", out)
+            else:
+                out.unlink(missing_ok=True)
+                with self._lock:
+                    self.entries.pop(rel, None)
+                    self._dirty = True
+                logger.info("Deleted orphan output: %s", out)
+            removed.append(out)
+
+        return removed
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> None:
+        """Atomically write the manifest if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "version": MANIFEST_VERSION,
+                "files": {rel: asdict(e) for rel, e in sorted(self.entries.items())},
+            }
+            self._dirty = False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=MANIFEST_NAME, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, indent=1)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
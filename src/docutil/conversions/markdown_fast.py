@@ -0,0 +1,805 @@
+from __future__ import annotations
+
+"""In-process Markdown → DOCX Fast Path
+
+Builds a DOCX package for short, plain GFM documents without starting
+pandoc, laid out the way ``markdown_to_docx`` (``pandoc -f gfm -t docx``)
+lays it out: same styles, paragraph styles, list numbering definitions,
+heading bookmarks and hyperlink relationships.
+
+Supported
+---------
+- ATX headings (top level)
+- paragraphs (soft line breaks become spaces)
+- ``*`` / ``_`` emphasis and strong emphasis, inline code
+- inline links ``[text](url)`` and autolinks ``<https://...>``
+- bullet and ordered lists (tight or loose, nested)
+
+Anything else (tables, code blocks, block quotes, images, HTML, escapes,
+entities, hard breaks, strikethrough, math, bare URLs, emoji, ...) raises
+:class:`~docutil.errors.UnsupportedContentError` so the caller falls back
+to pandoc.
+
+Skeleton
+--------
+Everything that does not depend on the document (styles, theme, fonts,
+settings, content types, ...) comes from pandoc's own output for an
+empty document. It is built once per pandoc version, stored under
+``skeletons/`` in the active conversion cache's directory (``--cache-dir``
+of a ``--cache`` batch) or else the default cache directory, and kept in
+memory, so each conversion only serializes ``document.xml``,
+``numbering.xml``, the relationships and ``core.xml`` and appends them to
+the pre-compressed skeleton.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from docutil.conversions.cache import default_cache_dir
+from docutil.conversions.engine import active_cache, run_pandoc_bytes
+from docutil.errors import UnsupportedContentError
+from docutil.pandoc_utils import get_pandoc_status
+
+logger = logging.getLogger(__name__)
+
+_DOCUMENT = "word/document.xml"
+_NUMBERING = "word/numbering.xml"
+_DOCUMENT_RELS = "word/_rels/document.xml.rels"
+_FOOTNOTE_RELS = "word/_rels/footnotes.xml.rels"
+_CORE = "docProps/core.xml"
+_DYNAMIC = (_DOCUMENT, _NUMBERING, _DOCUMENT_RELS, _FOOTNOTE_RELS, _CORE)
+
+_HYPERLINK = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+# Characters whose GFM meaning the fast path does not model.
+_UNSUPPORTED_CHARS = re.compile(r"[\\~$|\t]")
+_ENTITY = re.compile(r"&(?:#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6}|[A-Za-z][A-Za-z0-9]*);")
+# GFM autolink extension (bare URLs / e-mail) and emoji shortcodes.
+_BARE_LINK = re.compile(r"://|www\.|@|:[A-Za-z0-9_+-]+:")
+# Control characters, soft hyphens and East Asian scripts (which pandoc
+# splits into runs with font hints).
+_SPECIAL_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\xad\u2e80-\U0010ffff]")
+
+_ATX = re.compile(r"(#{1,6})(?: +(.*?))? *$")
+_BULLET = re.compile(r"([-+*])( +|$)(.*)")
+_ORDERED = re.compile(r"([0-9]{1,9})([.)])( +|$)(.*)")
+_THEMATIC = re.compile(r"([-*_])(?: *\1){2,} *$")
+_SETEXT = re.compile(r"(?:=+|-+) *$")
+_AUTOLINK = re.compile(r"<([A-Za-z][A-Za-z0-9+.-]{1,31}:[^\x00-\x20<>]*)>")
+_DESTINATION = re.compile(r"[\x21-\x7e]+")
+
+_MAX_DEPTH = 9
+
+
+def _xml(text: str) -> str:
+    """Escape *text* for XML exactly as pandoc's writer does."""
+    return escape(text, {'"': "&quot;", "'": "&#39;"})
+
+
+# ---------------------------------------------------------------------------
+# Inline model
+#   ("text", s) | ("soft",) | ("code", s) | ("emph", [..]) | ("strong", [..])
+#   | ("link", url, [..])
+# ---------------------------------------------------------------------------
+
+Inline = tuple
+Inlines = list
+
+
+def _unsupported(what: str) -> UnsupportedContentError:
+    return UnsupportedContentError(f"unsupported Markdown construct: {what}")
+
+
+@dataclass(eq=False)
+class _Delim:
+    """A ``*`` / ``_`` run on the delimiter stack (compared by identity)."""
+
+    char: str
+    count: int
+    length: int
+    can_open: bool
+    can_close: bool
+
+
+def _is_space(c: str) -> bool:
+    return c in "\n\t\r\f " or unicodedata.category(c) == "Zs"
+
+
+def _is_punct(c: str) -> bool:
+    return unicodedata.category(c)[0] in "PS"
+
+
+def _delim(src: str, i: int, n: int) -> _Delim:
+    char = src[i]
+    before = src[i - 1] if i > 0 else "\n"
+    after = src[i + n] if i + n < len(src) else "\n"
+    left = not _is_space(after) and (not _is_punct(after) or _is_space(before) or _is_punct(before))
+    right = not _is_space(before) and (
+        not _is_punct(before) or _is_space(after) or _is_punct(after)
+    )
+    if char == "*":
+        can_open, can_close = left, right
+    else:
+        can_open = left and (not right or _is_punct(before))
+        can_close = right and (not left or _is_punct(after))
+    return _Delim(char, n, n, can_open, can_close)
+
+
+def _code_span(src: str, i: int) -> tuple[Inline, int] | None:
+    n = len(src) - i - len(src[i:].lstrip("`"))
+    j = i + n
+    while (j := src.find("`" * n, j)) != -1:
+        end = j + n
+        if (j == 0 or src[j - 1] != "`") and (end == len(src) or src[end] != "`"):
+            body = src[i + n : j].replace("\n", " ")
+            if body.startswith(" ") and body.endswith(" ") and body.strip(" "):
+                body = body[1:-1]
+            return ("code", body), end
+        j = end + len(src[end:]) - len(src[end:].lstrip("`"))
+    return None
+
+
+def _link(src: str, i: int) -> tuple[Inline, int]:
+    j = i + 1
+    while j < len(src) and src[j] != "]":
+        if src[j] == "[":
+            raise _unsupported("nested brackets")
+        if src[j] == "`":
+            span = _code_span(src, j)
+            j = span[1] if span else j + 1
+            continue
+        j += 1
+    if j >= len(src) or not src.startswith("(", j + 1):
+        raise _unsupported("reference link or literal bracket")
+    close = src.find(")", j + 2)
+    url = src[j + 2 : close] if close != -1 else ""
+    if not url or not _DESTINATION.fullmatch(url) or re.search(r"[()<>\"']", url):
+        raise _unsupported("link destination")
+    text = src[i + 1 : j]
+    if not text.strip() or "`" in text and "]" in text:
+        raise _unsupported("link text")
+    children = _parse_inlines(text, in_link=True)
+    return ("link", url, children), close + 1
+
+
+def _scan(src: str, *, in_link: bool) -> list[Inline | _Delim]:
+    nodes: list[Inline | _Delim] = []
+    text: list[str] = []
+
+    def flush() -> None:
+        if text:
+            nodes.append(("text", "".join(text)))
+            text.clear()
+
+    i = 0
+    while i < len(src):
+        c = src[i]
+        if c == "`":
+            span = _code_span(src, i)
+            if span is None:
+                raise _unsupported("unmatched backticks")
+            flush()
+            nodes.append(span[0])
+            i = span[1]
+        elif c in "*_":
+            n = len(src) - i - len(src[i:].lstrip(c))
+            flush()
+            nodes.append(_delim(src, i, n))
+            i += n
+        elif c == "[":
+            if in_link or src.startswith("[^", i):
+                raise _unsupported("nested link or footnote")
+            if text and text[-1].endswith("!"):
+                raise _unsupported("image")
+            flush()
+            node, i = _link(src, i)
+            nodes.append(node)
+        elif c == "]":
+            raise _unsupported("literal bracket")
+        elif c == "<":
+            m = _AUTOLINK.match(src, i)
+            if m is None or in_link or "@" in m.group(1):
+                raise _unsupported("raw HTML")
+            flush()
+            nodes.append(("link", m.group(1), [("text", m.group(1))]))
+            i = m.end()
+        elif c == "\n":
+            flush()
+            nodes.append(("soft",))
+            i += 1
+        else:
+            text.append(c)
+            i += 1
+    flush()
+    return nodes
+
+
+def _process_emphasis(nodes: list[Inline | _Delim]) -> None:
+    """CommonMark's "process emphasis" over *nodes*, in place."""
+    delims = [n for n in nodes if isinstance(n, _Delim)]
+    bottoms: dict[tuple[str, bool, int], _Delim | None] = {}
+    i = 0
+    while i < len(delims):
+        closer = delims[i]
+        if not closer.can_close:
+            i += 1
+            continue
+
+        key = (closer.char, closer.can_open, closer.length % 3)
+        bottom = bottoms.get(key)
+        found: int | None = None
+        j = i - 1
+        while j >= 0 and delims[j] is not bottom:
+            opener = delims[j]
+            if opener.char == closer.char and opener.can_open:
+                odd = (
+                    (opener.can_close or closer.can_open)
+                    and (opener.length + closer.length) % 3 == 0
+                    and not (opener.length % 3 == 0 and closer.length % 3 == 0)
+                )
+                if not odd:
+                    found = j
+                    break
+            j -= 1
+
+        if found is None:
+            bottoms[key] = delims[i - 1] if i > 0 else None
+            if closer.can_open:
+                i += 1
+            else:
+                del delims[i]
+            continue
+
+        opener = delims[found]
+        use = 2 if opener.count >= 2 and closer.count >= 2 else 1
+        start = next(k for k, n in enumerate(nodes) if n is opener)
+        end = next(k for k, n in enumerate(nodes) if n is closer)
+        nodes[start + 1 : end] = [("strong" if use == 2 else "emph", nodes[start + 1 : end])]
+        opener.count -= use
+        closer.count -= use
+
+        del delims[found + 1 : i]
+        i = found + 1
+        if opener.count == 0:
+            nodes.remove(opener)
+            del delims[found]
+            i -= 1
+        if closer.count == 0:
+            nodes.remove(closer)
+            del delims[i]
+
+
+def _meld(out: Inlines, node: Inline) -> None:
+    """Append *node*, merging it into a preceding node of the same kind.
+
+    Mirrors pandoc's inline builder: adjacent text joins, and adjacent
+    emphasis (or strong emphasis) becomes a single span whose contents are
+    simply concatenated.
+    """
+    last = out[-1] if out else None
+    if last is None or last[0] != node[0] or node[0] not in ("text", "emph", "strong"):
+        out.append(node)
+    elif node[0] == "text":
+        out[-1] = ("text", last[1] + node[1])
+    else:
+        head, tail = list(last[1]), list(node[1])
+        if head[-1][0] == tail[0][0] == "text":
+            # The writer joins these into one run anyway, unless both sides
+            # bring a space (pandoc would keep two).
+            if head[-1][1].endswith(" ") and tail[0][1].startswith(" "):
+                raise _unsupported("adjacent spaces across emphasis")
+            head[-1] = ("text", head[-1][1] + tail.pop(0)[1])
+        out[-1] = (node[0], head + tail)
+
+
+def _finish(nodes: list[Inline | _Delim]) -> Inlines:
+    """Turn leftover delimiters into text, merge and normalize text nodes."""
+    out: Inlines = []
+    for node in nodes:
+        if isinstance(node, _Delim):
+            node = ("text", node.char * node.count)
+        elif node[0] in ("emph", "strong"):
+            node = (node[0], _finish(node[1]))
+        _meld(out, node)
+    for k, node in enumerate(out):
+        if node[0] == "text":
+            if _BARE_LINK.search(node[1]) or _ENTITY.search(node[1]):
+                raise _unsupported("bare link, e-mail, entity or emoji")
+            out[k] = ("text", re.sub(" {2,}", " ", node[1]))
+    return out
+
+
+def _parse_inlines(src: str, *, in_link: bool = False) -> Inlines:
+    nodes = _scan(src, in_link=in_link)
+    _process_emphasis(nodes)
+    return _finish(nodes)
+
+
+# ---------------------------------------------------------------------------
+# Blocks
+# ---------------------------------------------------------------------------
+
+
+@dataclass(eq=False)
+class _Para:
+    lines: list[str]
+
+
+@dataclass(eq=False)
+class _Heading:
+    level: int
+    text: str
+
+
+@dataclass(eq=False)
+class _List:
+    ordered: bool
+    marker: str
+    start: int
+    items: list[list[_Para | _List]] = field(default_factory=list)
+    loose: bool = False
+
+
+_Block = _Para | _Heading | _List
+
+
+def _marker(text: str) -> tuple[_List, int, str] | None:
+    """Match a list marker; return (list prototype, content offset, rest).
+
+    Items whose text starts five or more columns after the marker begin with
+    an indented code block; they report an offset short of ``rest``.
+    """
+    if m := _BULLET.match(text):
+        proto, marker, spaces, rest = (
+            _List(False, m.group(1), 1),
+            m.group(1),
+            m.group(2),
+            m.group(3),
+        )
+    elif m := _ORDERED.match(text):
+        proto = _List(True, m.group(2), int(m.group(1)))
+        marker, spaces, rest = m.group(1) + m.group(2), m.group(3), m.group(4)
+    else:
+        return None
+    return proto, len(marker) + (len(spaces) if len(spaces) <= 4 else 1), rest
+
+
+def _starts_block(text: str) -> bool:
+    return bool(
+        _ATX.match(text)
+        or _THEMATIC.match(text)
+        or _SETEXT.match(text)
+        or text.startswith((">", "```", "<"))
+    )
+
+
+def _parse_blocks(markdown: str) -> list[_Block]:
+    doc: list[_Block] = []
+    # Open list items: (list, item blocks, content column).
+    stack: list[tuple[_List, list[_Para | _List], int]] = []
+    para: _Para | None = None
+    blank = False
+
+    for raw in markdown.splitlines():
+        if _UNSUPPORTED_CHARS.search(raw) or _SPECIAL_CHARS.search(raw):
+            raise _unsupported("escape, table, strikethrough, math or special character")
+        if not raw.strip(" "):
+            para, blank = None, True
+            continue
+
+        indent = len(raw) - len(raw.lstrip(" "))
+        text = raw[indent:]
+        if para is not None and not blank and para.lines[-1].endswith("  "):
+            raise _unsupported("hard line break")
+        marker = None if _THEMATIC.match(text) else _marker(text)
+
+        if para is not None and not blank and marker is None and not _starts_block(text):
+            para.lines.append(text)
+            continue
+
+        while stack and indent < stack[-1][2]:
+            stack.pop()
+        container: list[_Block] = stack[-1][1] if stack else doc  # type: ignore[assignment]
+        interrupts = not blank and bool(container) and container[-1] is para
+        if interrupts and marker is not None and marker[0].ordered and marker[0].start != 1:
+            raise _unsupported("ordered list interrupting a paragraph")
+        if indent - (stack[-1][2] if stack else 0) > 3:
+            raise _unsupported("indented code block")
+
+        if marker is None:
+            if blank and stack and container:
+                raise _unsupported("multi-block list item")
+            if m := _ATX.match(text):
+                if stack:
+                    raise _unsupported("heading inside a list")
+                content = (m.group(2) or "").strip()
+                if not content or content.endswith("#"):
+                    raise _unsupported("empty heading or closing sequence")
+                doc.append(_Heading(len(m.group(1)), content))
+                para = None
+            elif _starts_block(text):
+                raise _unsupported("block quote, code block, HTML or rule")
+            else:
+                para = _Para([text])
+                container.append(para)
+            blank = False
+            continue
+
+        proto, width, rest = marker
+        if not rest or _starts_block(rest) or _marker(rest) or len(text) - len(rest) > width:
+            raise _unsupported("empty or nested list item")
+        last = container[-1] if container else None
+        if (
+            isinstance(last, _List)
+            and last.ordered == proto.ordered
+            and last.marker == proto.marker
+        ):
+            current = last
+            if blank:
+                current.loose = True
+        else:
+            if blank and stack and container:
+                stack[-1][0].loose = True
+            current = proto
+            container.append(current)
+            if len(stack) >= _MAX_DEPTH:
+                raise _unsupported("list nesting")
+        item: list[_Para | _List] = []
+        current.items.append(item)
+        stack.append((current, item, indent + width))
+        para = _Para([rest])
+        item.append(para)
+        blank = False
+
+    return doc
+
+
+# ---------------------------------------------------------------------------
+# OOXML writer
+# ---------------------------------------------------------------------------
+
+
+def _identifier(ils: Inlines) -> str:
+    """GitHub-style heading identifier (pandoc's ``gfm_auto_identifiers``)."""
+
+    def text(nodes: Inlines) -> str:
+        parts = []
+        for node in nodes:
+            if node[0] in ("text", "code"):
+                parts.append(node[1])
+            elif node[0] == "soft":
+                parts.append(" ")
+            else:
+                parts.append(text(node[-1]))
+        return "".join(parts)
+
+    keep = ("Mn", "Mc", "Me", "Pc")
+    return "".join(
+        "-" if c.isspace() else c
+        for c in text(ils).lower()
+        if c.isspace() or c.isalnum() or c in "-_" or unicodedata.category(c) in keep
+    )
+
+
+class _Writer:
+    def __init__(self, first_id: int) -> None:
+        self.body: list[str] = []
+        self.rels: dict[str, str] = {}
+        # Shared by hyperlink relationships and heading bookmarks, as in pandoc.
+        self.next_id = first_id
+        self.abstract: list[str] = []
+        self.nums: list[str] = []
+        self.next_num = 1001
+        self.idents: dict[str, int] = {}
+        self.first_para = True
+
+    def take_id(self) -> int:
+        self.next_id += 1
+        return self.next_id - 1
+
+    # -- inlines ------------------------------------------------------------
+
+    def runs(self, ils: Inlines, props: tuple[str, ...] = ()) -> str:
+        out: list[str] = []
+        for node in ils:
+            kind = node[0]
+            if kind == "text":
+                # pandoc joins the words of a text node into one run but keeps
+                # spaces at its edges as runs of their own.
+                words = node[1].strip(" ")
+                pieces = [" "] if node[1].startswith(" ") else []
+                pieces += [words] if words else []
+                pieces += [" "] if words and node[1].endswith(" ") else []
+                out.extend(self.run(piece, props) for piece in pieces)
+            elif kind == "soft":
+                out.append(self.run(" ", props))
+            elif kind == "code":
+                if "link" in props:
+                    raise _unsupported("code inside a link")
+                out.append(self.run(node[1], ("code", *props)))
+            elif kind in ("emph", "strong"):
+                if kind in props:
+                    raise _unsupported("nested emphasis of the same kind")
+                out.append(self.runs(node[1], (*props, kind)))
+            else:
+                url = node[1]
+                if url not in self.rels:
+                    self.rels[url] = f"rId{self.take_id()}"
+                inner = self.runs(node[2], (*props, "link"))
+                out.append(f'<w:hyperlink r:id="{self.rels[url]}">{inner}</w:hyperlink>')
+        return "".join(out)
+
+    @staticmethod
+    def run(text: str, props: tuple[str, ...]) -> str:
+        rpr = []
+        if "code" in props:
+            rpr.append('<w:rStyle w:val="VerbatimChar" />')
+        elif "link" in props:
+            rpr.append('<w:rStyle w:val="Hyperlink" />')
+        if "strong" in props:
+            rpr.append("<w:b /><w:bCs />")
+        if "emph" in props:
+            rpr.append("<w:i /><w:iCs />")
+        head = f"<w:rPr>{''.join(rpr)}</w:rPr>" if rpr else ""
+        return f'<w:r>{head}<w:t xml:space="preserve">{_xml(text)}</w:t></w:r>'
+
+    # -- blocks -------------------------------------------------------------
+
+    def paragraph(self, ppr: str, ils: Inlines) -> None:
+        self.body.append(f"<w:p><w:pPr>{ppr}</w:pPr>{self.runs(ils)}</w:p>")
+
+    def blocks(self, blocks: list[_Block]) -> None:
+        # Each heading bookmarks its whole section; pandoc numbers the
+        # bookmark when the section closes, so inner sections come first.
+        sections: list[tuple[int, int, str]] = []
+        for block in blocks:
+            if isinstance(block, _Heading):
+                while sections and sections[-1][0] >= block.level:
+                    self.close_section(sections.pop())
+                sections.append((block.level, len(self.body), self.heading(block)))
+            elif isinstance(block, _Para):
+                style = "FirstParagraph" if self.first_para else "BodyText"
+                self.paragraph(f'<w:pStyle w:val="{style}" />', _para_inlines(block))
+                self.first_para = False
+            else:
+                self.list(block, 0)
+                self.first_para = True
+        while sections:
+            self.close_section(sections.pop())
+
+    def close_section(self, section: tuple[int, int, str]) -> None:
+        _, start, ident = section
+        bookmark = self.take_id()
+        name = ident
+        if not ident[0].isalpha() or len(ident) > 40:
+            name = "X" + hashlib.sha1(ident.encode("utf-8")).hexdigest()[1:]
+        self.body[start] = f'<w:bookmarkStart w:id="{bookmark}" w:name="{_xml(name)}" />'
+        self.body.append(f'<w:bookmarkEnd w:id="{bookmark}" />')
+
+    def heading(self, block: _Heading) -> str:
+        ils = _parse_inlines(block.text)
+        base = _identifier(ils)
+        if not base:
+            raise _unsupported("heading without identifier")
+        # GitHub numbers repeats of the same base, whatever else exists.
+        seen = self.idents.get(base, 0)
+        self.idents[base] = seen + 1
+        ident = f"{base}-{seen}" if seen else base
+
+        self.body.append("")  # bookmarkStart, filled in by close_section
+        self.paragraph(f'<w:pStyle w:val="Heading{block.level}" />', ils)
+        self.first_para = True
+        return ident
+
+    def list(self, block: _List, depth: int) -> None:
+        abstract = self.abstract_num(block)
+        num_id = self.next_num
+        self.next_num += 1
+        overrides = ""
+        if block.ordered:
+            overrides = "".join(
+                f'<w:lvlOverride w:ilvl="{lvl}"><w:startOverride w:val="{block.start}" />'
+                "</w:lvlOverride>"
+                for lvl in range(9)
+            )
+        self.nums.append(
+            f'<w:num w:numId="{num_id}"><w:abstractNumId w:val="{abstract}" />{overrides}</w:num>'
+        )
+
+        style = "" if block.loose else '<w:pStyle w:val="Compact" />'
+        numpr = f'<w:numPr><w:ilvl w:val="{depth}" /><w:numId w:val="{num_id}" /></w:numPr>'
+        for item in block.items:
+            for child in item:
+                if isinstance(child, _Para):
+                    self.paragraph(style + numpr, _para_inlines(child))
+                else:
+                    self.list(child, depth + 1)
+
+    def abstract_num(self, block: _List) -> str:
+        if block.ordered:
+            if block.start > 999_999:
+                raise _unsupported("list start")
+            aid = f"994{1 if block.marker == '.' else 2}{block.start}"
+        else:
+            aid = "991"
+        if any(f'w:abstractNumId="{aid}"' in a for a in self.abstract):
+            return aid
+
+        levels = []
+        for lvl in range(9):
+            indent = f'<w:pPr><w:ind w:left="{720 * (lvl + 1)}" w:hanging="360" /></w:pPr>'
+            if block.ordered:
+                levels.append(
+                    f'<w:lvl w:ilvl="{lvl}"><w:start w:val="{block.start}" />'
+                    f'<w:numFmt w:val="decimal" /><w:lvlText w:val="%{lvl + 1}{block.marker}" />'
+                    f'<w:lvlJc w:val="left" />{indent}</w:lvl>'
+                )
+            else:
+                char, font = _BULLETS[lvl % 3]
+                levels.append(
+                    f'<w:lvl w:ilvl="{lvl}"><w:numFmt w:val="bullet" />'
+                    f'<w:lvlText w:val="{char}" /><w:lvlJc w:val="left" />{indent}'
+                    f'<w:rPr><w:rFonts w:ascii="{font}" w:hAnsi="{font}" w:cs="{font}" '
+                    'w:hint="default" /></w:rPr></w:lvl>'
+                )
+        self.abstract.append(
+            f'<w:abstractNum w:abstractNumId="{aid}"><w:nsid w:val="{("A" + aid).rjust(8, "0")}" />'
+            f'<w:multiLevelType w:val="multilevel" />{"".join(levels)}</w:abstractNum>'
+        )
+        return aid
+
+
+_BULLETS = (("\uf0b7", "Symbol"), ("o", "Courier New"), ("\uf0a7", "Wingdings"))
+
+
+def _para_inlines(para: _Para) -> Inlines:
+    return _parse_inlines("\n".join(line.rstrip(" ") for line in para.lines).strip())
+
+
+# ---------------------------------------------------------------------------
+# Skeleton
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _Skeleton:
+    """Static parts as a ready-made zip, plus templates for the dynamic ones."""
+
+    static: bytes
+    templates: dict[str, str]
+    date_time: tuple[int, int, int, int, int, int]
+    first_id: int
+
+    @classmethod
+    def from_docx(cls, data: bytes) -> _Skeleton:
+        templates: dict[str, str] = {}
+        buf = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(data)) as src, zipfile.ZipFile(buf, "w") as dst:
+            for info in src.infolist():
+                if info.filename in _DYNAMIC:
+                    templates[info.filename] = src.read(info).decode("utf-8")
+                else:
+                    dst.writestr(info, src.read(info), compress_type=zipfile.ZIP_DEFLATED)
+            date_time = src.getinfo(_DOCUMENT).date_time
+        missing = set(_DYNAMIC) - templates.keys()
+        if missing or "<w:body>\n    \n" not in templates[_DOCUMENT]:
+            raise UnsupportedContentError(f"unexpected pandoc DOCX layout: {sorted(missing)}")
+        # Hyperlink relationships and bookmarks are numbered after the static parts.
+        rel_ids = [int(n) for n in re.findall(r'Id="rId(\d+)"', templates[_DOCUMENT_RELS])]
+        return cls(buf.getvalue(), templates, date_time, max(rel_ids, default=0) + 1)
+
+
+_skeletons: dict[str, _Skeleton] = {}
+_skeleton_lock = threading.Lock()
+
+
+def docx_skeleton() -> _Skeleton:
+    """Return the skeleton for the installed pandoc, building it on first use."""
+    version = get_pandoc_status().version
+    if version is None:
+        raise UnsupportedContentError("pandoc version unknown; cannot build a DOCX skeleton")
+
+    with _skeleton_lock:
+        if version in _skeletons:
+            return _skeletons[version]
+
+        cache = active_cache()
+        root = cache.root if cache is not None else default_cache_dir()
+        path = root / "skeletons" / f"pandoc-{version}.docx"
+        try:
+            skeleton = _Skeleton.from_docx(path.read_bytes())
+        except (OSError, zipfile.BadZipFile, UnsupportedContentError):
+            logger.debug("Building DOCX skeleton for pandoc %s | %s", version, path)
+            data = run_pandoc_bytes(b"", to="docx", format="gfm", extra_args=[])
+            skeleton = _Skeleton.from_docx(data)
+            _save_skeleton(path, data)
+
+        _skeletons[version] = skeleton
+        return skeleton
+
+
+def _save_skeleton(path: Path, data: bytes) -> None:
+    """Atomically store *data*; the skeleton is only a cache, so errors are logged."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError as exc:
+        logger.debug("Could not cache DOCX skeleton at %s | %s", path, exc)
+
+
+def _timestamp() -> str:
+    # pandoc honours SOURCE_DATE_EPOCH for reproducible builds; so do we.
+    epoch = os.getenv("SOURCE_DATE_EPOCH")
+    seconds = int(epoch) if epoch and epoch.isdigit() else time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+def gfm_to_docx(markdown: str) -> bytes:
+    """Convert simple GFM text to DOCX bytes in-process.
+
+    Raises
+    ------
+    UnsupportedContentError
+        If the text uses anything outside the supported subset.
+    """
+    blocks = _parse_blocks(markdown)
+    skeleton = docx_skeleton()
+    writer = _Writer(skeleton.first_id)
+    writer.blocks(blocks)
+
+    t = skeleton.templates
+    document = t[_DOCUMENT].replace(
+        "<w:body>\n    \n", "<w:body>\n    " + "\n    ".join(writer.body) + "\n", 1
+    )
+    head, sep, tail = t[_NUMBERING].partition("<w:num ")
+    numbering = (
+        head
+        + "".join(writer.abstract)
+        + sep
+        + tail.replace("</w:numbering>", "".join(writer.nums) + "</w:numbering>")
+    )
+    links = "".join(
+        f'<Relationship Type="{_HYPERLINK}" Id="{rid}" Target="{_xml(url)}" '
+        'TargetMode="External" />'
+        for url, rid in sorted(writer.rels.items())  # pandoc keeps them in a map
+    )
+    document_rels = t[_DOCUMENT_RELS].replace("</Relationships>", links + "</Relationships>")
+    footnote_rels = t[_FOOTNOTE_RELS]
+    if links:
+        footnote_rels = (
+            f'<?xml version="1.0" encoding="UTF-8"?><Relationships xmlns="{_RELS_NS}">'
+            f"{links}</Relationships>"
+        )
+    core = re.sub(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ", _timestamp(), t[_CORE])
+
+    buf = io.BytesIO(skeleton.static)
+    with zipfile.ZipFile(buf, "a") as zf:
+        for name, content in (
+            (_DOCUMENT, document),
+            (_DOCUMENT_RELS, document_rels),
+            (_FOOTNOTE_RELS, footnote_rels),
+            (_NUMBERING, numbering),
+            (_CORE, core),
+        ):
+            info = zipfile.ZipInfo(name, skeleton.date_time)
+            zf.writestr(info, content.encode("utf-8"), compress_type=zipfile.ZIP_DEFLATED)
+    return buf.getvalue()
@@ -2,16 +2,62 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import BinaryIO
 
-import pypandoc
-
+from docutil.conversions.engine import run_pandoc, run_pandoc_bytes
+from docutil.errors import UnsupportedContentError
 from docutil.pandoc_utils import require_pandoc
+from docutil.profiling import span
 
 logger = logging.getLogger(__name__)
 
+# Pandoc settings shared by the sync and async converters.
+PANDOC_FROM = "gfm"
+PANDOC_TO = "docx"
+PANDOC_ARGS = ("--wrap=none",)
+
+
+def markdown_to_docx(
+    input_path: Path | str,
+    output_path: Path | str | None = None,
+    *,
+    fast: bool = False,
+) -> Path:
+    """
+    Convert Markdown → DOCX.
+
+    With ``fast=True`` simple documents are written in-process
+    (:mod:`docutil.conversions.markdown_fast`); anything the fast path does
+    not support falls back to pandoc.
+    """
+    input_path, output_path = prepare_conversion(input_path, output_path)
+
+    if fast:
+        docx = _try_fast(input_path.read_bytes(), input_path.name)
+        if docx is not None:
+            with span("write"):
+                output_path.write_bytes(docx)
+            return output_path
+
+    run_pandoc(
+        input_path,
+        output_path,
+        to=PANDOC_TO,
+        format=PANDOC_FROM,
+        extra_args=list(PANDOC_ARGS),
+    )
+
+    return output_path
+
 
-def markdown_to_docx(input_path: Path | str, output_path: Path | str | None = None) -> Path:
-    """Convert Markdown → DOCX."""
+def prepare_conversion(input_path: Path | str, output_path: Path | str | None) -> tuple[Path, Path]:
+    """
+    Check pandoc and the input, resolve the output path and log the request.
+
+    Shared by :func:`markdown_to_docx` and
+    :func:`~docutil.conversions.aio.markdown_to_docx_async` (which runs it in
+    a worker thread), so both validate the same way.
+    """
     require_pandoc()
 
     input_path = Path(input_path).expanduser()
@@ -25,13 +71,42 @@ def markdown_to_docx(input_path: Path | str, output_path: Path | str | None = No
     output_path = Path(output_path).resolve() if output_path else input_path.with_suffix(".docx")
 
     logger.info("Markdown → DOCX | %s → %s", input_path.name, output_path.name)
+    return input_path, output_path
+
+
+def markdown_to_docx_bytes(data: str | bytes | BinaryIO, *, fast: bool = False) -> bytes:
+    """Convert in-memory Markdown (text, bytes or binary stream) → DOCX bytes."""
+    require_pandoc()
+
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    elif not isinstance(data, bytes):
+        data = data.read()
 
-    pypandoc.convert_file(
-        str(input_path),
-        to="docx",
-        format="gfm",
-        outputfile=str(output_path),
-        extra_args=["--wrap=none"],
+    logger.info("Markdown → DOCX | <memory> (%s bytes)", len(data))
+
+    if fast:
+        docx = _try_fast(data, "<memory>")
+        if docx is not None:
+            return docx
+
+    return run_pandoc_bytes(
+        data,
+        to=PANDOC_TO,
+        format=PANDOC_FROM,
+        extra_args=list(PANDOC_ARGS),
     )
 
-    return output_path
+
+def _try_fast(data: bytes, name: str) -> bytes | None:
+    """Run the in-process writer; None means "use pandoc"."""
+    from docutil.conversions.markdown_fast import gfm_to_docx
+
+    try:
+        with span("fast"):
+            return gfm_to_docx(data.decode("utf-8"))
+    except UnicodeDecodeError:
+        logger.debug("Fast path declined %s, using pandoc | not UTF-8", name)
+    except UnsupportedContentError as exc:
+        logger.debug("Fast path declined %s, using pandoc | %s", name, exc)
+    return None
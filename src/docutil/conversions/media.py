@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+"""Shared Media Store
+
+Content-addressed directory for images extracted from DOCX documents.
+
+Layout
+------
+::
+
+    <media dir>/
+    ├── 3f2a...e9.png          # one file per unique image (SHA-256 + suffix)
+    └── .extract-XXXX/         # per-conversion staging (removed afterwards)
+
+pandoc extracts each document's media into a staging directory inside
+the store; every file is then renamed (same filesystem, no copy) to its
+content hash, or discarded when an identical image is already stored.
+The Markdown is rewritten to link to the stored files with paths relative
+to the Markdown file, so a logo that appears in a thousand documents is
+written once.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from urllib.parse import quote
+
+from docutil.conversions.cache import file_digest
+from docutil.conversions.engine import run_pandoc
+
+logger = logging.getLogger(__name__)
+
+
+class MediaStore:
+    """Content-addressed media directory shared by many conversions.
+
+    Parameters
+    ----------
+    root
+        Directory holding the media files (created on demand).
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root).expanduser().resolve()
+        self.stored = 0
+        self.reused = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    def add(self, path: Path) -> Path:
+        """Move *path* into the store and return its content-addressed location."""
+        digest = file_digest(path)
+        dest = self.root / f"{digest}{path.suffix.lower()}"
+        # A rename is cheap, so hold the lock across check-and-move: workers
+        # extracting the same image never both count it as new.
+        with self._lock:
+            if dest.exists():
+                self.reused += 1
+                self.bytes_saved += path.stat().st_size
+                path.unlink()
+                return dest
+            os.replace(path, dest)
+            self.stored += 1
+        logger.debug("Media stored | %s → %s", path.name, dest.name)
+        return dest
+
+    def link(self, media: Path, document: Path) -> str:
+        """Relative, URL-quoted reference to stored *media* from *document*."""
+        rel = os.path.relpath(media, document.resolve().parent)
+        return quote(Path(rel).as_posix(), safe="/")
+
+    def convert(
+        self,
+        input_path: Path,
+        output_path: Path,
+        *,
+        to: str,
+        format: str,
+        extra_args: list[str],
+    ) -> None:
+        """Run pandoc with ``--extract-media`` and route the media into the store."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.root, prefix=".extract-") as staging:
+            # pandoc runs inside the store and writes references as
+            # "<staging name>/media/...", which cannot clash with prose.
+            prefix = Path(staging).name
+            run_pandoc(
+                input_path.resolve(),
+                output_path.resolve(),
+                to=to,
+                format=format,
+                extra_args=[*extra_args, f"--extract-media={prefix}"],
+                cwd=self.root,
+            )
+
+            extracted = sorted(p for p in Path(staging).rglob("*") if p.is_file())
+            if not extracted:
+                return
+
+            text = output_path.read_bytes().decode("utf-8")
+            for path in extracted:
+                ref = f"{prefix}/{path.relative_to(staging).as_posix()}"
+                text = text.replace(ref, self.link(self.add(path), output_path))
+            output_path.write_bytes(text.encode("utf-8"))
+
+        logger.debug("Media | %s | %s file(s) → %s", input_path.name, len(extracted), self.root)
+
+    def summary(self) -> str:
+        """One-line summary for end-of-batch logging."""
+        with self._lock:
+            return (
+                f"{self.stored} stored, {self.reused} deduplicated "
+                f"({self.bytes_saved} bytes not written)"
+            )
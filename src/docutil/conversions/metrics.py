@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+"""Batch Metrics
+
+Exports a :class:`BatchReport` as an OpenMetrics (or Prometheus text)
+file for node_exporter's textfile collector or any other scraper.
+
+Metrics
+-------
+- ``docutil_batch_files_total{status=...}``: files by outcome
+- ``docutil_batch_input_bytes_total`` / ``docutil_batch_output_bytes_total``:
+  bytes read and written by converted files
+- ``docutil_batch_cache_hits_total`` / ``docutil_batch_cache_misses_total``:
+  conversion cache lookups (only when a cache is used)
+- ``docutil_batch_file_duration_seconds``: histogram of per-file conversion
+  latency (converted files)
+- ``docutil_batch_duration_seconds``: wall time of the run
+- ``docutil_batch_last_run_timestamp_seconds``: when the run finished
+
+Values describe one run; counters restart from zero on the next run, which
+``rate()``/``increase()`` treat as a counter reset.
+
+The file is replaced atomically (temporary file + ``os.replace`` in the same
+folder, world-readable), so a scrape never sees a partial file. The
+temporary name ends in ``.tmp``, which the textfile collector ignores.
+"""
+
+import math
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Literal
+
+from docutil.conversions.report import BatchReport, FileStatus
+
+MetricsFormat = Literal["openmetrics", "prometheus"]
+
+# Per-file latency buckets (seconds): in-process fast paths land in the
+# millisecond buckets, pandoc runs between 50 ms and a few seconds.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_STATUSES: tuple[FileStatus, ...] = (
+    "converted",
+    "skipped",
+    "unchanged",
+    "resumed",
+    "dry_run",
+    "failed",
+)
+
+
+_LABEL_NAME = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+_RESERVED_LABELS = frozenset({"le", "status"})
+
+
+def parse_labels(items: Iterable[str]) -> dict[str, str]:
+    """Parse ``KEY=VALUE`` strings into constant metric labels.
+
+    Raises ValueError for malformed items, invalid label names and names the
+    exported metrics already use.
+    """
+    labels: dict[str, str] = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep or not _LABEL_NAME.fullmatch(key) or key.startswith("__"):
+            raise ValueError(f"expected KEY=VALUE with a valid label name, got {item!r}.")
+        if key in _RESERVED_LABELS:
+            raise ValueError(f"label {key!r} is reserved.")
+        labels[key] = value
+    return labels
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Mapping[str, str], **extra: str) -> str:
+    merged = {**labels, **extra}
+    if not merged:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in sorted(merged.items())) + "}"
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Writer:
+    def __init__(self, fmt: MetricsFormat, labels: Mapping[str, str]) -> None:
+        self.fmt = fmt
+        self.labels = labels
+        self.lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str, unit: str | None = None) -> str:
+        """Write the metadata lines; returns the name samples are based on."""
+        # Prometheus 0.0.4 names a counter family after its _total sample;
+        # OpenMetrics names it without the suffix.
+        family = f"{name}_total" if kind == "counter" and self.fmt == "prometheus" else name
+        self.lines.append(f"# HELP {family} {help_text}")
+        self.lines.append(f"# TYPE {family} {kind}")
+        if unit is not None and self.fmt == "openmetrics":
+            self.lines.append(f"# UNIT {family} {unit}")
+        return name
+
+    def sample(self, name: str, value: float, **labels: str) -> None:
+        self.lines.append(f"{name}{_labels(self.labels, **labels)} {_number(value)}")
+
+    def counter(self, name: str, help_text: str, value: float, unit: str | None = None) -> None:
+        self.family(name, "counter", help_text, unit)
+        self.sample(f"{name}_total", value)
+
+    def gauge(self, name: str, help_text: str, value: float, unit: str | None = None) -> None:
+        self.family(name, "gauge", help_text, unit)
+        self.sample(name, value)
+
+    def render(self) -> str:
+        if self.fmt == "openmetrics":
+            self.lines.append("# EOF")
+        return "\n".join(self.lines) + "\n"
+
+
+def render_metrics(
+    report: BatchReport,
+    *,
+    cache_hits: int | None = None,
+    cache_misses: int | None = None,
+    labels: Mapping[str, str] | None = None,
+    fmt: MetricsFormat = "openmetrics",
+    timestamp: float | None = None,
+) -> str:
+    """
+    Render *report* in OpenMetrics or Prometheus text exposition format.
+
+    Parameters
+    ----------
+    cache_hits, cache_misses
+        Cache lookups during the run; the cache metrics are omitted when None.
+    labels
+        Constant labels added to every sample (e.g. ``{"job": "nightly"}``).
+    fmt
+        ``"openmetrics"`` (``application/openmetrics-text``, ends with
+        ``# EOF``) or ``"prometheus"`` (text format 0.0.4).
+    timestamp
+        Run end time for ``docutil_batch_last_run_timestamp_seconds``
+        (default: ``report.finished`` or now).
+    """
+    out = _Writer(fmt, labels or {})
+
+    out.family("docutil_batch_files", "counter", "Files processed by the batch run, by status.")
+    for status in _STATUSES:
+        out.sample("docutil_batch_files_total", report.count(status), status=status)
+
+    out.counter(
+        "docutil_batch_input_bytes",
+        "Bytes read from converted source files.",
+        report.input_bytes,
+        unit="bytes",
+    )
+    out.counter(
+        "docutil_batch_output_bytes",
+        "Bytes written to converted output files.",
+        report.output_bytes,
+        unit="bytes",
+    )
+
+    if cache_hits is not None and cache_misses is not None:
+        out.counter("docutil_batch_cache_hits", "Conversion cache hits.", cache_hits)
+        out.counter("docutil_batch_cache_misses", "Conversion cache misses.", cache_misses)
+
+    durations = sorted(r.duration for r in report.results if r.status == "converted")
+    name = out.family(
+        "docutil_batch_file_duration_seconds",
+        "histogram",
+        "Per-file conversion latency of converted files.",
+        unit="seconds",
+    )
+    seen = 0
+    for bound in LATENCY_BUCKETS:
+        while seen < len(durations) and durations[seen] <= bound:
+            seen += 1
+        out.sample(f"{name}_bucket", seen, le=_number(bound))
+    out.sample(f"{name}_bucket", len(durations), le="+Inf")
+    out.sample(f"{name}_count", len(durations))
+    out.sample(f"{name}_sum", sum(durations))
+
+    out.gauge(
+        "docutil_batch_duration_seconds",
+        "Wall time of the batch run.",
+        report.elapsed,
+        unit="seconds",
+    )
+    out.gauge(
+        "docutil_batch_last_run_timestamp_seconds",
+        "Unix time at which the batch run finished.",
+        timestamp if timestamp is not None else report.finished or time.time(),
+        unit="seconds",
+    )
+    return out.render()
+
+
+def write_metrics(path: Path | str, text: str) -> Path:
+    """Atomically replace *path* with *text* (mode 0644) and return the path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as fh:
+            fh.write(text)
+        os.chmod(tmp_name, 0o644)  # mkstemp creates 0600; the exporter runs as another user
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+"""Pandoc Server Pool
+
+Keeps a small pool of long-lived ``pandoc server`` processes bound to
+loopback ports so batch runs avoid paying pandoc's process startup cost
+for every file.
+
+Protocol
+--------
+Each instance speaks pandoc's HTTP API:
+
+- ``GET /version`` is used as the health check
+- ``POST /`` accepts a JSON body (``text``, ``from``, ``to`` + options)
+
+Binary inputs (e.g. DOCX) are sent base64-encoded and binary outputs come
+back base64-encoded, flagged by the ``base64`` field of the JSON response.
+
+Notes
+-----
+Not every pandoc build ships the server. Callers should treat
+:class:`~docutil.errors.PandocServerError` from :meth:`PandocServerPool.start`
+as "engine unavailable" and fall back to the subprocess path.
+"""
+
+import atexit
+import base64
+import http.client
+import json
+import logging
+import queue
+import socket
+import subprocess
+import threading
+import time
+from types import TracebackType
+
+from docutil.errors import PandocServerError
+from docutil.pandoc_utils import get_pandoc_status
+
+logger = logging.getLogger(__name__)
+
+#: Pandoc formats whose documents are zip containers rather than text.
+BINARY_FORMATS = frozenset({"docx", "odt", "epub", "epub2", "epub3", "pptx"})
+
+_HOST = "127.0.0.1"
+
+# Seconds between checks for a closed pool while waiting for an idle server.
+_CHECKOUT_POLL = 0.5
+
+
+def _free_port() -> int:
+    """Ask the OS for an unused loopback port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((_HOST, 0))
+        return int(sock.getsockname()[1])
+
+
+def args_to_options(extra_args: list[str]) -> dict[str, str]:
+    """Translate ``--name=value`` pandoc CLI flags into server request options.
+
+    Raises
+    ------
+    PandocServerError
+        If a flag has no server equivalent (e.g. bare switches or filesystem
+        options such as ``--extract-media``).
+    """
+    options: dict[str, str] = {}
+    for arg in extra_args:
+        name, sep, value = arg.partition("=")
+        if not name.startswith("--") or not sep or name == "--extract-media":
+            raise PandocServerError(f"Unsupported pandoc server argument: {arg}")
+        options[name[2:]] = value
+    return options
+
+
+class PandocServer:
+    """A single ``pandoc server`` process plus a keep-alive HTTP connection."""
+
+    def __init__(
+        self,
+        pandoc_path: str,
+        *,
+        startup_timeout: float = 10.0,
+        request_timeout: float = 120.0,
+    ) -> None:
+        self.pandoc_path = pandoc_path
+        self.startup_timeout = startup_timeout
+        self.request_timeout = request_timeout
+        self.port: int | None = None
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._conn: http.client.HTTPConnection | None = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Launch the server and block until it answers the health check."""
+        self.port = _free_port()
+        self._proc = subprocess.Popen(
+            [
+                self.pandoc_path,
+                "server",
+                f"--port={self.port}",
+                f"--timeout={int(self.request_timeout)}",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._proc.poll() is not None:
+                stderr = (
+                    self._proc.stderr.read().decode(errors="replace") if self._proc.stderr else ""
+                )
+                self._proc = None
+                raise PandocServerError(f"pandoc server exited on startup: {stderr.strip()}")
+            if self.healthy():
+                logger.debug("pandoc server ready | port=%s", self.port)
+                return
+            time.sleep(0.05)
+
+        self.stop()
+        raise PandocServerError(f"pandoc server did not become ready on port {self.port}")
+
+    def stop(self) -> None:
+        """Terminate the server process (idempotent)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        if proc.stderr:
+            proc.stderr.close()
+
+    def restart(self) -> None:
+        self.stop()
+        self.start()
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def healthy(self) -> bool:
+        """Return True if the process is alive and ``GET /version`` succeeds."""
+        if not self.running:
+            return False
+        try:
+            status, _ = self._request("GET", "/version", None, timeout=1.0)
+        except (OSError, http.client.HTTPException):
+            self._reset_connection()
+            return False
+        return status == 200
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _reset_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None,
+        *,
+        timeout: float,
+    ) -> tuple[int, bytes]:
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(_HOST, self.port, timeout=timeout)
+        self._conn.timeout = timeout
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        self._conn.request(method, path, body=body, headers=headers)
+        resp = self._conn.getresponse()
+        return resp.status, resp.read()
+
+    def convert(
+        self,
+        data: bytes,
+        *,
+        from_format: str,
+        to_format: str,
+        options: dict[str, str] | None = None,
+    ) -> bytes:
+        """Convert *data* and return the output document bytes."""
+        text = (
+            base64.b64encode(data).decode("ascii")
+            if from_format in BINARY_FORMATS
+            else data.decode("utf-8")
+        )
+        payload = {"text": text, "from": from_format, "to": to_format, **(options or {})}
+        body = json.dumps(payload).encode("utf-8")
+
+        try:
+            status, raw = self._request("POST", "/", body, timeout=self.request_timeout)
+        except (OSError, http.client.HTTPException) as exc:
+            self._reset_connection()
+            raise PandocServerError(f"pandoc server request failed: {exc}") from exc
+
+        if status != 200:
+            raise PandocServerError(
+                f"pandoc server returned HTTP {status}: {raw.decode(errors='replace')}"
+            )
+
+        try:
+            result = json.loads(raw)
+        except ValueError as exc:
+            raise PandocServerError("pandoc server returned a non-JSON response") from exc
+
+        if "error" in result:
+            raise PandocServerError(f"pandoc server error: {result['error']}")
+
+        output = result.get("output", "")
+        if result.get("base64"):
+            return base64.b64decode(output)
+
+        # Match the pandoc CLI, which always terminates text output with a newline.
+        if not output.endswith("\n"):
+            output += "\n"
+        return str(output).encode("utf-8")
+
+
+class PandocServerPool:
+    """Fixed-size pool of warm :class:`PandocServer` instances.
+
+    Usage
+    -----
+    >>> with PandocServerPool(size=4) as pool:
+    ...     md = pool.convert(docx_bytes, from_format="docx", to_format="gfm")
+
+    Servers are checked out exclusively per request, so each keeps a single
+    keep-alive connection. A server that dies mid-run is restarted once on
+    the next checkout; the pool is also stopped at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        *,
+        pandoc_path: str | None = None,
+        startup_timeout: float = 10.0,
+        request_timeout: float = 120.0,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be >= 1")
+
+        self.size = size
+        self.pandoc_path = pandoc_path
+        self.startup_timeout = startup_timeout
+        self.request_timeout = request_timeout
+        self._servers: list[PandocServer] = []
+        self._idle: queue.Queue[PandocServer] = queue.Queue()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> PandocServerPool:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start every server in the pool; stop them all if any fails."""
+        path = self.pandoc_path or get_pandoc_status().path
+        if not path:
+            raise PandocServerError("pandoc executable not found on PATH")
+
+        with self._lock:
+            if self._servers:
+                return
+            try:
+                for _ in range(self.size):
+                    server = PandocServer(
+                        path,
+                        startup_timeout=self.startup_timeout,
+                        request_timeout=self.request_timeout,
+                    )
+                    server.start()
+                    self._servers.append(server)
+                    self._idle.put(server)
+            except PandocServerError:
+                self._stop_all()
+                raise
+
+        atexit.register(self.close)
+        logger.info("pandoc server pool started | size=%s", self.size)
+
+    def close(self) -> None:
+        """Stop every server in the pool (idempotent)."""
+        with self._lock:
+            if not self._servers:
+                return
+            self._stop_all()
+        atexit.unregister(self.close)
+        logger.debug("pandoc server pool stopped")
+
+    def _stop_all(self) -> None:
+        for server in self._servers:
+            server.stop()
+        self._servers.clear()
+        self._idle = queue.Queue()
+
+    def convert(
+        self,
+        data: bytes,
+        *,
+        from_format: str,
+        to_format: str,
+        options: dict[str, str] | None = None,
+    ) -> bytes:
+        """Convert *data* on the next idle server."""
+        server, idle = self._checkout()
+        try:
+            if not server.running:
+                logger.warning("pandoc server on port %s died; restarting", server.port)
+                server.restart()
+            return server.convert(
+                data, from_format=from_format, to_format=to_format, options=options
+            )
+        finally:
+            idle.put(server)
+
+    def _checkout(self) -> tuple[PandocServer, queue.Queue[PandocServer]]:
+        """Wait for an idle server, giving up if the pool is closed meanwhile.
+
+        ``close()`` swaps in a fresh queue, so a caller blocked on the old
+        one would never be woken; poll and re-check under the lock instead.
+        """
+        with self._lock:
+            if not self._servers:
+                raise PandocServerError("pandoc server pool is not running")
+            idle = self._idle
+
+        while True:
+            try:
+                return idle.get(timeout=_CHECKOUT_POLL), idle
+            except queue.Empty:
+                pass
+            with self._lock:
+                if not self._servers or self._idle is not idle:
+                    raise PandocServerError("pandoc server pool was closed")
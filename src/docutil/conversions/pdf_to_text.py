@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from docutil.conversions.cache import file_digest
+from docutil.conversions.engine import active_cache
+from docutil.inspect.pdf_extract import PageSpec, iter_pdf_pages
+from docutil.profiling import span
+from docutil.utils.files import chmod_default
+
+logger = logging.getLogger(__name__)
+
+
+def pdf_to_text(
+    input_path: Path | str,
+    output_path: Path | str | None = None,
+    *,
+    pages: PageSpec = None,
+    workers: int = 1,
+) -> Path:
+    """
+    Extract the text of a PDF into a UTF-8 .txt file.
+
+    Pages are streamed straight to disk (joined by a newline) and the file
+    is replaced atomically, so memory stays bounded by one page. Inside a
+    ``conversion_cache`` block (e.g. ``batch_convert(cache=...)``) the text
+    is cached by the PDF's content hash, the PyMuPDF version and the page
+    selection, so unchanged PDFs are never extracted twice.
+
+    Requires PyMuPDF:
+      pip install ".[pdf]"
+
+    Returns
+    -------
+    Path
+        Path to generated text file
+    """
+    input_path = Path(input_path).expanduser()
+
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+
+    if input_path.suffix.lower() != ".pdf":
+        raise ValueError("Input file must be a .pdf document.")
+
+    output_path = Path(output_path).resolve() if output_path else input_path.with_suffix(".txt")
+
+    logger.info("PDF → Text | %s → %s", input_path.name, output_path.name)
+
+    if pages is not None and not isinstance(pages, (str, int)):
+        pages = list(pages)  # iterated twice: cache key and extraction
+
+    cache = active_cache()
+    key: str | None = None
+    if cache is not None:
+        with span("cache.lookup"):
+            key = cache.make_key(
+                file_digest(input_path),
+                pandoc_version=None,
+                to="txt",
+                format="pdf",
+                extra_args=[f"pymupdf={_pymupdf_version()}", f"pages={_spec_key(pages)}"],
+            )
+            hit = cache.get(key, output_path)
+        if hit:
+            return output_path
+
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=output_path.name, suffix=".tmp")
+    try:
+        with span("pdf.extract"), os.fdopen(fd, "w", encoding="utf-8", newline="\n") as fh:
+            for n, page in enumerate(iter_pdf_pages(input_path, pages=pages, workers=workers)):
+                if n:
+                    fh.write("\n")
+                fh.write(page.text)
+        chmod_default(tmp_name)  # mkstemp creates 0600
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    if cache is not None and key is not None:
+        with span("cache.store"):
+            cache.put(key, output_path)
+
+    return output_path
+
+
+def _pymupdf_version() -> str:
+    try:
+        import fitz
+    except Exception:
+        return "unknown"
+    return str(fitz.VersionBind)
+
+
+def _spec_key(pages: PageSpec) -> str:
+    if pages is None or isinstance(pages, (str, int)):
+        return str(pages)
+    return ",".join(map(str, pages))
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+"""Batch Report
+
+Structured, per-file account of a :func:`batch_convert` run.
+
+Statuses
+--------
+- ``converted``: the converter ran and produced an output
+- ``skipped``: the output already existed and was not overwritten
+- ``unchanged``: incremental mode found the source unchanged
+- ``resumed``: already converted by an interrupted run (``resume=True``)
+- ``dry_run``: planned only
+- ``failed``: the converter raised (after any retries)
+
+The report serializes to JSON (``BatchReport.write_json``) for CI
+artifacts and dashboards.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+FileStatus = Literal["converted", "skipped", "unchanged", "resumed", "dry_run", "failed"]
+
+
+@dataclass(frozen=True)
+class FileResult:
+    """Outcome of one source file."""
+
+    source: str
+    status: FileStatus
+    output: str | None = None
+    duration: float = 0.0
+    input_bytes: int = 0
+    output_bytes: int = 0
+    attempts: int = 1
+    error: str | None = None
+    stderr: str | None = None
+
+
+@dataclass
+class BatchReport:
+    """Thread-safe collection of :class:`FileResult` plus aggregate metrics."""
+
+    results: list[FileResult] = field(default_factory=list)
+    started: float = field(default_factory=time.time)
+    finished: float | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, result: FileResult) -> None:
+        with self._lock:
+            self.results.append(result)
+
+    def finish(self) -> None:
+        self.finished = time.time()
+
+    def count(self, status: FileStatus) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def converted(self) -> int:
+        return self.count("converted")
+
+    @property
+    def failed(self) -> int:
+        return self.count("failed")
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.time()) - self.started
+
+    @property
+    def input_bytes(self) -> int:
+        return sum(r.input_bytes for r in self.results if r.status == "converted")
+
+    @property
+    def output_bytes(self) -> int:
+        return sum(r.output_bytes for r in self.results if r.status == "converted")
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregate counts and throughput (files/s and bytes/s of converted input)."""
+        elapsed = self.elapsed
+        statuses: tuple[FileStatus, ...] = (
+            "converted",
+            "skipped",
+            "unchanged",
+            "resumed",
+            "dry_run",
+            "failed",
+        )
+        return {
+            "files": len(self.results),
+            **{status: self.count(status) for status in statuses},
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "elapsed_seconds": round(elapsed, 3),
+            "files_per_second": round(self.converted / elapsed, 3) if elapsed > 0 else 0.0,
+            "input_bytes_per_second": round(self.input_bytes / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            files = [asdict(r) for r in sorted(self.results, key=lambda r: r.source)]
+        return {"summary": self.summary(), "files": files}
+
+    def write_json(self, path: Path | str) -> Path:
+        """Atomically write the report as JSON and return its path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(self.to_dict(), fh, indent=2)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+"""Watch Mode
+
+Continuously reconvert files as they change.
+
+Design
+------
+- Event source: Linux inotify (via ``ctypes``, no extra dependency) when
+  available, otherwise a stat-based polling snapshot.
+- Debounce: changes are collected until the folder has been quiet for
+  ``debounce`` seconds, so editor save bursts trigger one conversion.
+- Coalescing: pending changes are a set of paths; duplicate events for the
+  same file collapse into a single conversion.
+- Idle cost: the inotify watcher blocks in ``select``; the polling watcher
+  sleeps between scans. Neither spins while nothing changes.
+
+Output paths are resolved exactly like :func:`batch_convert`
+(:func:`~docutil.conversions.batch.build_output_path`).
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Protocol
+
+from docutil.conversions.batch import build_output_path, iter_files
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class Watcher(Protocol):
+    def wait(self, timeout: float | None) -> set[Path]:
+        """Block up to *timeout* seconds and return the paths that changed."""
+
+    def close(self) -> None: ...
+
+
+def _matches(path: Path, suffix: str) -> bool:
+    return path.name.endswith(suffix)
+
+
+def _iter_dirs(folder: Path, recursive: bool) -> Iterable[Path]:
+    yield folder
+    if recursive:
+        for root, dirs, _ in os.walk(folder):
+            for d in dirs:
+                yield Path(root) / d
+
+
+class PollingWatcher:
+    """Portable watcher that diffs ``(mtime_ns, size)`` snapshots."""
+
+    def __init__(
+        self,
+        folder: Path,
+        suffix: str,
+        *,
+        recursive: bool = False,
+        interval: float = 1.0,
+    ) -> None:
+        self.folder = folder
+        self.suffix = suffix
+        self.recursive = recursive
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snap: dict[Path, tuple[int, int]] = {}
+        for path in iter_files(self.folder, self.suffix, self.recursive):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snap[path] = (st.st_mtime_ns, st.st_size)
+        return snap
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        current = self._scan()
+        changed = {p for p, sig in current.items() if self._snapshot.get(p) != sig}
+        self._snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher (recursive via one watch per directory)."""
+
+    def __init__(self, folder: Path, suffix: str, *, recursive: bool = False) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "libc has no inotify support")
+
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        self.fd: int = fd
+        self.folder = folder
+        self.suffix = suffix
+        self.recursive = recursive
+        self._dirs: dict[int, Path] = {}
+
+        for d in _iter_dirs(folder, recursive):
+            self._add_watch(d)
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            logger.warning("Cannot watch %s: %s", directory, os.strerror(err))
+            return
+        self._dirs[wd] = directory
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: set[Path] = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            self._parse(buf, changed)
+        return changed
+
+    def _parse(self, buf: bytes, changed: set[Path]) -> None:
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = buf[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                logger.warning("inotify queue overflow; rescanning %s", self.folder)
+                changed.update(iter_files(self.folder, self.suffix, self.recursive))
+                continue
+
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+
+            directory = self._dirs.get(wd)
+            if directory is None or not raw_name:
+                continue
+
+            path = directory / os.fsdecode(raw_name)
+
+            if mask & _IN_ISDIR:
+                if self.recursive and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    # Watch the new subtree and pick up files written before the
+                    # watch was in place.
+                    for d in _iter_dirs(path, True):
+                        self._add_watch(d)
+                    changed.update(iter_files(path, self.suffix, True))
+                continue
+
+            # IN_CREATE alone is not a finished write; wait for IN_CLOSE_WRITE.
+            if mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                changed.add(path)
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def make_watcher(
+    folder: Path,
+    suffix: str,
+    *,
+    recursive: bool = False,
+    poll_interval: float = 1.0,
+    polling: bool = False,
+) -> Watcher:
+    """Return an inotify watcher when possible, otherwise a polling watcher."""
+    if not polling:
+        try:
+            return InotifyWatcher(folder, suffix, recursive=recursive)
+        except OSError as exc:
+            logger.info("inotify unavailable (%s); falling back to polling", exc)
+    return PollingWatcher(folder, suffix, recursive=recursive, interval=poll_interval)
+
+
+def watch_convert(
+    input_folder: Path | str,
+    input_suffix: str,
+    converter: Callable[[Path, Path | None], Path],
+    *,
+    output_folder: Path | str | None = None,
+    output_suffix: str | None = None,
+    recursive: bool = False,
+    versioned: bool = False,
+    debounce: float = 0.25,
+    poll_interval: float = 1.0,
+    polling: bool = False,
+    stop_event: threading.Event | None = None,
+    on_converted: Callable[[list[Path]], None] | None = None,
+) -> None:
+    """Watch *input_folder* and reconvert matching files as they change.
+
+    Runs until interrupted (Ctrl+C) or *stop_event* is set.
+
+    Parameters
+    ----------
+    input_folder, input_suffix, converter, output_folder, output_suffix, recursive, versioned
+        Same meaning as for :func:`batch_convert`. Changed files always overwrite
+        their previous output (unless *versioned*).
+    debounce
+        Quiet period (seconds) required before a burst of changes is converted.
+    poll_interval
+        Scan interval for the polling fallback.
+    polling
+        Force the polling watcher even if inotify is available.
+    stop_event
+        Optional event to stop watching (used by tests and embedding callers).
+    on_converted
+        Optional callback receiving the outputs of each conversion round.
+    """
+    input_folder = Path(input_folder).resolve()
+
+    if not input_folder.exists():
+        raise FileNotFoundError(input_folder)
+
+    if output_folder and not output_suffix:
+        raise ValueError("output_suffix is required when output_folder is provided.")
+
+    out_root = Path(output_folder).resolve() if output_folder else None
+    stop = stop_event or threading.Event()
+
+    watcher = make_watcher(
+        input_folder,
+        input_suffix,
+        recursive=recursive,
+        poll_interval=poll_interval,
+        polling=polling,
+    )
+    logger.info(
+        "Watching | folder=%s | suffix=%s | recursive=%s | watcher=%s",
+        input_folder,
+        input_suffix,
+        recursive,
+        type(watcher).__name__,
+    )
+
+    def convert(paths: set[Path]) -> None:
+        outputs: list[Path] = []
+        for src in sorted(paths):
+            if not src.is_file():
+                continue
+            try:
+                out = build_output_path(
+                    src, input_folder, out_root, output_suffix, versioned=versioned
+                )
+                outputs.append(converter(src, out))
+            except Exception:
+                logger.exception("Conversion failed: %s", src)
+        if on_converted is not None and outputs:
+            on_converted(outputs)
+
+    pending: set[Path] = set()
+    last_change = 0.0
+    try:
+        while not stop.is_set():
+            if pending:
+                remaining = debounce - (time.monotonic() - last_change)
+                if remaining <= 0:
+                    batch, pending = pending, set()
+                    logger.info("Change detected | files=%s", len(batch))
+                    convert(batch)
+                    continue
+                timeout = remaining
+            else:
+                # Idle: wake at most once a second to honour stop_event.
+                timeout = 1.0
+
+            changed = {p for p in watcher.wait(timeout) if _matches(p, input_suffix)}
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+    except KeyboardInterrupt:
+        logger.info("Watch stopped")
+    finally:
+        watcher.close()
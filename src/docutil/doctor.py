@@ -21,7 +21,6 @@ docutil doctor
 """
 
 import platform
-import shutil
 from pathlib import Path
 
 from docutil.pandoc_utils import get_pandoc_status
@@ -60,4 +59,4 @@ def run_doctor() -> None:
         print("Write permissions: ✗")
 
     # PATH
-    print(f"pandoc path: {shutil.which('pandoc')}")
+    print(f"pandoc path: {status.path}")
@@ -15,5 +15,25 @@ class InvalidInputError(DocutilError):
     """Raised when user input is invalid."""
 
 
-class ConversionError(DocutilError):
-    """Raised when a document conversion fails."""
+class ConversionError(DocutilError, RuntimeError):
+    """Raised when a document conversion fails.
+
+    ``stderr`` carries pandoc's diagnostic output when available. Also a
+    ``RuntimeError``, which is what pypandoc raised before conversions were
+    wrapped, so existing ``except RuntimeError`` handlers keep working.
+    """
+
+    def __init__(self, message: str, *, stderr: str | None = None) -> None:
+        super().__init__(message)
+        self.stderr = stderr
+
+
+class PandocServerError(ConversionError):
+    """Raised when a pandoc server instance cannot be started or queried."""
+
+
+class UnsupportedContentError(DocutilError):
+    """Raised by an in-process fast path for content it cannot reproduce exactly.
+
+    Callers fall back to pandoc when they see it.
+    """
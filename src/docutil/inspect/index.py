@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+"""Metadata Index
+
+Persistent SQLite index of DOCX metadata, so repeated audits are answered
+without opening a single document.
+
+Layout
+------
+One database (default: ``<cache dir>/index.sqlite``) holds:
+
+- ``roots``: folders that were indexed, with their scan options
+- ``documents``: one row per DOCX (absolute path) with every
+  :class:`DocxMetadata` field, plus size, mtime and SHA-256
+
+Refresh
+-------
+``build`` (re)inspects every file under a folder. ``update`` rescans the
+registered folders and only re-inspects a file when:
+
+1. size or mtime changed, and
+2. its content hash differs from the stored one (a touched but unedited
+   file just gets its mtime refreshed)
+
+Files that disappeared are dropped. Reading and hashing run on a thread
+pool; all database writes happen on the calling thread in batched
+transactions.
+
+Timestamps are stored in the UTC ``str(datetime)`` form produced by
+:func:`inspect_docx_metadata`, which sorts lexicographically, so date-range
+queries are plain indexed string comparisons.
+"""
+
+import json
+import logging
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from pathlib import Path
+
+from docutil.conversions.batch import iter_files
+from docutil.conversions.cache import default_cache_dir, file_digest
+from docutil.inspect.docx_metadata import (
+    DocxMetadata,
+    InspectFailure,
+    inspect_docx_metadata,
+)
+from docutil.utils.concurrency import ordered_map
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "index.sqlite"
+SCHEMA_VERSION = 1
+
+# Rows are written in transactions of this many files.
+_COMMIT_EVERY = 500
+
+_META_FIELDS = [f.name for f in fields(DocxMetadata)]
+_COLUMNS = ["root", *_META_FIELDS, "size", "mtime_ns", "sha256", "error"]
+_UPSERT = (
+    f"INSERT OR REPLACE INTO documents ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_COLUMNS))})"
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY,
+    recursive INTEGER NOT NULL,
+    exclude TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    title TEXT,
+    author TEXT COLLATE NOCASE,
+    last_modified_by TEXT COLLATE NOCASE,
+    created TEXT,
+    modified TEXT,
+    application TEXT,
+    company TEXT,
+    pages INTEGER,
+    words INTEGER,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_root ON documents (root);
+CREATE INDEX IF NOT EXISTS documents_author ON documents (author);
+CREATE INDEX IF NOT EXISTS documents_modified ON documents (modified);
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+
+def default_index_path() -> Path:
+    """Location of the index when no ``--db`` is given."""
+    return default_cache_dir() / INDEX_NAME
+
+
+def normalize_timestamp(value: str) -> str:
+    """Turn a user-supplied ISO date/time into the stored UTC form.
+
+    Naive values are taken as UTC, so ``2024-03-01`` becomes
+    ``2024-03-01 00:00:00+00:00``.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError as exc:
+        raise ValueError(f"Invalid date/time: {value!r}") from exc
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return str(parsed.astimezone(timezone.utc))
+
+
+@dataclass(frozen=True)
+class IndexStats:
+    """Outcome of a build or update."""
+
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failed: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.added} added, {self.updated} updated, {self.unchanged} unchanged, "
+            f"{self.removed} removed, {self.failed} failed"
+        )
+
+
+@dataclass(frozen=True)
+class _Scan:
+    """What a worker learned about one file."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    sha256: str
+    record: DocxMetadata | InspectFailure | None  # None: content unchanged
+
+
+def _scan(path: Path, known_sha256: str | None) -> _Scan | None:
+    try:
+        st = path.stat()
+        digest = file_digest(path)
+    except OSError:
+        return None  # deleted while scanning
+    record: DocxMetadata | InspectFailure | None = None
+    if digest != known_sha256:
+        try:
+            record = inspect_docx_metadata(path, include_app=True)
+        except (OSError, ValueError) as exc:
+            record = InspectFailure(path=str(path), error=str(exc))
+    return _Scan(path, st.st_size, st.st_mtime_ns, digest, record)
+
+
+# ----------------------------------------------------------------------
+# Index
+# ----------------------------------------------------------------------
+
+
+class MetadataIndex:
+    """SQLite-backed DOCX metadata index.
+
+    Parameters
+    ----------
+    path
+        Database file (default: :func:`default_index_path`).
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path).expanduser() if path else default_index_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode = WAL")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self._db.close()
+            raise ValueError(f"Unsupported index schema version {version}: {self.path}")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> MetadataIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def roots(self) -> list[Path]:
+        """Folders registered with :meth:`build`."""
+        return [Path(r["path"]) for r in self._db.execute("SELECT path FROM roots ORDER BY path")]
+
+    def build(
+        self,
+        folder: Path | str,
+        *,
+        recursive: bool = False,
+        exclude: Iterable[str] = (),
+        workers: int = 8,
+    ) -> IndexStats:
+        """Register *folder* and (re)inspect every DOCX under it."""
+        root = Path(folder).resolve()
+        if not root.is_dir():
+            raise NotADirectoryError(f"Input folder not found: {root}")
+
+        exclude = list(exclude)
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO roots VALUES (?, ?, ?)",
+                (str(root), int(recursive), json.dumps(exclude)),
+            )
+        return self._refresh(root, recursive, exclude, workers, force=True)
+
+    def update(self, folder: Path | str | None = None, *, workers: int = 8) -> IndexStats:
+        """Re-inspect changed files under *folder*, or under every registered root."""
+        if folder is None:
+            targets = list(self._db.execute("SELECT * FROM roots ORDER BY path"))
+        else:
+            root = Path(folder).resolve()
+            targets = list(self._db.execute("SELECT * FROM roots WHERE path = ?", (str(root),)))
+            if not targets:
+                raise ValueError(f"Folder is not indexed (run `docutil index build` first): {root}")
+
+        totals: dict[str, int] = {}
+        for row in targets:
+            stats = self._refresh(
+                Path(row["path"]),
+                bool(row["recursive"]),
+                json.loads(row["exclude"]),
+                workers,
+                force=False,
+            )
+            for key, value in stats.__dict__.items():
+                totals[key] = totals.get(key, 0) + value
+        return IndexStats(**totals)
+
+    def _refresh(
+        self, root: Path, recursive: bool, exclude: Sequence[str], workers: int, *, force: bool
+    ) -> IndexStats:
+        known = {
+            r["path"]: (r["size"], r["mtime_ns"], r["sha256"])
+            for r in self._db.execute(
+                "SELECT path, size, mtime_ns, sha256 FROM documents WHERE root = ?", (str(root),)
+            )
+        }
+        seen: set[str] = set()
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "failed": 0}
+
+        def changed() -> Iterator[tuple[Path, str | None]]:
+            # Runs on the calling thread: stat only, hashing happens in workers.
+            if not root.is_dir():
+                return
+            for path in iter_files(root, ".docx", recursive, exclude=exclude):
+                key = str(path.resolve())
+                seen.add(key)
+                entry = known.get(key)
+                if entry is None or force:
+                    yield path, None
+                    continue
+                try:
+                    st = path.stat()
+                except OSError:
+                    seen.discard(key)
+                    continue
+                if (st.st_size, st.st_mtime_ns) == entry[:2]:
+                    counts["unchanged"] += 1
+                else:
+                    yield path, entry[2]
+
+        if not root.is_dir():
+            logger.warning("Index root is missing, dropping its entries: %s", root)
+
+        pending = 0
+        ex = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="docutil-index")
+        scans = ordered_map(ex, lambda item: _scan(*item), changed(), workers * 4)
+        try:
+            for scan in scans:
+                if scan is None:
+                    continue
+                key = str(scan.path.resolve())
+                if scan.record is None:
+                    self._db.execute(
+                        "UPDATE documents SET size = ?, mtime_ns = ? WHERE path = ?",
+                        (scan.size, scan.mtime_ns, key),
+                    )
+                    counts["unchanged"] += 1
+                else:
+                    self._db.execute(_UPSERT, self._row(key, str(root), scan))
+                    if isinstance(scan.record, InspectFailure):
+                        counts["failed"] += 1
+                    elif key in known:
+                        counts["updated"] += 1
+                    else:
+                        counts["added"] += 1
+                pending += 1
+                if pending >= _COMMIT_EVERY:
+                    self._db.commit()
+                    pending = 0
+
+            gone = [(path,) for path in known if path not in seen]
+            self._db.executemany("DELETE FROM documents WHERE path = ?", gone)
+            counts["removed"] = len(gone)
+            self._db.commit()
+        except BaseException:
+            self._db.rollback()
+            raise
+        finally:
+            ex.shutdown(cancel_futures=True)
+
+        stats = IndexStats(**counts)
+        logger.info("Index | %s | %s", root, stats)
+        return stats
+
+    @staticmethod
+    def _row(key: str, root: str, scan: _Scan) -> tuple[object, ...]:
+        record = scan.record
+        meta = record if isinstance(record, DocxMetadata) else None
+        values = [getattr(meta, name) if meta else None for name in _META_FIELDS]
+        values[0] = key
+        error = record.error if isinstance(record, InspectFailure) else None
+        return (root, *values, scan.size, scan.mtime_ns, scan.sha256, error)
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        *,
+        author: str | None = None,
+        title: str | None = None,
+        modified_after: str | None = None,
+        modified_before: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[DocxMetadata]:
+        """Yield indexed documents matching every given filter, by path.
+
+        ``author`` / ``title`` match case-insensitively; ``*`` is a wildcard.
+        ``modified_after`` is inclusive and ``modified_before`` exclusive;
+        both accept any ISO 8601 date or date-time (naive values are UTC).
+        Files that could not be inspected are never returned.
+        """
+        clauses = ["error IS NULL"]
+        params: list[object] = []
+        if author is not None:
+            clauses.append(_match("author", author, params))
+        if title is not None:
+            clauses.append(_match("title", title, params))
+        if modified_after is not None:
+            clauses.append("modified >= ?")
+            params.append(normalize_timestamp(modified_after))
+        if modified_before is not None:
+            clauses.append("modified < ?")
+            params.append(normalize_timestamp(modified_before))
+
+        sql = (
+            f"SELECT {', '.join(_META_FIELDS)} FROM documents "
+            f"WHERE {' AND '.join(clauses)} ORDER BY path"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        for row in self._db.execute(sql, params):
+            yield DocxMetadata(**dict(row))
+
+    def failures(self) -> list[InspectFailure]:
+        """Indexed files that could not be inspected."""
+        rows = self._db.execute(
+            "SELECT path, error FROM documents WHERE error IS NOT NULL ORDER BY path"
+        )
+        return [InspectFailure(path=r["path"], error=r["error"]) for r in rows]
+
+
+def _match(column: str, pattern: str, params: list[object]) -> str:
+    if "*" not in pattern:
+        params.append(pattern)
+        return f"{column} = ? COLLATE NOCASE"
+    escaped = pattern.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    params.append(escaped.replace("*", "%"))
+    return f"{column} LIKE ? ESCAPE '\\'"
@@ -1,11 +1,51 @@
 from __future__ import annotations
 
+"""PDF Text Extraction
+
+Page-at-a-time text extraction built on PyMuPDF.
+
+:func:`iter_pdf_pages` is a generator: each page is loaded, its text
+extracted and the page released before the next one is touched, so peak
+memory is bounded by one page whatever the document size. Closing the
+generator early (``break``, ``islice``) closes the document.
+
+Parallel mode
+-------------
+With ``workers > 1`` the selected pages are split into small contiguous
+chunks that a process pool extracts concurrently; every worker process
+opens its own PyMuPDF handle once. Chunks are reassembled in page order
+and only a few are in flight at a time, so output is byte-identical to
+the sequential path and memory stays bounded by the in-flight chunks.
+
+Page ranges
+-----------
+``pages=`` takes 1-based page numbers as a string (``"1-3,7,10-"``), a
+single ``int``, or any iterable of ints (e.g. ``range(1, 11)``). Pages are
+extracted once each, in ascending order.
+"""
+
+import json
 import logging
-from dataclasses import dataclass
+import os
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import IO, Any
+
+from docutil.utils.concurrency import ordered_map
+from docutil.utils.files import chmod_default
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on pages per parallel work item: large enough to amortise
+# the IPC round trip, small enough to spread a document over every worker.
+_MAX_CHUNK = 32
+
+PageSpec = str | int | Iterable[int] | None
+
 
 @dataclass(frozen=True)
 class PdfExtractResult:
@@ -14,13 +54,56 @@ class PdfExtractResult:
     text: str
 
 
-def extract_pdf_text(input_path: Path | str) -> PdfExtractResult:
-    """
-    Extract text from a PDF (best-effort).
+@dataclass(frozen=True)
+class PdfPage:
+    """Text of one page; ``page`` is 1-based."""
 
-    Requires PyMuPDF:
-      pip install ".[pdf]"
+    path: str
+    page: int
+    text: str
+
+
+def parse_page_spec(pages: PageSpec, page_count: int) -> list[range]:
+    """Resolve *pages* into sorted, non-overlapping 0-based index ranges.
+
+    Raises ValueError for malformed specs and for pages that do not exist.
     """
+    if pages is None:
+        return [range(page_count)] if page_count else []
+
+    wanted: list[tuple[int, int]] = []  # inclusive 1-based (first, last)
+    if isinstance(pages, int):
+        wanted.append((pages, pages))
+    elif isinstance(pages, str):
+        for part in pages.replace(" ", "").split(","):
+            if not part:
+                continue
+            first, sep, last = part.partition("-")
+            try:
+                lo = int(first) if first else 1
+                hi = (int(last) if last else page_count) if sep else lo
+            except ValueError as exc:
+                raise ValueError(f"Invalid page range: {part!r}") from exc
+            wanted.append((lo, hi))
+    else:
+        wanted.extend((n, n) for n in pages)
+
+    for lo, hi in wanted:
+        if lo < 1 or hi < lo:
+            raise ValueError(f"Invalid page range: {lo}-{hi}")
+        if hi > page_count:
+            raise ValueError(f"Page {hi} out of range (document has {page_count} pages)")
+
+    merged: list[range] = []
+    for lo, hi in sorted(wanted):
+        if merged and lo - 1 <= merged[-1].stop:
+            merged[-1] = range(merged[-1].start, max(merged[-1].stop, hi))
+        else:
+            merged.append(range(lo - 1, hi))
+    return merged
+
+
+def _open_pdf(input_path: Path | str) -> tuple[Path, Any]:
     input_path = Path(input_path).resolve()
 
     if not input_path.exists():
@@ -34,15 +117,146 @@ def extract_pdf_text(input_path: Path | str) -> PdfExtractResult:
     except Exception as exc:
         raise RuntimeError("PyMuPDF not installed. Install with: pip install '.[pdf]'") from exc
 
-    doc = fitz.open(str(input_path))
-    pages = doc.page_count
+    return input_path, fitz.open(str(input_path))
+
+
+def iter_pdf_pages(
+    input_path: Path | str, *, pages: PageSpec = None, workers: int = 1
+) -> Iterator[PdfPage]:
+    """
+    Yield the text of each selected page of a PDF, one page at a time.
+
+    Requires PyMuPDF:
+      pip install ".[pdf]"
+
+    Parameters
+    ----------
+    input_path
+        PDF file to read.
+    pages
+        1-based page selection (see module docs); default: every page.
+    workers
+        Processes extracting pages concurrently (1 = in this process).
+    """
+    input_path, doc = _open_pdf(input_path)
+    try:
+        spans = parse_page_spec(pages, doc.page_count)
+        if workers > 1 and sum(map(len, spans)) > 1:
+            doc.close()  # each worker process opens its own handle
+            yield from _iter_parallel(input_path, spans, workers)
+            return
+        for span in spans:
+            for i in span:
+                yield PdfPage(path=str(input_path), page=i + 1, text=_page_text(doc, i))
+    finally:
+        if not doc.is_closed:
+            doc.close()
+
+
+def _page_text(doc: Any, index: int) -> str:
+    page = doc.load_page(index)
+    return str(page.get_text("text"))
+
+
+# ----------------------------------------------------------------------
+# Parallel mode
+# ----------------------------------------------------------------------
+
+_worker_doc: Any = None
+
+
+def _init_worker(path: str) -> None:
+    global _worker_doc
+    import fitz
+
+    _worker_doc = fitz.open(path)
+
+
+def _extract_chunk(chunk: range) -> list[str]:
+    return [_page_text(_worker_doc, i) for i in chunk]
+
+
+def _chunks(spans: list[range], workers: int) -> Iterator[range]:
+    total = sum(map(len, spans))
+    size = max(1, min(_MAX_CHUNK, total // (workers * 4)))
+    for span in spans:
+        for start in range(span.start, span.stop, size):
+            yield range(start, min(start + size, span.stop))
+
+
+def _iter_parallel(path: Path, spans: list[range], workers: int) -> Iterator[PdfPage]:
+    chunks = list(_chunks(spans, workers))
+    ex = ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)), initializer=_init_worker, initargs=(str(path),)
+    )
+    try:
+        results = ordered_map(ex, _extract_chunk, chunks, workers * 2)
+        for chunk, texts in zip(chunks, results, strict=True):
+            for i, text in zip(chunk, texts, strict=True):
+                yield PdfPage(path=str(path), page=i + 1, text=text)
+    finally:
+        ex.shutdown(cancel_futures=True)
+
 
+def write_pdf_jsonl(
+    input_path: Path | str,
+    output: Path | str | IO[str] | None = None,
+    *,
+    pages: PageSpec = None,
+    workers: int = 1,
+) -> int:
+    """
+    Stream selected pages as JSON Lines (one ``PdfPage`` object per line).
+
+    *output* may be a path (written atomically), an open text stream, or
+    None for stdout. Returns the number of pages written.
+    """
+    if output is None or not isinstance(output, (str, Path)):
+        return _dump_pages(
+            iter_pdf_pages(input_path, pages=pages, workers=workers), output or sys.stdout
+        )
+
+    path = Path(output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as fh:
+            count = _dump_pages(iter_pdf_pages(input_path, pages=pages, workers=workers), fh)
+        chmod_default(tmp_name)  # mkstemp creates 0600
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return count
+
+
+def _dump_pages(pages: Iterable[PdfPage], fh: IO[str]) -> int:
+    count = 0
+    for page in pages:
+        fh.write(json.dumps(asdict(page), ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def extract_pdf_text(
+    input_path: Path | str, *, pages: PageSpec = None, workers: int = 1
+) -> PdfExtractResult:
+    """
+    Extract text from a PDF (best-effort).
+
+    Builds the whole text in memory; prefer :func:`iter_pdf_pages` for
+    large documents. ``pages`` in the result is the number of pages read;
+    ``workers > 1`` extracts pages on a process pool.
+
+    Requires PyMuPDF:
+      pip install ".[pdf]"
+    """
     chunks: list[str] = []
-    for i in range(pages):
-        page = doc.load_page(i)
-        chunks.append(page.get_text("text"))
+    path = str(Path(input_path).resolve())
+    for page in iter_pdf_pages(input_path, pages=pages, workers=workers):
+        chunks.append(page.text)
 
     text = "\n".join(chunks).strip()
-    logger.info("PDF extracted: %s pages", pages)
+    logger.info("PDF extracted: %s pages", len(chunks))
 
-    return PdfExtractResult(path=str(input_path), pages=pages, text=text)
+    return PdfExtractResult(path=path, pages=len(chunks), text=text)
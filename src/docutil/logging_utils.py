@@ -4,59 +4,285 @@ from __future__ import annotations
 Logging Utilities
 ================
 
-Provides consistent, idempotent logging configuration for both:
+The single logging setup for docutil, used by the CLI and available to
+library callers.
 
-• CLI usage
-• library imports
-• test environments
+Threads never write to the console or the log file themselves:
+:func:`configure_logging` installs one queue handler on the root logger and
+a :class:`~logging.handlers.QueueListener` thread owns the real (console /
+file) handlers. Worker threads only format the message and enqueue the
+record, so they do not contend on the sinks' locks or wait on a slow
+terminal.
 
 Design Goals
 ------------
-• No duplicate handlers
-• Safe to call multiple times
+• No duplicate handlers; safe to call multiple times
+• Non-blocking for worker threads
 • Optional file logging
-• Human-readable format
+• Human-readable text or JSON Lines (one object per record)
+• Per-batch sampling (:func:`sampled_logging`) so huge runs stay readable
 """
 
+import atexit
+import json
 import logging
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
 
 DEFAULT_FMT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 
+LogFormat = Literal["text", "json"]
+
+logger = logging.getLogger(__name__)
+
+# Attributes every LogRecord has; anything else came in through ``extra=``.
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects (JSON Lines).
+
+    Keys: ``ts`` (UTC, ISO 8601 with milliseconds), ``level``, ``logger``,
+    ``message``, ``thread``, plus ``exc`` / ``stack`` when present and any
+    ``extra=`` fields not starting with an underscore.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key not in data and not key.startswith("_"):
+                data[key] = value
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.Handler):
+    """Root handler that hands records to a :class:`QueueListener` thread.
+
+    It does what :class:`logging.handlers.QueueHandler` does, with two
+    differences:
+
+    - ``prepare`` keeps the exception text and ``extra=`` fields instead of
+      formatting the whole record into ``msg``, so :class:`JsonFormatter`
+      still has structured data to work with;
+    - the listener (and :mod:`logging.handlers`, which pulls in socket and
+      pickle) starts with the first record, so commands that never log,
+      such as ``docutil version``, pay nothing for it.
+    """
+
+    def __init__(self, sinks: list[logging.Handler]) -> None:
+        super().__init__()
+        self.sinks = sinks
+        self.queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self.listener: QueueListener | None = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(vars(record))
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.listener is None:  # handle() holds self.lock, so this runs once
+                from logging.handlers import QueueListener
+
+                self.listener = QueueListener(self.queue, *self.sinks, respect_handler_level=True)
+                self.listener.start()
+            self.queue.put_nowait(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Drain the queue, stop the listener and close the sinks."""
+        self.acquire()
+        try:
+            listener, self.listener = self.listener, None
+        finally:
+            self.release()
+        if listener is not None:
+            listener.stop()
+        for sink in self.sinks:
+            sink.close()
+        super().close()
+
+
+_lock = threading.Lock()
+_handler: _QueueHandler | None = None
+_atexit_registered = False
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and remove the handlers installed by :func:`configure_logging`.
+
+    Registered with :mod:`atexit`; call it directly to flush early.
+    """
+    global _handler
+
+    with _lock:
+        handler, _handler = _handler, None
+
+    if handler is not None:
+        logging.getLogger().removeHandler(handler)
+        handler.close()
+
 
 def configure_logging(
     *,
     level: int = logging.INFO,
     log_file: Path | str | None = None,
+    fmt: LogFormat = "text",
 ) -> logging.Logger:
     """
-    Configure console + optional file logging.
+    Route all logging through a background queue to the console (stderr)
+    and, optionally, *log_file*.
+
+    Parameters
+    ----------
+    level
+        Root logger level.
+    log_file
+        Also append records to this file (parent folders are created).
+    fmt
+        ``"text"`` (``DEFAULT_FMT``) or ``"json"`` (:class:`JsonFormatter`,
+        one object per line), for both console and file.
 
-    Safe to call repeatedly (idempotent).
+    Calling it again replaces the previous configuration (after flushing
+    it), so the handlers are never duplicated. Handlers installed by
+    others, e.g. pytest's, are left alone.
     """
+    global _handler, _atexit_registered
+
+    shutdown_logging()
+
+    formatter = JsonFormatter() if fmt == "json" else logging.Formatter(DEFAULT_FMT)
+    sinks: list[logging.Handler] = [logging.StreamHandler()]
+    if log_file:
+        path = Path(log_file).resolve()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sinks.append(logging.FileHandler(path, encoding="utf-8"))
+    for sink in sinks:
+        sink.setFormatter(formatter)
 
+    handler = _QueueHandler(sinks)
     root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(handler)
 
-    # ------------------------------------------------------------------
-    # Prevent duplicate handlers (important for CLI + tests)
-    # ------------------------------------------------------------------
+    with _lock:
+        _handler = handler
+        if not _atexit_registered:
+            atexit.register(shutdown_logging)
+            _atexit_registered = True
 
-    if not root.handlers:
-        console = logging.StreamHandler()
-        console.setFormatter(logging.Formatter(DEFAULT_FMT))
-        root.addHandler(console)
+    return root
 
-    root.setLevel(level)
 
-    # ------------------------------------------------------------------
-    # Optional file logging
-    # ------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Per-batch Sampling
+# -----------------------------------------------------------------------------
 
-    if log_file:
-        path = Path(log_file).resolve()
 
-        file_handler = logging.FileHandler(path, encoding="utf-8")
-        file_handler.setFormatter(logging.Formatter(DEFAULT_FMT))
-        root.addHandler(file_handler)
+class LogSampler(logging.Filter):
+    """Pass one in *every* INFO record per message template.
 
-    return root
+    Only INFO records from ``docutil`` loggers are sampled; the first
+    record of each template always passes, and DEBUG, WARNING and above
+    are never dropped. ``every=0`` keeps only the first record of each
+    template (summary mode). Suppressed records are counted per template.
+
+    The same filter may sit on several handlers; the decision is stored on
+    the record so each record is counted once.
+    """
+
+    def __init__(self, every: int) -> None:
+        super().__init__()
+        if every < 0:
+            raise ValueError("every must be >= 0.")
+        self.every = every
+        self.seen: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.INFO or not record.name.startswith("docutil"):
+            return True
+        decision: bool | None = getattr(record, "_docutil_sampled", None)
+        if decision is None:
+            key = (record.name, str(record.msg))
+            with self._lock:
+                n = self.seen.get(key, 0)
+                self.seen[key] = n + 1
+            decision = n == 0 or (self.every > 0 and n % self.every == 0)
+            record._docutil_sampled = decision
+        return decision
+
+    def suppressed(self) -> dict[tuple[str, str], int]:
+        """Records dropped so far, per ``(logger, template)``."""
+        with self._lock:
+            counts = dict(self.seen)
+        return {
+            key: n - (1 if self.every == 0 else 1 + (n - 1) // self.every)
+            for key, n in counts.items()
+            if n > 1
+        }
+
+
+@contextmanager
+def sampled_logging(every: int | None) -> Iterator[LogSampler | None]:
+    """Sample repetitive INFO records inside the block (no-op when None).
+
+    The sampler is attached to every handler of the root logger, which is
+    where :func:`configure_logging` puts its queue handler, so dropped
+    records are never formatted or enqueued. On exit one INFO line
+    summarises what was suppressed.
+    """
+    if every is None:
+        yield None
+        return
+
+    sampler = LogSampler(every)
+    handlers = list(logging.getLogger().handlers)
+    for handler in handlers:
+        handler.addFilter(sampler)
+    try:
+        yield sampler
+    finally:
+        for handler in handlers:
+            handler.removeFilter(sampler)
+
+        suppressed = sampler.suppressed()
+        if suppressed:
+            logger.info(
+                "Log sampling | every=%s | suppressed=%s | %s",
+                every,
+                sum(suppressed.values()),
+                " | ".join(
+                    f"{name}: {template!r} x{count}"
+                    for (name, template), count in sorted(suppressed.items())
+                ),
+            )
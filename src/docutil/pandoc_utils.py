@@ -5,15 +5,17 @@ from __future__ import annotations
 import logging
 import os
 import shutil
+import subprocess
+import threading
 from dataclasses import dataclass
 
-import pypandoc
 from packaging.version import Version
 
 logger = logging.getLogger(__name__)
 MIN_PANDOC_VERSION = Version("3.0")
 
 from docutil.errors import PandocNotFoundError
+from docutil.profiling import span
 
 
 @dataclass(frozen=True)
@@ -36,25 +38,77 @@ class PandocStatus:
     version: str | None
 
 
-def get_pandoc_status() -> PandocStatus:
+# Process-wide probe cache, keyed on (resolved binary path, binary mtime) so
+# reinstalling or swapping pandoc is picked up without an explicit reset.
+_status_cache: dict[tuple[str, int], PandocStatus] = {}
+_status_lock = threading.Lock()
+
+
+def _probe_version(pandoc_path: str) -> str | None:
+    """Run ``pandoc --version`` and return the version number, if any."""
+    try:
+        proc = subprocess.run(
+            [pandoc_path, "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    first_line = proc.stdout.splitlines()[0] if proc.stdout else ""
+    _, _, version = first_line.partition(" ")
+    return version.strip() or None
+
+
+def invalidate_pandoc_status() -> None:
+    """Forget the memoized pandoc probe so the next lookup re-runs it."""
+    with _status_lock:
+        _status_cache.clear()
+
+
+def get_pandoc_status(*, refresh: bool = False) -> PandocStatus:
     """
     Determine whether pandoc is available and return its status.
+
+    The version probe (a ``pandoc --version`` subprocess) runs once per
+    process for a given binary; later calls only re-resolve the path and
+    stat it. Pass ``refresh=True`` or call :func:`invalidate_pandoc_status`
+    to force a new probe.
     """
     pandoc_path = shutil.which("pandoc")
     if not pandoc_path:
         return PandocStatus(available=False, path=None, version=None)
 
     try:
-        ver = pypandoc.get_pandoc_version()
-        return PandocStatus(available=True, path=pandoc_path, version=str(ver))
-    except Exception:
-        return PandocStatus(available=True, path=pandoc_path, version=None)
+        key = (os.path.realpath(pandoc_path), os.stat(pandoc_path).st_mtime_ns)
+    except OSError:
+        return PandocStatus(available=False, path=None, version=None)
+
+    if not refresh:
+        with _status_lock:
+            cached = _status_cache.get(key)
+        if cached is not None:
+            return cached
+
+    status = PandocStatus(available=True, path=pandoc_path, version=_probe_version(pandoc_path))
+    logger.debug("Pandoc probe | path=%s | version=%s", status.path, status.version)
+
+    with _status_lock:
+        _status_cache.clear()
+        _status_cache[key] = status
+
+    return status
 
 
 def require_pandoc() -> None:
     """
     Ensures Pandoc is installed and accessible.
 
+    Uses the memoized :func:`get_pandoc_status`, so repeated calls (e.g. one
+    per file in a batch) cost a PATH lookup and a stat, not a subprocess.
+
     Can be skipped in test environments via:
         DOCUTIL_SKIP_PANDOC_CHECK=1
     """
@@ -62,12 +116,13 @@ def require_pandoc() -> None:
     if os.getenv("DOCUTIL_SKIP_PANDOC_CHECK") == "1":
         return
 
-    if not shutil.which("pandoc"):
+    with span("pandoc.probe"):
+        status = get_pandoc_status()
+
+    if not status.available:
         raise PandocNotFoundError(
             "Pandoc executable not found on PATH. Install via: conda install -c conda-forge pandoc"
         )
 
-    try:
-        pypandoc.get_pandoc_version()
-    except OSError as exc:
-        raise PandocNotFoundError("Pandoc installation detected but not functioning.") from exc
+    if status.version is None:
+        raise PandocNotFoundError("Pandoc installation detected but not functioning.")
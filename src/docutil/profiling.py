@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+"""
+Profiling
+=========
+
+Lightweight per-stage timing spans for batch runs and conversions.
+
+Instrumented code wraps each stage in :func:`span`::
+
+    with span("pandoc.run"):
+        ...
+
+Outside a :func:`profiling` block a span costs one global lookup, so the
+instrumentation stays in place in production code. Inside the block every
+span is recorded with its thread, and the run can be summarised per stage
+(:meth:`Profiler.format_summary`) or exported as a Chrome trace
+(``chrome://tracing``, Perfetto, speedscope) for a flame-graph view.
+
+Stages
+------
+- ``discover``: walking the input folder (time spent inside ``iter_files``)
+- ``plan`` / ``plan.versioned``: output path planning, including
+  ``generate_versioned_path``
+- ``convert``: one converter call (contains the stages below)
+- ``pandoc.probe``: ``require_pandoc``
+- ``cache.lookup`` / ``cache.store``: content hashing and cache I/O
+- ``pandoc.run``: one pandoc conversion (subprocess or server); pandoc
+  writes its own output, so the write is part of this span
+- ``fast``: in-process fast-path conversion
+- ``write``: outputs written by docutil itself (fast path, PDF text)
+- ``pdf.extract``: PDF text extraction
+- ``record``: manifest and journal bookkeeping
+
+Spans nest, so a parent's total includes its children.
+
+Usage
+-----
+docutil --profile batch docx2md ./docs
+docutil --profile-out trace.json batch docx2md ./docs --workers 8
+docutil --profile-out batch.prof batch md2docx ./docs
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+_active: Profiler | None = None
+
+
+@dataclass(frozen=True)
+class Span:
+    """One timed stage, in nanoseconds of ``time.perf_counter_ns``."""
+
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    thread_name: str
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Aggregate of every span with the same name."""
+
+    name: str
+    count: int
+    total_s: float
+    mean_ms: float
+    max_ms: float
+
+
+class Profiler:
+    """Thread-safe collector of :class:`Span` records."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self.started_ns = time.perf_counter_ns()
+        self.finished_ns: int | None = None
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start_ns: int, duration_ns: int) -> None:
+        thread = threading.current_thread()
+        item = Span(name, start_ns, duration_ns, thread.ident or 0, thread.name)
+        with self._lock:
+            self.spans.append(item)
+
+    @property
+    def wall_s(self) -> float:
+        return ((self.finished_ns or time.perf_counter_ns()) - self.started_ns) / 1e9
+
+    def summary(self) -> list[StageStats]:
+        """Per-stage count, total, mean and max, largest total first."""
+        by_name: dict[str, list[int]] = {}
+        with self._lock:
+            for item in self.spans:
+                by_name.setdefault(item.name, []).append(item.duration_ns)
+        stats = [
+            StageStats(
+                name=name,
+                count=len(durations),
+                total_s=sum(durations) / 1e9,
+                mean_ms=sum(durations) / len(durations) / 1e6,
+                max_ms=max(durations) / 1e6,
+            )
+            for name, durations in by_name.items()
+        ]
+        return sorted(stats, key=lambda s: s.total_s, reverse=True)
+
+    def format_summary(self) -> str:
+        """Table of :meth:`summary`, followed by the wall time."""
+        lines = [f"{'stage':<16} {'count':>7} {'total s':>9} {'mean ms':>9} {'max ms':>9}"]
+        for s in self.summary():
+            lines.append(
+                f"{s.name:<16} {s.count:>7} {s.total_s:>9.3f} {s.mean_ms:>9.3f} {s.max_ms:>9.3f}"
+            )
+        lines.append(f"wall time: {self.wall_s:.3f} s (stage totals add up across threads)")
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path: Path | str) -> Path:
+        """Atomically write the spans in Chrome's Trace Event format."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+
+        events: list[dict[str, object]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in sorted({(s.thread_id, s.thread_name) for s in spans})
+        ]
+        events.extend(
+            {
+                "name": s.name,
+                "cat": "docutil",
+                "ph": "X",
+                "ts": (s.start_ns - self.started_ns) / 1000,
+                "dur": s.duration_ns / 1000,
+                "pid": pid,
+                "tid": s.thread_id,
+            }
+            for s in spans
+        )
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fh)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+
+class span:
+    """Time the enclosed block as stage *name* while profiling is active.
+
+    A class rather than a ``@contextmanager`` generator: spans sit on the
+    per-file hot path and this is several times cheaper when disabled.
+    """
+
+    __slots__ = ("name", "_profiler", "_start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> None:
+        self._profiler = _active
+        if self._profiler is not None:
+            self._start = time.perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._profiler is not None:
+            self._profiler.record(self.name, self._start, time.perf_counter_ns() - self._start)
+
+
+def profiled_iter(name: str, items: Iterable[_T]) -> Iterator[_T]:
+    """Iterate *items*, timing each step as stage *name* while profiling.
+
+    Returns the plain iterator when profiling is off.
+    """
+    it = iter(items)
+    profiler = _active
+    if profiler is None:
+        return it
+    return _timed(profiler, name, it)
+
+
+def _timed(profiler: Profiler, name: str, it: Iterator[_T]) -> Iterator[_T]:
+    while True:
+        start = time.perf_counter_ns()
+        try:
+            item = next(it)
+        except StopIteration:
+            profiler.record(name, start, time.perf_counter_ns() - start)
+            return
+        profiler.record(name, start, time.perf_counter_ns() - start)
+        yield item
+
+
+def active_profiler() -> Profiler | None:
+    """The profiler of the enclosing :func:`profiling` block, if any."""
+    return _active
+
+
+@contextmanager
+def profiling(output: Path | str | None = None) -> Iterator[Profiler]:
+    """
+    Record spans for the duration of the block.
+
+    Parameters
+    ----------
+    output
+        Optional export path. ``.json`` writes a Chrome trace of the spans;
+        any other suffix (e.g. ``.prof``) runs :mod:`cProfile` for the block
+        and writes a :mod:`pstats` file. cProfile only sees the thread that
+        entered the block, so use one worker for complete call stacks; spans
+        cover every thread.
+    """
+    global _active
+
+    if _active is not None:
+        raise RuntimeError("Profiling is already active.")
+
+    output = Path(output) if output is not None else None
+    cprofile = None
+    if output is not None and output.suffix.lower() != ".json":
+        import cProfile
+
+        cprofile = cProfile.Profile()
+
+    profiler = Profiler()
+    _active = profiler
+    if cprofile is not None:
+        cprofile.enable()
+    try:
+        yield profiler
+    finally:
+        if cprofile is not None:
+            cprofile.disable()
+        _active = None
+        profiler.finished_ns = time.perf_counter_ns()
+
+        if output is not None:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            if cprofile is not None:
+                cprofile.dump_stats(output)
+            else:
+                profiler.write_chrome_trace(output)
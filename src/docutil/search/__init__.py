@@ -0,0 +1,19 @@
+"""
+Full-Text Search
+================
+
+Incremental, positional inverted index over converted corpora: Markdown
+files and PDF text.
+
+Typical Usage
+-------------
+>>> with SearchIndex() as index:
+...     index.build("./converted", recursive=True)
+...     hits = index.search('"data retention" policy')
+"""
+
+from __future__ import annotations
+
+from .index import SearchHit, SearchIndex, parse_query
+
+__all__ = ["SearchHit", "SearchIndex", "parse_query"]
@@ -0,0 +1,442 @@
+from __future__ import annotations
+
+"""Search Index
+
+On-disk inverted index over Markdown files and PDF text, stored in SQLite
+(default: ``<cache dir>/search.sqlite``).
+
+Layout
+------
+- ``roots``: folders that were indexed, with their scan options
+- ``files``: one row per document with size, mtime, SHA-256 and the ids
+  of the terms it contains (so its postings can be deleted by key)
+- ``terms``: the vocabulary
+- ``postings``: one row per (term, document), holding every occurrence as
+  a delta + varint blob (see :mod:`docutil.search.postings`)
+
+Refresh follows the metadata index: ``build`` (re)indexes a folder,
+``update`` only re-reads documents whose size/mtime changed *and* whose
+content hash differs, and drops documents that disappeared.
+
+Queries
+-------
+A query is a list of clauses that must all match the same document. Bare
+words are single-term clauses; ``"quoted text"`` (or a word the tokenizer
+splits, such as ``follow-up``) is a phrase whose terms must be adjacent.
+Results are ``(path, line)`` references for every clause occurrence in
+the matching documents. PDF line numbers refer to the text returned by
+:func:`~docutil.inspect.pdf_extract.extract_pdf_text`.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from docutil.conversions.batch import iter_files
+from docutil.conversions.cache import default_cache_dir, file_digest
+from docutil.inspect.index import IndexStats
+from docutil.inspect.pdf_extract import extract_pdf_text
+from docutil.search.postings import (
+    Occurrence,
+    decode,
+    decode_ids,
+    encode,
+    encode_ids,
+    index_text,
+    tokenize,
+)
+from docutil.utils.concurrency import ordered_map
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_NAME = "search.sqlite"
+SCHEMA_VERSION = 1
+
+# Documents the index reads: Markdown as-is, PDFs through PyMuPDF.
+SOURCE_SUFFIXES = (".md", ".pdf")
+
+# Documents are written in transactions of this many files.
+_COMMIT_EVERY = 200
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY,
+    recursive INTEGER NOT NULL,
+    exclude TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    root TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    error TEXT,
+    terms BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_root ON files (root);
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (term_id, file_id)
+) WITHOUT ROWID;
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+
+def default_search_index_path() -> Path:
+    """Location of the search index when no ``--db`` is given."""
+    return default_cache_dir() / SEARCH_INDEX_NAME
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One matching line; ``line`` is 1-based."""
+
+    path: str
+    line: int
+
+
+def parse_query(query: str) -> list[list[str]]:
+    """Split *query* into clauses, each a list of terms (phrase if > 1)."""
+    clauses: list[list[str]] = []
+    for i, part in enumerate(re.split(r'"', query)):
+        chunks = [part] if i % 2 else part.split()
+        for chunk in chunks:
+            terms = tokenize(chunk)
+            if terms:
+                clauses.append(terms)
+    return clauses
+
+
+def _phrase_hits(postings: Sequence[list[Occurrence]]) -> list[Occurrence]:
+    """Occurrences of the first term followed by the others at consecutive positions."""
+    later = [{pos for pos, _ in occ} for occ in postings[1:]]
+    return [
+        (pos, line)
+        for pos, line in postings[0]
+        if all(pos + i in positions for i, positions in enumerate(later, start=1))
+    ]
+
+
+@dataclass(frozen=True)
+class _Read:
+    """What a worker learned about one document."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    sha256: str
+    postings: dict[str, bytes] | None  # None: content unchanged
+    error: str | None = None
+
+
+def _read(path: Path, known_sha256: str | None) -> _Read | None:
+    try:
+        st = path.stat()
+        digest = file_digest(path)
+    except OSError:
+        return None  # deleted while scanning
+    if digest == known_sha256:
+        return _Read(path, st.st_size, st.st_mtime_ns, digest, None)
+
+    try:
+        if path.suffix.lower() == ".pdf":
+            text = extract_pdf_text(path).text
+        else:
+            text = path.read_text(encoding="utf-8", errors="replace")
+    except (OSError, ValueError, RuntimeError) as exc:
+        return _Read(path, st.st_size, st.st_mtime_ns, digest, {}, error=str(exc))
+
+    postings = {term: encode(occ) for term, occ in index_text(text).items()}
+    return _Read(path, st.st_size, st.st_mtime_ns, digest, postings)
+
+
+# ----------------------------------------------------------------------
+# Index
+# ----------------------------------------------------------------------
+
+
+class SearchIndex:
+    """SQLite-backed positional inverted index.
+
+    Parameters
+    ----------
+    path
+        Database file (default: :func:`default_search_index_path`).
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path).expanduser() if path else default_search_index_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute("PRAGMA cache_size = -65536")  # 64 MiB
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self._db.close()
+            raise ValueError(f"Unsupported search index schema version {version}: {self.path}")
+        self._db.executescript(_SCHEMA)
+        self._term_ids: dict[str, int] = {}
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> SearchIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def build(
+        self,
+        folder: Path | str,
+        *,
+        recursive: bool = False,
+        exclude: Iterable[str] = (),
+        workers: int = 8,
+    ) -> IndexStats:
+        """Register *folder* and (re)index every document under it."""
+        root = Path(folder).resolve()
+        if not root.is_dir():
+            raise NotADirectoryError(f"Input folder not found: {root}")
+
+        exclude = list(exclude)
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO roots VALUES (?, ?, ?)",
+                (str(root), int(recursive), json.dumps(exclude)),
+            )
+        return self._refresh(root, recursive, exclude, workers, force=True)
+
+    def update(self, folder: Path | str | None = None, *, workers: int = 8) -> IndexStats:
+        """Re-index changed documents under *folder*, or under every registered root."""
+        if folder is None:
+            targets = self._db.execute("SELECT * FROM roots ORDER BY path").fetchall()
+        else:
+            root = Path(folder).resolve()
+            targets = self._db.execute(
+                "SELECT * FROM roots WHERE path = ?", (str(root),)
+            ).fetchall()
+            if not targets:
+                raise ValueError(
+                    f"Folder is not indexed (run `docutil search build` first): {root}"
+                )
+
+        totals: dict[str, int] = {}
+        for path, recursive, exclude in targets:
+            stats = self._refresh(
+                Path(path), bool(recursive), json.loads(exclude), workers, force=False
+            )
+            for key, value in stats.__dict__.items():
+                totals[key] = totals.get(key, 0) + value
+        return IndexStats(**totals)
+
+    def _refresh(
+        self, root: Path, recursive: bool, exclude: Sequence[str], workers: int, *, force: bool
+    ) -> IndexStats:
+        known = {
+            path: (file_id, size, mtime_ns, sha256)
+            for file_id, path, size, mtime_ns, sha256 in self._db.execute(
+                "SELECT id, path, size, mtime_ns, sha256 FROM files WHERE root = ?", (str(root),)
+            )
+        }
+        seen: set[str] = set()
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "failed": 0}
+
+        def changed() -> Iterator[tuple[Path, str | None]]:
+            # Runs on the calling thread: stat only, reading happens in workers.
+            if not root.is_dir():
+                return
+            for path in iter_files(root, SOURCE_SUFFIXES, recursive, exclude=exclude):
+                key = str(path)  # root is resolved; no per-file realpath
+                seen.add(key)
+                entry = known.get(key)
+                if entry is None or force:
+                    yield path, None
+                    continue
+                try:
+                    st = path.stat()
+                except OSError:
+                    seen.discard(key)
+                    continue
+                if (st.st_size, st.st_mtime_ns) == entry[1:3]:
+                    counts["unchanged"] += 1
+                else:
+                    yield path, entry[3]
+
+        if not root.is_dir():
+            logger.warning("Search root is missing, dropping its documents: %s", root)
+
+        pending = 0
+        ex = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="docutil-search")
+        reads = ordered_map(ex, lambda item: _read(*item), changed(), workers * 4)
+        try:
+            for read in reads:
+                if read is None:
+                    continue
+                key = str(read.path)
+                if read.postings is None:
+                    self._db.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                        (read.size, read.mtime_ns, key),
+                    )
+                    counts["unchanged"] += 1
+                else:
+                    self._store(key, str(root), read)
+                    if read.error is not None:
+                        counts["failed"] += 1
+                        logger.warning("Search index | %s | %s", read.path.name, read.error)
+                    elif key in known:
+                        counts["updated"] += 1
+                    else:
+                        counts["added"] += 1
+                pending += 1
+                if pending >= _COMMIT_EVERY:
+                    self._db.commit()
+                    pending = 0
+
+            gone = [entry[0] for path, entry in known.items() if path not in seen]
+            for file_id in gone:
+                self._delete_postings(file_id)
+                self._db.execute("DELETE FROM files WHERE id = ?", (file_id,))
+            counts["removed"] = len(gone)
+            self._db.commit()
+        except BaseException:
+            self._db.rollback()
+            self._term_ids.clear()  # ids of rolled-back terms are invalid
+            raise
+        finally:
+            ex.shutdown(cancel_futures=True)
+
+        stats = IndexStats(**counts)
+        logger.info("Search index | %s | %s", root, stats)
+        return stats
+
+    def _store(self, key: str, root: str, read: _Read) -> None:
+        postings = sorted(
+            (self._term_id(term), data) for term, data in (read.postings or {}).items()
+        )
+        terms = encode_ids(term_id for term_id, _ in postings)
+
+        row = self._db.execute("SELECT id FROM files WHERE path = ?", (key,)).fetchone()
+        if row is not None:
+            file_id = row[0]
+            self._delete_postings(file_id)
+            self._db.execute(
+                "UPDATE files SET root = ?, size = ?, mtime_ns = ?, sha256 = ?, error = ?, "
+                "terms = ? WHERE id = ?",
+                (root, read.size, read.mtime_ns, read.sha256, read.error, terms, file_id),
+            )
+        else:
+            file_id = self._db.execute(
+                "INSERT INTO files (path, root, size, mtime_ns, sha256, error, terms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, root, read.size, read.mtime_ns, read.sha256, read.error, terms),
+            ).lastrowid
+        # Sorted by term id, so inserts walk the postings B-tree in order.
+        self._db.executemany(
+            "INSERT INTO postings VALUES (?, ?, ?)",
+            [(term_id, file_id, data) for term_id, data in postings],
+        )
+
+    def _delete_postings(self, file_id: int) -> None:
+        (blob,) = self._db.execute("SELECT terms FROM files WHERE id = ?", (file_id,)).fetchone()
+        self._db.executemany(
+            "DELETE FROM postings WHERE term_id = ? AND file_id = ?",
+            [(term_id, file_id) for term_id in decode_ids(blob)],
+        )
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            self._db.execute("INSERT OR IGNORE INTO terms (term) VALUES (?)", (term,))
+            row = self._db.execute("SELECT id FROM terms WHERE term = ?", (term,)).fetchone()
+            term_id = self._term_ids[term] = row[0]
+        return term_id
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, *, limit: int | None = None) -> list[SearchHit]:
+        """Return every ``(path, line)`` where *query* matches, by path and line."""
+        clauses = parse_query(query)
+        if not clauses:
+            return []
+
+        terms = sorted({term for clause in clauses for term in clause})
+        term_ids = dict(
+            self._db.execute(
+                f"SELECT term, id FROM terms WHERE term IN ({', '.join('?' * len(terms))})",
+                terms,
+            ).fetchall()
+        )
+        if len(term_ids) < len(terms):
+            return []  # some term never occurs anywhere
+
+        # Intersect documents, rarest term first, before decoding anything.
+        def frequency(term: str) -> int:
+            sql = "SELECT COUNT(*) FROM postings WHERE term_id = ?"
+            return int(self._db.execute(sql, (term_ids[term],)).fetchone()[0])
+
+        blobs: dict[str, dict[int, bytes]] = {}
+        candidates: set[int] | None = None
+        for term in sorted(terms, key=frequency):
+            rows = self._db.execute(
+                "SELECT file_id, data FROM postings WHERE term_id = ?", (term_ids[term],)
+            )
+            blobs[term] = {
+                file_id: data
+                for file_id, data in rows
+                if candidates is None or file_id in candidates
+            }
+            candidates = set(blobs[term])
+            if not candidates:
+                return []
+        if candidates is None:
+            return []
+
+        paths = dict(
+            self._db.execute(
+                f"SELECT id, path FROM files WHERE id IN ({', '.join('?' * len(candidates))})",
+                sorted(candidates),
+            ).fetchall()
+        )
+
+        hits: list[SearchHit] = []
+        for file_id in sorted(candidates, key=paths.__getitem__):
+            decoded = {term: list(decode(blobs[term][file_id])) for term in terms}
+            lines: set[int] = set()
+            for clause in clauses:
+                matches = _phrase_hits([decoded[term] for term in clause])
+                if not matches:
+                    break
+                lines.update(line for _, line in matches)
+            else:
+                hits.extend(SearchHit(paths[file_id], line) for line in sorted(lines))
+                if limit is not None and len(hits) >= limit:
+                    return hits[:limit]
+        return hits
+
+    def failures(self) -> list[tuple[str, str]]:
+        """``(path, error)`` for documents that could not be read."""
+        rows = self._db.execute(
+            "SELECT path, error FROM files WHERE error IS NOT NULL ORDER BY path"
+        )
+        return [(path, error) for path, error in rows]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+"""Tokenizer and Postings Codec
+
+Tokens are maximal runs of Unicode word characters (``\\w+``), case-folded.
+Each token gets a position (its index in the document) and the 1-based
+line it appears on.
+
+A postings blob lists every occurrence of one term in one document as
+pairs of unsigned LEB128 varints: the gap to the previous position and the
+gap to the previous line. Both sequences are non-decreasing, so gaps are
+small and most occurrences take two bytes.
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+
+_TOKEN = re.compile(r"\w+")
+
+Occurrence = tuple[int, int]  # (position, line)
+
+
+def tokenize(text: str) -> list[str]:
+    """Case-folded word tokens of *text*, in order."""
+    return _TOKEN.findall(text.casefold())
+
+
+def index_text(text: str) -> dict[str, list[Occurrence]]:
+    """Map every term in *text* to its ``(position, line)`` occurrences."""
+    occurrences: dict[str, list[Occurrence]] = defaultdict(list)
+    position = 0
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        for term in tokenize(line):
+            occurrences[term].append((position, line_no))
+            position += 1
+    return occurrences
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def encode_ids(ids: Iterable[int]) -> bytes:
+    """Delta + varint encode ascending integers (e.g. a document's term ids)."""
+    out = bytearray()
+    last = 0
+    for value in ids:
+        _put_varint(out, value - last)
+        last = value
+    return bytes(out)
+
+
+def decode_ids(blob: bytes) -> list[int]:
+    """Inverse of :func:`encode_ids`."""
+    ids: list[int] = []
+    last = 0
+    for gap in _varints(blob):
+        last += gap
+        ids.append(last)
+    return ids
+
+
+def encode(occurrences: Iterable[Occurrence]) -> bytes:
+    """Delta + varint encode ascending ``(position, line)`` pairs."""
+    out = bytearray()
+    last_pos = last_line = 0
+    for pos, line in occurrences:
+        _put_varint(out, pos - last_pos)
+        _put_varint(out, line - last_line)
+        last_pos, last_line = pos, line
+    return bytes(out)
+
+
+def decode(blob: bytes) -> Iterator[Occurrence]:
+    """Inverse of :func:`encode`."""
+    values = _varints(blob)
+    pos = line = 0
+    for i in range(0, len(values), 2):
+        pos += values[i]
+        line += values[i + 1]
+        yield pos, line
+
+
+def _varints(blob: bytes) -> list[int]:
+    values: list[int] = []
+    value = shift = 0
+    for byte in blob:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(value)
+        value = shift = 0
+    return values
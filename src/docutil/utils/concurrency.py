@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+"""docutil.utils.concurrency
+
+Bounded, order-preserving fan-out over a ``concurrent.futures`` executor.
+
+Used by the folder scanners (DOCX metadata, metadata and search indexes)
+and by parallel PDF extraction: results come back in input order while at
+most ``window`` calls are in flight, so inputs can be streamed lazily and
+memory stays bounded however many items there are.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from typing import TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def ordered_map(
+    ex: Executor, fn: Callable[[_T], _R], items: Iterable[_T], window: int
+) -> Iterator[_R]:
+    """Map *fn* over *items* with at most *window* calls in flight, in input order."""
+    pending: deque[Future[_R]] = deque()
+    for item in items:
+        pending.append(ex.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+"""docutil.utils.files
+
+File-permission helpers for atomic writes.
+
+Outputs are written to a ``tempfile.mkstemp`` file and moved into place
+with ``os.replace``. ``mkstemp`` always creates the file with mode 0600,
+so without a ``chmod`` atomically written outputs would be private while
+files written directly with ``open`` follow the umask.
+
+Notes
+-----
+The umask can only be read by setting it, which is process-wide and racy
+while worker threads create files. It is read once (from
+``/proc/self/status`` where available) and cached; docutil never changes
+it.
+"""
+
+import os
+import threading
+from functools import cache
+
+_lock = threading.Lock()
+
+
+@cache
+def _umask() -> int:
+    try:
+        with open("/proc/self/status", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    with _lock:
+        mask = os.umask(0o022)
+        os.umask(mask)
+    return mask
+
+
+def default_file_mode() -> int:
+    """Mode ``open()`` would give a new file: ``0o666`` minus the umask."""
+    return 0o666 & ~_umask()
+
+
+def chmod_default(path: str | os.PathLike[str]) -> None:
+    """Give a ``mkstemp`` file the permissions of a normally created file."""
+    os.chmod(path, default_file_mode())
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+"""docutil.utils.ignore
+
+``.gitignore``-style path matching used to prune file discovery.
+
+Supported syntax
+----------------
+- blank lines and ``#`` comments are ignored
+- ``!pattern`` re-includes a previously ignored path
+- trailing ``/`` matches directories only
+- a leading or inner ``/`` anchors the pattern to the rules' base folder;
+  otherwise the pattern matches a name at any depth
+- ``*``, ``?``, ``[...]`` and ``**`` (any number of directories)
+
+As in git, the last matching rule wins, and nothing inside an ignored
+directory can be re-included (discovery never descends into it).
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+GITIGNORE_NAME = ".gitignore"
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob (already stripped of ``!`` and ``/`` flags) to regex."""
+    out: list[str] = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+            i = end + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """One compiled ignore pattern."""
+
+    pattern: str
+    regex: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+
+    @classmethod
+    def parse(cls, line: str) -> IgnoreRule | None:
+        text = line.rstrip("\n").rstrip("\r")
+        if not text.strip() or text.startswith("#"):
+            return None
+
+        # Trailing spaces are ignored unless escaped.
+        if not text.endswith("\\ "):
+            text = text.rstrip()
+
+        negated = text.startswith("!")
+        if negated:
+            text = text[1:]
+        elif text.startswith("\\!") or text.startswith("\\#"):
+            text = text[1:]
+
+        dir_only = text.endswith("/")
+        text = text.rstrip("/")
+        if not text:
+            return None
+
+        anchored = "/" in text
+        text = text.lstrip("/")
+        body = _translate(text)
+        if not anchored:
+            body = "(?:.*/)?" + body
+
+        return cls(
+            pattern=line.strip(),
+            regex=re.compile(f"^{body}$"),
+            negated=negated,
+            dir_only=dir_only,
+        )
+
+
+class IgnoreRules:
+    """Ordered set of ignore rules relative to a base folder."""
+
+    def __init__(self, patterns: Iterable[str] = ()) -> None:
+        self.rules: list[IgnoreRule] = [
+            rule for rule in (IgnoreRule.parse(p) for p in patterns) if rule is not None
+        ]
+
+    @classmethod
+    def from_file(cls, path: Path) -> IgnoreRules:
+        try:
+            return cls(path.read_text(encoding="utf-8", errors="replace").splitlines())
+        except OSError:
+            return cls()
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def match(self, rel_path: str, *, is_dir: bool) -> bool | None:
+        """Return True (ignored), False (re-included) or None (no rule matched).
+
+        *rel_path* is a POSIX path relative to the rules' base folder.
+        """
+        result: bool | None = None
+        for rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(rel_path):
+                result = not rule.negated
+        return result
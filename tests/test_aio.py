@@ -0,0 +1,129 @@
+import asyncio
+import importlib
+import os
+import stat
+import threading
+from pathlib import Path
+
+import pytest
+
+from docutil import pandoc_utils
+from docutil.conversions.aio import batch_convert_async, markdown_to_docx_async
+from docutil.conversions.report import BatchReport
+from docutil.errors import ConversionError
+
+_STUB = """#!/bin/sh
+if [ "$1" = "--version" ]; then echo "pandoc 3.1.2"; exit 0; fi
+for a; do case $a in --output=*) out=${a#--output=};; esac; last=$a; done
+case $last in
+  *slow*) echo $$ > "$last.pid"; exec sleep 30;;
+  *bad*) echo "bad input" >&2; exit 64;;
+esac
+cp "$last" "$out"
+"""
+
+
+@pytest.fixture
+def stub_pandoc(tmp_path: Path, monkeypatch):
+    """Stub `pandoc` that copies input to --output (sleeps on *slow*, fails on *bad*)."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    exe = bin_dir / "pandoc"
+    exe.write_text(_STUB)
+    exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.delenv("DOCUTIL_SKIP_PANDOC_CHECK", raising=False)
+    pandoc_utils.invalidate_pandoc_status()
+    yield
+    pandoc_utils.invalidate_pandoc_status()
+
+
+def test_batch_convert_async_keep_going(stub_pandoc, tmp_path: Path):
+    src = tmp_path / "in"
+    src.mkdir()
+    for name in ("a.md", "b.md", "bad.md"):
+        (src / name).write_text(name)
+
+    report = BatchReport()
+    results = asyncio.run(
+        batch_convert_async(
+            src,
+            ".md",
+            markdown_to_docx_async,
+            output_folder=tmp_path / "out",
+            output_suffix=".docx",
+            concurrency=2,
+            keep_going=True,
+            report=report,
+        )
+    )
+
+    assert sorted(p.name for p in results) == ["a.docx", "b.docx"]
+    assert (tmp_path / "out" / "a.docx").read_text() == "a.md"
+    assert report.failed == 1
+    failed = next(r for r in report.results if r.status == "failed")
+    assert failed.stderr == "bad input"
+
+
+def test_blocking_work_stays_off_the_event_loop(stub_pandoc, tmp_path: Path, monkeypatch):
+    md2docx = importlib.import_module("docutil.conversions.markdown_to_docx")
+    src = tmp_path / "in"
+    (src / "sub").mkdir(parents=True)
+    for name in ("a.md", "sub/b.md"):
+        (src / name).write_text(name)
+
+    threads: list[str] = []
+
+    def recorded(fn):
+        def wrapper(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(os, "scandir", recorded(os.scandir))
+    monkeypatch.setattr(md2docx, "require_pandoc", recorded(md2docx.require_pandoc))
+    monkeypatch.setattr(Path, "mkdir", recorded(Path.mkdir))
+
+    results = asyncio.run(
+        batch_convert_async(
+            src,
+            ".md",
+            markdown_to_docx_async,
+            output_folder=tmp_path / "out",
+            output_suffix=".docx",
+            recursive=True,
+        )
+    )
+
+    assert len(results) == 2
+    assert threads and threading.main_thread().name not in threads
+
+
+def test_async_failure_raises_conversion_error(stub_pandoc, tmp_path: Path):
+    bad = tmp_path / "bad.md"
+    bad.write_text("x")
+
+    with pytest.raises(ConversionError, match="bad input"):
+        asyncio.run(markdown_to_docx_async(bad))
+
+
+def test_cancellation_kills_pandoc(stub_pandoc, tmp_path: Path):
+    slow = tmp_path / "slow.md"
+    slow.write_text("x")
+
+    async def main() -> None:
+        task = asyncio.create_task(markdown_to_docx_async(slow))
+        pid_file = Path(f"{slow}.pid")
+        while not pid_file.exists():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    pid = int(Path(f"{slow}.pid").read_text())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
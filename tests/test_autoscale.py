@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from docutil.conversions import autoscale
+from docutil.conversions.autoscale import Autoscaler
+from docutil.conversions.batch import batch_convert
+
+
+def _feed(scaler: Autoscaler, completions: int, now: float) -> int:
+    for _ in range(completions):
+        scaler.record_completion()
+    return scaler.update(now=now)
+
+
+def test_autoscaler_climbs_then_reverses(monkeypatch):
+    monkeypatch.setattr(autoscale, "available_memory_ratio", lambda: 0.5)
+    scaler = Autoscaler(1, 8, window=1.0)
+    start = scaler._started
+    assert scaler.target == 4
+
+    assert _feed(scaler, 10, start + 1) == 5  # first window: probe upwards
+    assert _feed(scaler, 20, start + 2) == 6  # faster: keep climbing
+    assert _feed(scaler, 10, start + 3) == 5  # slower: reverse
+    assert _feed(scaler, 10, start + 4) == 5  # flat: hold
+    assert [s.workers for s in scaler.history] == [5, 6, 5, 5]
+
+
+def test_autoscaler_shrinks_under_memory_pressure_within_bounds(monkeypatch):
+    monkeypatch.setattr(autoscale, "available_memory_ratio", lambda: 0.01)
+    scaler = Autoscaler(2, 4, window=1.0)
+    start = scaler._started
+
+    for i in range(1, 5):
+        _feed(scaler, 50, start + i)
+
+    assert scaler.target == 2
+
+
+def test_batch_convert_auto_workers(tmp_path: Path):
+    for i in range(20):
+        (tmp_path / f"f{i}.md").write_text("x")
+
+    results = batch_convert(
+        tmp_path,
+        ".md",
+        lambda src, out: src,
+        workers="auto",
+        max_workers=3,
+        progress=False,
+    )
+
+    assert len(results) == 20
@@ -0,0 +1,72 @@
+import json
+import os
+from pathlib import Path
+
+from docutil.conversions.batch import batch_convert
+from docutil.conversions.manifest import MANIFEST_NAME
+
+
+def _run(src_dir: Path, out_dir: Path, calls: list[str], **kwargs) -> list[Path]:
+    def fake_converter(src: Path, out: Path | None) -> Path:
+        assert out is not None
+        calls.append(src.name)
+        out.write_text(src.read_text().upper())
+        return out
+
+    return batch_convert(
+        src_dir,
+        ".md",
+        fake_converter,
+        output_folder=out_dir,
+        output_suffix=".txt",
+        incremental=True,
+        progress=False,
+        **kwargs,
+    )
+
+
+def test_incremental_converts_only_new_or_changed(tmp_path: Path):
+    src_dir = tmp_path / "in"
+    out_dir = tmp_path / "out"
+    src_dir.mkdir()
+    (src_dir / "a.md").write_text("a")
+    (src_dir / "b.md").write_text("b")
+
+    calls: list[str] = []
+    _run(src_dir, out_dir, calls)
+    assert sorted(calls) == ["a.md", "b.md"]
+    manifest = json.loads((out_dir / MANIFEST_NAME).read_text())
+    assert set(manifest["files"]) == {"a.md", "b.md"}
+
+    # Nothing changed: nothing converted, outputs still reported.
+    calls.clear()
+    results = _run(src_dir, out_dir, calls)
+    assert calls == []
+    assert sorted(p.name for p in results) == ["a.txt", "b.txt"]
+
+    # Touch without edits is detected via the content hash.
+    st = (src_dir / "a.md").stat()
+    os.utime(src_dir / "a.md", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    (src_dir / "b.md").write_text("b2")
+    (src_dir / "c.md").write_text("c")
+    _run(src_dir, out_dir, calls)
+    assert sorted(calls) == ["b.md", "c.md"]
+    assert (out_dir / "b.txt").read_text() == "B2"
+
+
+def test_incremental_deletes_orphans(tmp_path: Path):
+    src_dir = tmp_path / "in"
+    out_dir = tmp_path / "out"
+    src_dir.mkdir()
+    (src_dir / "a.md").write_text("a")
+    (src_dir / "b.md").write_text("b")
+
+    calls: list[str] = []
+    _run(src_dir, out_dir, calls)
+    (src_dir / "b.md").unlink()
+
+    _run(src_dir, out_dir, calls, delete_orphans=True)
+    assert not (out_dir / "b.txt").exists()
+    assert (out_dir / "a.txt").exists()
+    manifest = json.loads((out_dir / MANIFEST_NAME).read_text())
+    assert set(manifest["files"]) == {"a.md"}
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import pytest
+
+from docutil.conversions.batch import batch_convert
+from docutil.conversions.journal import JOURNAL_NAME, BatchJournal, load_journal
+from docutil.conversions.report import BatchReport
+
+
+def _converter(calls: list[str], *, fail_on: str | None = None):
+    def convert(path: Path, out: Path | None) -> Path:
+        if path.name == fail_on:
+            raise KeyboardInterrupt  # simulate preemption mid-batch
+        assert out is not None
+        calls.append(path.name)
+        out.write_text(path.read_text())
+        return out
+
+    return convert
+
+
+def test_interrupted_batch_resumes_from_journal(tmp_path: Path):
+    src = tmp_path / "in"
+    out = tmp_path / "out"
+    src.mkdir()
+    for name in ("a.md", "b.md", "c.md", "d.md"):
+        (src / name).write_text(name)
+
+    first: list[str] = []
+    with pytest.raises(KeyboardInterrupt):
+        batch_convert(
+            src,
+            ".md",
+            _converter(first, fail_on="c.md"),
+            output_folder=out,
+            output_suffix=".txt",
+            progress=False,
+        )
+
+    journal = out / JOURNAL_NAME
+    assert sorted(load_journal(journal)) == ["a.md", "b.md"]
+
+    # Invalidate one journaled entry: its output disappears.
+    (out / "b.txt").unlink()
+
+    second: list[str] = []
+    report = BatchReport()
+    results = batch_convert(
+        src,
+        ".md",
+        _converter(second),
+        output_folder=out,
+        output_suffix=".txt",
+        force=True,
+        resume=True,
+        report=report,
+        progress=False,
+    )
+
+    assert second == ["b.md", "c.md", "d.md"]
+    assert report.count("resumed") == 1
+    assert sorted(p.name for p in results) == ["a.txt", "b.txt", "c.txt", "d.txt"]
+    # A clean finish removes the journal.
+    assert not journal.exists()
+
+
+def test_journal_tolerates_torn_last_line(tmp_path: Path):
+    journal = tmp_path / JOURNAL_NAME
+    journal.write_text(
+        '{"src": "a.md", "out": "/o/a.txt", "size": 1, "mtime_ns": 2}\n{"src": "b.md", "ou'
+    )
+
+    assert list(load_journal(journal)) == ["a.md"]
+
+
+def test_resume_appends_after_a_torn_last_line(tmp_path: Path):
+    src = tmp_path / "in"
+    src.mkdir()
+    (src / "a.md").write_text("a")
+    (src / "b.md").write_text("b")
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "a.txt").write_text("a")
+    st = (src / "a.md").stat()
+    (out / JOURNAL_NAME).write_text(
+        f'{{"src": "a.md", "out": "{out / "a.txt"}", "size": {st.st_size}, '
+        f'"mtime_ns": {st.st_mtime_ns}}}\n{{"src": "b.md", "ou'
+    )
+
+    journal = BatchJournal(out, src, resume=True)
+    assert journal.is_done(src / "a.md") == out / "a.txt"
+    (out / "b.txt").write_text("b")
+    journal.record(src / "b.md", out / "b.txt")
+    journal.close()
+
+    assert list(load_journal(out / JOURNAL_NAME)) == ["a.md", "b.md"]
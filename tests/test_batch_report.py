@@ -0,0 +1,98 @@
+import errno
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from docutil.conversions.batch import batch_convert
+from docutil.conversions.engine import run_pandoc
+from docutil.conversions.report import BatchReport
+from docutil.errors import ConversionError
+
+
+def _inputs(folder: Path, *names: str) -> None:
+    for name in names:
+        (folder / name).write_text(name)
+
+
+def test_keep_going_records_failures_and_writes_report(tmp_path: Path):
+    src = tmp_path / "in"
+    src.mkdir()
+    _inputs(src, "a.md", "bad.md", "c.md")
+
+    def converter(path: Path, out: Path | None) -> Path:
+        if path.name == "bad.md":
+            raise ConversionError("boom", stderr="pandoc: parse error")
+        assert out is not None
+        out.write_text("converted")
+        return out
+
+    report = BatchReport()
+    results = batch_convert(
+        src,
+        ".md",
+        converter,
+        output_folder=tmp_path / "out",
+        output_suffix=".txt",
+        workers=2,
+        keep_going=True,
+        report=report,
+        report_path=tmp_path / "report.json",
+        progress=False,
+    )
+
+    assert sorted(p.name for p in results) == ["a.txt", "c.txt"]
+    assert (report.converted, report.failed) == (2, 1)
+
+    data = json.loads((tmp_path / "report.json").read_text())
+    assert data["summary"]["failed"] == 1
+    failed = next(f for f in data["files"] if f["status"] == "failed")
+    assert failed["stderr"] == "pandoc: parse error"
+    assert data["summary"]["output_bytes"] == 2 * len("converted")
+
+
+def test_transient_failures_are_retried(tmp_path: Path):
+    _inputs(tmp_path, "a.md")
+    calls = 0
+
+    def flaky(path: Path, out: Path | None) -> Path:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise OSError(errno.EAGAIN, "try again")
+        return path
+
+    report = BatchReport()
+    batch_convert(tmp_path, ".md", flaky, retries=2, retry_backoff=0, report=report)
+
+    assert calls == 3
+    assert report.results[0].attempts == 3
+    assert report.results[0].status == "converted"
+
+
+def test_default_mode_still_aborts(tmp_path: Path):
+    _inputs(tmp_path, "a.md")
+
+    def broken(path: Path, out: Path | None) -> Path:
+        raise ValueError("not transient")
+
+    report = BatchReport()
+    with pytest.raises(ValueError):
+        batch_convert(tmp_path, ".md", broken, retries=3, report=report)
+
+    assert report.failed == 1
+    assert report.results[0].attempts == 1
+
+
+def test_pandoc_failures_stay_catchable_as_runtime_error(tmp_path: Path):
+    src = tmp_path / "bad.md"
+    src.write_text("x")
+    died = RuntimeError('Pandoc died with exitcode "64" during conversion: parse error')
+
+    with patch("pypandoc.convert_file", side_effect=died):
+        with pytest.raises(RuntimeError) as info:
+            run_pandoc(src, tmp_path / "bad.docx", to="docx", format="gfm", extra_args=[])
+
+    assert isinstance(info.value, ConversionError)
+    assert info.value.stderr == "parse error"
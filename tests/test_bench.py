@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import zipfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.bench import (
+    CorpusSpec,
+    compare_results,
+    file_sizes,
+    make_corpus,
+    percentile,
+    run_benchmark,
+    stub_pandoc,
+)
+from docutil.cli import app
+
+posix_only = pytest.mark.skipif(os.name == "nt", reason="stub pandoc is a shell script")
+
+
+def test_corpus_is_deterministic(tmp_path: Path):
+    spec = CorpusSpec(mode="docx2md", files=12, mean_kb=2)
+
+    first = make_corpus(tmp_path / "a", spec)
+    second = make_corpus(tmp_path / "b", spec)
+
+    assert [p.relative_to(tmp_path / "a") for p in first] == [
+        p.relative_to(tmp_path / "b") for p in second
+    ]
+    assert all(a.read_bytes() == b.read_bytes() for a, b in zip(first, second, strict=True))
+    with zipfile.ZipFile(first[0]) as zf:
+        assert b"<w:t" in zf.read("word/document.xml")
+
+
+def test_size_distributions():
+    assert set(file_sizes(CorpusSpec(files=5, size_dist="fixed", mean_kb=4))) == {4096}
+
+    sizes = file_sizes(CorpusSpec(files=4000, size_dist="lognormal", mean_kb=8))
+    assert statistics.fmean(sizes) == pytest.approx(8192, rel=0.1)
+    assert max(sizes) > 4 * 8192  # long tail
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert (percentile(values, 50), percentile(values, 99), percentile([], 50)) == (50, 99, 0)
+
+
+@posix_only
+def test_stub_pandoc_copies_and_restores_environment(tmp_path: Path):
+    path_before = os.environ["PATH"]
+    src = tmp_path / "in.md"
+    src.write_text("# hi\n")
+
+    with stub_pandoc() as exe:
+        assert shutil.which("pandoc") == str(exe)
+        version = subprocess.run(["pandoc", "--version"], capture_output=True, text=True)
+        subprocess.run(["pandoc", "--from=gfm", str(src), f"--output={tmp_path / 'out'}"])
+
+    assert version.stdout.startswith("pandoc 3.")
+    assert (tmp_path / "out").read_text() == "# hi\n"
+    assert os.environ["PATH"] == path_before
+
+
+@posix_only
+def test_run_benchmark_reports_comparable_json(tmp_path: Path):
+    result = run_benchmark(
+        CorpusSpec(files=6, mean_kb=1),
+        workers=[1, 2],
+        repeat=1,
+        corpus_dir=tmp_path / "corpus",
+    )
+
+    data = json.loads(json.dumps(result.to_dict()))
+    assert [(c["workers"], c["files"], c["failed"]) for c in data["cases"]] == [
+        (1, 6, 0),
+        (2, 6, 0),
+    ]
+    assert all(c["files_per_s"] > 0 for c in data["cases"])
+    assert set(data["cases"][0]["latency_ms"]) == {"p50", "p90", "p99", "max", "mean"}
+    assert data["config"]["pandoc"] == "stub"
+
+    assert compare_results(data, data).splitlines()[0].startswith("workers=1: files/s")
+
+
+def test_run_benchmark_refuses_foreign_corpus_dir(tmp_path: Path):
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    (folder / "notes.txt").write_text("keep me")
+
+    with pytest.raises(ValueError, match="not empty"):
+        run_benchmark(CorpusSpec(files=2), workers=[1], repeat=1, corpus_dir=folder)
+    assert (folder / "notes.txt").read_text() == "keep me"
+
+    result = CliRunner().invoke(app, ["bench", "md2docx", "--corpus-dir", str(folder)])
+    assert result.exit_code == 2
+    assert (folder / "notes.txt").exists()
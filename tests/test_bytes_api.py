@@ -0,0 +1,42 @@
+import shutil
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.cli import app
+from docutil.conversions.docx_to_markdown import docx_to_markdown, docx_to_markdown_bytes
+from docutil.conversions.markdown_to_docx import markdown_to_docx_bytes
+
+pytestmark = pytest.mark.skipif(shutil.which("pandoc") is None, reason="pandoc not installed")
+
+runner = CliRunner()
+
+
+def test_in_memory_round_trip_matches_file_api(tmp_path: Path):
+    docx = markdown_to_docx_bytes("# Title\n\nSome *emphasis*.\n")
+    assert docx.startswith(b"PK")
+
+    src = tmp_path / "doc.docx"
+    src.write_bytes(docx)
+
+    assert docx_to_markdown_bytes(docx) == docx_to_markdown(src).read_text(encoding="utf-8")
+    assert docx_to_markdown_bytes(docx).startswith("# Title")
+
+
+def test_rejects_non_docx_bytes():
+    with pytest.raises(ValueError):
+        docx_to_markdown_bytes(b"# not a docx")
+
+
+def test_cli_reads_stdin_and_writes_stdout(tmp_path: Path):
+    docx = markdown_to_docx_bytes("# Piped\n")
+
+    result = runner.invoke(app, ["docx2md", "-"], input=docx)
+    assert result.exit_code == 0
+    assert "# Piped" in result.stdout
+
+    out = tmp_path / "piped.docx"
+    result = runner.invoke(app, ["md2docx", "-", str(out)], input=b"# Piped\n")
+    assert result.exit_code == 0
+    assert out.read_bytes().startswith(b"PK")
@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.cli import app
+from docutil.conversions.cache import ConversionCache, parse_size
+from docutil.conversions.engine import conversion_cache, run_pandoc
+
+
+def _key(digest: str, **overrides) -> str:
+    params = {"pandoc_version": "3.1", "to": "gfm", "format": "docx", "extra_args": []}
+    params.update(overrides)
+    return ConversionCache.make_key(digest, **params)
+
+
+def test_parse_size():
+    assert parse_size("1024") == 1024
+    assert parse_size("2K") == 2048
+    assert parse_size("1.5M") == int(1.5 * 1024**2)
+    assert parse_size("1GiB") == 1024**3
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+def test_key_covers_version_and_args():
+    base = _key("abc")
+    assert base == _key("abc")
+    assert base != _key("abd")
+    assert base != _key("abc", pandoc_version="3.2")
+    assert base != _key("abc", extra_args=["--wrap=none"])
+
+
+def test_put_get_and_lru_prune(tmp_path: Path):
+    cache = ConversionCache(tmp_path / "cache", max_size="1M")
+    src = tmp_path / "out.md"
+
+    for i, key in enumerate(["k1", "k2", "k3"]):
+        src.write_bytes(bytes([i]) * 100)
+        cache.put(_key(key), src)
+        obj = cache._object_path(_key(key))
+        os.utime(obj, ns=(i * 10**9, i * 10**9))
+
+    # Touch k1 so k2 becomes the least recently used entry.
+    assert cache.get(_key("k1"), tmp_path / "hit.md")
+    assert (tmp_path / "hit.md").read_bytes() == b"\x00" * 100
+    assert not cache.get(_key("missing"), tmp_path / "miss.md")
+
+    removed, freed = cache.prune(max_size=200)
+    assert (removed, freed) == (1, 100)
+    assert not cache.get(_key("k2"), tmp_path / "gone.md")
+
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert (stats.hits, stats.misses) == (1, 2)
+
+    assert cache.clear() == 2
+    assert cache.stats().entries == 0
+
+
+def test_put_evicts_to_low_water(tmp_path: Path):
+    cache = ConversionCache(tmp_path / "cache", max_size=1000)
+    src = tmp_path / "out.md"
+    src.write_bytes(b"x" * 100)
+
+    with patch.object(cache, "prune", wraps=cache.prune) as prune:
+        for i in range(30):
+            cache.put(_key(f"k{i}"), src)
+
+    # Each eviction frees room for the next inserts instead of one entry.
+    assert prune.call_count == 10
+    assert all(c.args == (900,) for c in prune.call_args_list)
+    assert cache.stats().size_bytes <= 1000
+
+
+def test_run_pandoc_serves_hits_from_cache(tmp_path: Path):
+    src = tmp_path / "a.md"
+    src.write_text("# Hi\n")
+    out = tmp_path / "a.docx"
+    cache = ConversionCache(tmp_path / "cache")
+
+    def fake_convert(source, to, format, outputfile, extra_args):
+        Path(outputfile).write_bytes(b"docx")
+
+    with patch("pypandoc.convert_file", side_effect=fake_convert) as mock:
+        with conversion_cache(cache):
+            for _ in range(3):
+                out.unlink(missing_ok=True)
+                run_pandoc(src, out, to="docx", format="gfm", extra_args=["--wrap=none"])
+                assert out.read_bytes() == b"docx"
+
+    mock.assert_called_once()
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cli_rejects_bad_sizes(tmp_path: Path):
+    runner = CliRunner()
+    src = tmp_path / "in"
+    src.mkdir()
+
+    result = runner.invoke(app, ["batch", "md2docx", str(src), "--cache-max-size", "10XB"])
+    assert result.exit_code == 2
+    assert "--cache-max-size" in result.output
+    assert "Traceback" not in result.output
+
+    result = runner.invoke(app, ["cache", "prune", "--cache-dir", str(tmp_path), "--max-size", "x"])
+    assert result.exit_code == 2
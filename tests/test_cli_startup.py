@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Modules only specific commands need; none may load just to print a version.
+HEAVY = [
+    "asyncio",
+    "docutil.conversions.batch",
+    "docx",
+    "fitz",
+    "http.client",
+    "logging.handlers",
+    "pypandoc",
+    "sqlite3",
+    "tqdm",
+]
+
+# Cold-start overhead of `docutil version` on top of a bare interpreter.
+BUDGET_MS = float(os.environ.get("DOCUTIL_STARTUP_BUDGET_MS", "150"))
+
+
+def loaded_heavy_modules(code: str) -> list[str]:
+    probe = (
+        f"{code}\nimport json, sys\nprint(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def best_of(args: list[str], runs: int = 5) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_cli_import_defers_heavy_dependencies():
+    assert (
+        loaded_heavy_modules("from docutil.cli import app; app(['version'], standalone_mode=False)")
+        == []
+    )
+
+
+def test_converters_import_without_pandoc_or_asyncio():
+    assert loaded_heavy_modules("import docutil.conversions.docx_to_markdown") == []
+
+
+@pytest.mark.skipif(BUDGET_MS <= 0, reason="DOCUTIL_STARTUP_BUDGET_MS=0 disables the check")
+def test_version_cold_start_within_budget():
+    baseline = best_of([sys.executable, "-c", "pass"])
+    elapsed = best_of([sys.executable, "-m", "docutil", "version"])
+
+    overhead_ms = (elapsed - baseline) * 1000
+    assert overhead_ms < BUDGET_MS, (
+        f"`docutil version` cold start costs {overhead_ms:.0f} ms over bare Python "
+        f"(budget {BUDGET_MS:.0f} ms); run `python -X importtime -m docutil version`."
+    )
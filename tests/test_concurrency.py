@@ -0,0 +1,23 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from docutil.utils.concurrency import ordered_map
+
+
+def test_ordered_map_keeps_input_order_and_bounds_window():
+    submitted: list[int] = []
+
+    def items():
+        for i in range(10):
+            submitted.append(i)
+            yield i
+
+    def slow_first(i: int) -> int:
+        time.sleep(0.02 if i == 0 else 0)
+        return i * i
+
+    with ThreadPoolExecutor(4) as ex:
+        results = ordered_map(ex, slow_first, items(), window=3)
+        assert next(results) == 0
+        assert len(submitted) == 3  # nothing beyond the window was pulled
+        assert list(results) == [i * i for i in range(1, 10)]
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+
+from docutil.conversions.batch import iter_files
+from docutil.utils.ignore import IgnoreRules
+
+
+def _touch(root: Path, *rels: str) -> None:
+    for rel in rels:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+
+def _found(root: Path, **kwargs) -> list[str]:
+    return [p.relative_to(root).as_posix() for p in iter_files(root, ".md", True, **kwargs)]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "path", "is_dir", "expected"),
+    [
+        ("node_modules", "a/node_modules", True, True),
+        ("build/", "build", False, None),
+        ("build/", "src/build", True, True),
+        ("/top.md", "top.md", False, True),
+        ("/top.md", "sub/top.md", False, None),
+        ("docs/*.md", "docs/a.md", False, True),
+        ("docs/*.md", "docs/x/a.md", False, None),
+        ("docs/**/*.md", "docs/x/y/a.md", False, True),
+        ("*.tmp.md", "deep/dir/x.tmp.md", False, True),
+    ],
+)
+def test_ignore_patterns(pattern, path, is_dir, expected):
+    assert IgnoreRules([pattern]).match(path, is_dir=is_dir) is expected
+
+
+def test_iter_files_is_sorted_and_streams(tmp_path: Path):
+    _touch(tmp_path, "b.md", "a.md", "sub/c.md", "sub/d.txt")
+
+    it = iter_files(tmp_path, ".md", True)
+    assert next(it).name == "a.md"
+    assert _found(tmp_path) == ["a.md", "b.md", "sub/c.md"]
+    assert [p.name for p in iter_files(tmp_path, ".md", False)] == ["a.md", "b.md"]
+
+
+def test_iter_files_prunes_excludes_and_gitignore(tmp_path: Path):
+    _touch(
+        tmp_path,
+        "keep.md",
+        "node_modules/pkg/readme.md",
+        ".git/info.md",
+        "docs/a.md",
+        "docs/draft.md",
+        "docs/generated/b.md",
+        "docs/generated/keep-me.md",
+    )
+    (tmp_path / ".gitignore").write_text("draft.md\n")
+    (tmp_path / "docs" / ".gitignore").write_text("generated/*\n!generated/keep-me.md\n")
+
+    # Files in a folder come before its subfolders.
+    assert _found(tmp_path, exclude=["node_modules"]) == [
+        "keep.md",
+        ".git/info.md",
+        "docs/a.md",
+        "docs/draft.md",
+        "docs/generated/b.md",
+        "docs/generated/keep-me.md",
+    ]
+    assert _found(tmp_path, exclude=["node_modules"], use_gitignore=True) == [
+        "keep.md",
+        "docs/a.md",
+        "docs/generated/keep-me.md",
+    ]
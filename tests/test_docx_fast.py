@@ -0,0 +1,191 @@
+import shutil
+import subprocess
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from docutil.conversions.docx_fast import docx_to_gfm
+from docutil.conversions.docx_to_markdown import docx_to_markdown
+from docutil.errors import UnsupportedContentError
+
+requires_pandoc = pytest.mark.skipif(shutil.which("pandoc") is None, reason="pandoc not installed")
+
+_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml"
+ ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+_PACKAGE_RELS = f"""<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="{_R}/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+_DOCUMENT_RELS = f"""<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rStyles" Type="{_R}/styles" Target="styles.xml"/>
+<Relationship Id="rLink" Type="{_R}/hyperlink" Target="https://example.com/a_b"
+ TargetMode="External"/>
+<Relationship Id="rMail" Type="{_R}/hyperlink" Target="mailto:foo@bar.com"
+ TargetMode="External"/>
+</Relationships>"""
+
+_STYLES = f"""<?xml version="1.0" encoding="UTF-8"?>
+<w:styles xmlns:w="{_W}">
+<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+<w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/>
+<w:basedOn w:val="Normal"/></w:style>
+<w:style w:type="paragraph" w:styleId="Quote"><w:name w:val="Quote"/>
+<w:basedOn w:val="Normal"/></w:style>
+</w:styles>"""
+
+
+def make_docx(path: Path, body: str) -> Path:
+    """Write a minimal DOCX package whose body is *body* (WordprocessingML)."""
+    document = (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<w:document xmlns:w="{_W}" xmlns:r="{_R}"><w:body>{body}</w:body></w:document>'
+    )
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _PACKAGE_RELS)
+        zf.writestr("word/_rels/document.xml.rels", _DOCUMENT_RELS)
+        zf.writestr("word/styles.xml", _STYLES)
+        zf.writestr("word/document.xml", document)
+    return path
+
+
+def run(text: str, *, b: bool = False, i: bool = False) -> str:
+    props = ("<w:b/>" if b else "") + ("<w:i/>" if i else "")
+    return f'<w:r><w:rPr>{props}</w:rPr><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def para(*runs: str, style: str | None = None) -> str:
+    ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f"<w:p>{ppr}{''.join(runs)}</w:p>"
+
+
+def pandoc_gfm(path: Path) -> str:
+    return subprocess.run(
+        ["pandoc", str(path), "-f", "docx", "-t", "gfm", "--wrap=none", "--markdown-headings=atx"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+# Markdown round-tripped through pandoc's DOCX writer (real styles/numbering).
+MARKDOWN_CASES = [
+    "# Title\n\nPlain paragraph.\n",
+    "## Mixed *emphasis* and **strong** and ***both***\n\nText with a [link](https://example.com/x).\n",
+    "- one\n- two\n  - nested\n- three\n\n1. first\n2. second\n",
+    "3. starts at three\n4. four\n\nBetween.\n\n- bullets\n",
+    "| Name | Value |\n|------|-------|\n| a    | 1     |\n| b    | 2     |\n",
+    "1. item\n\n   second paragraph\n\n2. loose\n",
+    "Escapes: 1.5 * 2 < 3 > [x] a_b snake_case_name #tag 50%\n\n1\\. not a list\n\n\\- nor this\n",
+    "Autolink <https://example.com/a?b=1&c=2> and 日本語 café.\n",
+    "Mail <foo@bar.com> or [write](mailto:foo@bar.com).\n",
+]
+
+# Documents the fast path must hand to pandoc rather than render differently.
+FALLBACK_CASES = [
+    "- [ ] task\n- [x] done\n",
+    "- ☐ typed box\n- plain\n",
+]
+
+# Run-level whitespace and nesting that pandoc's docx reader normalizes.
+XML_CASES = [
+    para(run("a "), run("b", b=True), run(" c")),
+    para(run("lead "), run("bold ", b=True), run("both ", b=True, i=True), run("tail")),
+    para(run("  spaced  "), run(" end ", i=True)),
+    para(run("x"), run("", b=True), run("y")),
+    para(run("word"), run(" ", b=True), run("next")),
+    para(run("Heading "), run("with", i=True), run(" spaces "), style="Heading2"),
+    para(
+        run("see "),
+        f'<w:hyperlink r:id="rLink">{run("the ", b=True)}{run("docs", b=True)}</w:hyperlink>',
+        run(" now", b=True),
+    ),
+    para(run("wow!"), f'<w:hyperlink r:id="rLink">{run("https://example.com/a_b")}</w:hyperlink>'),
+    para(run("mail "), f'<w:hyperlink r:id="rMail">{run("foo@bar.com")}</w:hyperlink>'),
+    para(run("mail "), f'<w:hyperlink r:id="rMail">{run("me")}</w:hyperlink>'),
+    "<w:tbl><w:tr><w:tc>"
+    + para(run("a"))
+    + "</w:tc><w:tc>"
+    + para(run("b", b=True))
+    + "</w:tc></w:tr></w:tbl>",
+]
+
+
+@requires_pandoc
+@pytest.mark.parametrize("markdown", MARKDOWN_CASES)
+def test_parity_with_pandoc_for_pandoc_documents(tmp_path: Path, markdown: str):
+    src = tmp_path / "in.md"
+    src.write_text(markdown, encoding="utf-8")
+    docx = tmp_path / "doc.docx"
+    subprocess.run(["pandoc", str(src), "-f", "gfm", "-o", str(docx)], check=True)
+
+    assert docx_to_gfm(docx) == pandoc_gfm(docx)
+
+
+@requires_pandoc
+@pytest.mark.parametrize("markdown", FALLBACK_CASES)
+def test_checkbox_lists_fall_back_with_identical_output(tmp_path: Path, markdown: str):
+    src = tmp_path / "in.md"
+    src.write_text(markdown, encoding="utf-8")
+    docx = tmp_path / "doc.docx"
+    subprocess.run(["pandoc", str(src), "-f", "gfm", "-o", str(docx)], check=True)
+
+    with pytest.raises(UnsupportedContentError, match="checkbox"):
+        docx_to_gfm(docx)
+    out = docx_to_markdown(docx, tmp_path / "out.md", fast=True)
+    assert out.read_text(encoding="utf-8") == pandoc_gfm(docx)
+
+
+@requires_pandoc
+@pytest.mark.parametrize("body", XML_CASES)
+def test_parity_with_pandoc_for_run_level_cases(tmp_path: Path, body: str):
+    docx = make_docx(tmp_path / "doc.docx", body)
+
+    assert docx_to_gfm(docx) == pandoc_gfm(docx)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        para(run("line"), "<w:r><w:br/></w:r>", run("break")),
+        para(run("custom"), style="Quote"),
+        para(run("x"), '<w:r><w:footnoteReference w:id="1"/></w:r>'),
+    ],
+)
+def test_unsupported_content_raises(tmp_path: Path, body: str):
+    docx = make_docx(tmp_path / "doc.docx", body)
+
+    with pytest.raises(UnsupportedContentError):
+        docx_to_gfm(docx)
+
+
+def test_fast_path_skips_pandoc(tmp_path: Path):
+    docx = make_docx(tmp_path / "doc.docx", para(run("Hello "), run("world", b=True)))
+
+    with patch("pypandoc.convert_file") as mock:
+        out = docx_to_markdown(docx, fast=True)
+
+    mock.assert_not_called()
+    assert out.read_text(encoding="utf-8") == "Hello **world**\n"
+
+
+def test_unsupported_content_falls_back_to_pandoc(tmp_path: Path):
+    docx = make_docx(tmp_path / "doc.docx", para(run("custom"), style="Quote"))
+
+    with patch("pypandoc.convert_file") as mock:
+        docx_to_markdown(docx, fast=True)
+
+    mock.assert_called_once()
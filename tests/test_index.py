@@ -0,0 +1,96 @@
+import json
+import os
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.cli import app
+from docutil.inspect import index as index_module
+from docutil.inspect.index import MetadataIndex
+
+CORE = (
+    '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/'
+    'core-properties" xmlns:dc="http://purl.org/dc/elements/1.1/" '
+    'xmlns:dcterms="http://purl.org/dc/terms/">'
+    "<dc:title>{title}</dc:title><dc:creator>{author}</dc:creator>"
+    "<dcterms:modified>{modified}</dcterms:modified></cp:coreProperties>"
+)
+
+
+def make_docx(path: Path, title: str, author: str, modified: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("docProps/core.xml", CORE.format(title=title, author=author, modified=modified))
+    return path
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    root = tmp_path / "docs"
+    make_docx(root / "a.docx", "Plan", "Ada Lovelace", "2024-01-10T00:00:00Z")
+    make_docx(root / "b.docx", "Budget", "Grace Hopper", "2024-03-05T12:00:00Z")
+    make_docx(root / "sub" / "c.docx", "Review", "ada lovelace", "2024-06-01T00:00:00Z")
+    return root
+
+
+def test_build_and_query(tmp_path: Path, corpus: Path):
+    with MetadataIndex(tmp_path / "index.sqlite") as index:
+        stats = index.build(corpus, recursive=True)
+        assert (stats.added, stats.failed) == (3, 0)
+
+        with patch.object(index_module, "inspect_docx_metadata") as inspect:
+            by_author = [m.title for m in index.query(author="ADA LOVELACE")]
+            by_prefix = [m.title for m in index.query(author="grace*")]
+            in_range = [
+                m.title
+                for m in index.query(modified_after="2024-02-01", modified_before="2024-06-01")
+            ]
+        inspect.assert_not_called()
+
+    assert by_author == ["Plan", "Review"]
+    assert by_prefix == ["Budget"]
+    assert in_range == ["Budget"]
+
+
+def test_update_only_reinspects_changed_files(tmp_path: Path, corpus: Path):
+    index = MetadataIndex(tmp_path / "index.sqlite")
+    index.build(corpus, recursive=True)
+
+    make_docx(corpus / "b.docx", "Budget v2", "Grace Hopper", "2024-03-06T00:00:00Z")
+    os.utime(corpus / "a.docx", ns=(1, 1))  # touched, content unchanged
+    (corpus / "sub" / "c.docx").unlink()
+    make_docx(corpus / "d.docx", "New", "Linus", "2024-07-01T00:00:00Z")
+
+    with patch.object(
+        index_module, "inspect_docx_metadata", wraps=index_module.inspect_docx_metadata
+    ) as inspect:
+        stats = index.update()
+
+    assert sorted(Path(c.args[0]).name for c in inspect.call_args_list) == ["b.docx", "d.docx"]
+    assert (stats.added, stats.updated, stats.unchanged, stats.removed) == (1, 1, 1, 1)
+    assert [m.title for m in index.query()] == ["Plan", "Budget v2", "New"]
+
+    # The touched file's new mtime was recorded, so nothing is hashed next time.
+    with patch.object(index_module, "file_digest") as digest:
+        assert index.update().unchanged == 3
+    digest.assert_not_called()
+    index.close()
+
+
+def test_cli_build_and_query(tmp_path: Path, corpus: Path):
+    db = str(tmp_path / "index.sqlite")
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["index", "build", str(corpus), "--recursive", "--db", db])
+    assert result.exit_code == 0, result.output
+    assert "3 added" in result.output
+
+    result = runner.invoke(app, ["index", "query", "--author", "ada*", "--db", db])
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line)["title"] for line in result.output.splitlines()] == [
+        "Plan",
+        "Review",
+    ]
@@ -0,0 +1,133 @@
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.cli import app
+from docutil.inspect.docx_metadata import (
+    InspectFailure,
+    inspect_docx_folder,
+    inspect_docx_metadata,
+)
+
+CORE = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<cp:coreProperties
+    xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
+    xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <dc:title>{title}</dc:title><dc:creator>Ada</dc:creator>
+  <cp:lastModifiedBy>Grace</cp:lastModifiedBy>
+  <dcterms:created xsi:type="dcterms:W3CDTF">2024-01-31T09:15:00Z</dcterms:created>
+  <dcterms:modified xsi:type="dcterms:W3CDTF">2024-02-01T10:00:00+02:00</dcterms:modified>
+</cp:coreProperties>"""
+
+APP = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">
+  <Application>Microsoft Office Word</Application><Company>ACME</Company>
+  <Pages>3</Pages><Words>812</Words>
+</Properties>"""
+
+
+def make_docx(path: Path, title: str = "Report") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("docProps/core.xml", CORE.format(title=title))
+        zf.writestr("docProps/app.xml", APP)
+        zf.writestr("word/document.xml", "<w:document/>")
+    return path
+
+
+def test_reads_core_properties(tmp_path: Path):
+    meta = inspect_docx_metadata(make_docx(tmp_path / "a.docx"))
+
+    assert (meta.title, meta.author, meta.last_modified_by) == ("Report", "Ada", "Grace")
+    assert meta.created == "2024-01-31 09:15:00+00:00"
+    assert meta.modified == "2024-02-01 08:00:00+00:00"
+    assert meta.application is None
+
+
+def test_app_properties_are_opt_in(tmp_path: Path):
+    meta = inspect_docx_metadata(make_docx(tmp_path / "a.docx"), include_app=True)
+
+    assert (meta.application, meta.company, meta.pages, meta.words) == (
+        "Microsoft Office Word",
+        "ACME",
+        3,
+        812,
+    )
+
+
+def test_rejects_non_zip(tmp_path: Path):
+    bad = tmp_path / "bad.docx"
+    bad.write_bytes(b"not a zip")
+
+    with pytest.raises(ValueError):
+        inspect_docx_metadata(bad)
+
+
+def corrupt_member(path: Path, name: str) -> Path:
+    """Flip the first byte of *name*'s deflate stream (an invalid block type)."""
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name)
+    data = bytearray(path.read_bytes())
+    offset = info.header_offset + 30 + len(info.filename.encode()) + len(info.extra)
+    data[offset] ^= 0xFF
+    path.write_bytes(bytes(data))
+    return path
+
+
+def test_corrupt_member_is_a_value_error(tmp_path: Path):
+    docx = tmp_path / "a.docx"
+    with zipfile.ZipFile(docx, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("docProps/core.xml", CORE.format(title="x" * 200))
+    corrupt_member(docx, "docProps/core.xml")
+
+    with pytest.raises(ValueError, match="Corrupt"):
+        inspect_docx_metadata(docx)
+
+    (record,) = inspect_docx_folder(tmp_path)
+    assert isinstance(record, InspectFailure)
+
+
+def test_folder_is_streamed_in_sorted_order_with_failures(tmp_path: Path):
+    for name in ["c", "a", "sub/b"]:
+        make_docx(tmp_path / f"{name}.docx", title=name)
+    (tmp_path / "broken.docx").write_bytes(b"junk")
+
+    records = list(inspect_docx_folder(tmp_path, recursive=True, workers=2))
+
+    assert [Path(r.path).name for r in records] == ["a.docx", "broken.docx", "c.docx", "b.docx"]
+    assert isinstance(records[1], InspectFailure)
+    assert [getattr(r, "title", None) for r in records] == ["a", None, "c", "sub/b"]
+
+
+def test_cli_folder_emits_json_lines(tmp_path: Path):
+    make_docx(tmp_path / "a.docx")
+    make_docx(tmp_path / "b.docx")
+
+    result = CliRunner().invoke(app, ["inspect", "docx", str(tmp_path), "--app"])
+
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in result.output.splitlines()]
+    assert [row["words"] for row in rows] == [812, 812]
+
+
+def test_cli_json_omits_app_fields_without_app(tmp_path: Path):
+    src = make_docx(tmp_path / "a.docx")
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["inspect", "docx", str(src), "--json"])
+    assert result.exit_code == 0, result.output
+    assert set(json.loads(result.output)) == {
+        "path",
+        "title",
+        "author",
+        "last_modified_by",
+        "created",
+        "modified",
+    }
+
+    result = runner.invoke(app, ["inspect", "docx", str(src), "--json", "--app"])
+    assert json.loads(result.output)["words"] == 812
@@ -0,0 +1,114 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.cli import app
+from docutil.logging_utils import LogSampler, configure_logging, sampled_logging, shutdown_logging
+
+
+@pytest.fixture(autouse=True)
+def _reset_logging():
+    yield
+    shutdown_logging()
+
+
+def queue_handlers() -> list[logging.Handler]:
+    return [h for h in logging.getLogger().handlers if type(h).__name__ == "_QueueHandler"]
+
+
+def test_configure_twice_keeps_one_handler(tmp_path: Path):
+    configure_logging(log_file=tmp_path / "first.log")
+    configure_logging(log_file=tmp_path / "second.log")
+    assert len(queue_handlers()) == 1
+
+    logging.getLogger("docutil.test").info("hello %s", "world")
+    shutdown_logging()
+
+    assert queue_handlers() == []
+    assert "hello world" in (tmp_path / "second.log").read_text()
+    assert (tmp_path / "first.log").read_text() == ""
+
+
+def test_json_lines_keep_exceptions_and_extras(tmp_path: Path):
+    log_file = tmp_path / "logs" / "run.jsonl"
+    configure_logging(log_file=log_file, fmt="json")
+
+    log = logging.getLogger("docutil.test")
+    log.info("converted %s", "a.md", extra={"duration": 0.5})
+    try:
+        raise ValueError("broken")
+    except ValueError:
+        log.exception("failed %s", "b.md")
+    shutdown_logging()
+
+    first, second = (json.loads(line) for line in log_file.read_text().splitlines())
+    assert first["message"] == "converted a.md"
+    assert first["level"] == "INFO" and first["logger"] == "docutil.test"
+    assert first["duration"] == 0.5
+    assert first["ts"].endswith("Z")
+    assert second["message"] == "failed b.md"
+    assert "ValueError: broken" in second["exc"]
+
+
+def test_sampler_counts_per_template():
+    sampler = LogSampler(3)
+    log = logging.getLogger("docutil.test")
+    passed = [
+        sampler.filter(log.makeRecord(log.name, logging.INFO, "", 0, "DRY RUN: %s", (i,), None))
+        for i in range(7)
+    ]
+    assert passed == [True, False, False, True, False, False, True]
+    assert sampler.suppressed() == {("docutil.test", "DRY RUN: %s"): 4}
+
+    warning = log.makeRecord(log.name, logging.WARNING, "", 0, "DRY RUN: %s", (0,), None)
+    assert sampler.filter(warning)
+
+    with pytest.raises(ValueError):
+        LogSampler(-1)
+
+
+def test_sampled_logging_summarises(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.INFO)
+    log = logging.getLogger("docutil.test")
+
+    with sampled_logging(0):
+        for i in range(5):
+            log.info("DRY RUN: %s", i)
+        log.warning("kept")
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages[:2] == ["DRY RUN: 0", "kept"]
+    assert "suppressed=4" in messages[2]
+    assert caplog.handler.filters == []
+
+
+def test_cli_json_log_file_with_sampling(tmp_path: Path):
+    src = tmp_path / "in"
+    src.mkdir()
+    for name in ("a.md", "b.md", "c.md"):
+        (src / name).write_text(name)
+    log_file = tmp_path / "run.jsonl"
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "--log-format",
+            "json",
+            "--log-file",
+            str(log_file),
+            "batch",
+            "md2docx",
+            str(src),
+            "--dry-run",
+            "--log-every",
+            "0",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    messages = [json.loads(line)["message"] for line in log_file.read_text().splitlines()]
+    assert sum(m.startswith("DRY RUN:") for m in messages) == 1
+    assert any("Log sampling" in m and "suppressed=2" in m for m in messages)
@@ -0,0 +1,144 @@
+import io
+import re
+import shutil
+import subprocess
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from docutil.conversions import markdown_fast
+from docutil.conversions.cache import ConversionCache
+from docutil.conversions.engine import conversion_cache
+from docutil.conversions.markdown_fast import gfm_to_docx
+from docutil.conversions.markdown_to_docx import markdown_to_docx
+from docutil.errors import UnsupportedContentError
+
+pytestmark = pytest.mark.skipif(shutil.which("pandoc") is None, reason="pandoc not installed")
+
+# Parts whose content depends on the document; everything else is the skeleton.
+PARTS = [
+    "word/document.xml",
+    "word/numbering.xml",
+    "word/_rels/document.xml.rels",
+    "word/_rels/footnotes.xml.rels",
+]
+
+
+@pytest.fixture(autouse=True)
+def skeleton_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("DOCUTIL_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(markdown_fast, "_skeletons", {})
+    return tmp_path / "cache" / "skeletons"
+
+
+def pandoc_docx(markdown: str) -> bytes:
+    return subprocess.run(
+        ["pandoc", "-f", "gfm", "-t", "docx"],
+        input=markdown.encode("utf-8"),
+        capture_output=True,
+        check=True,
+    ).stdout
+
+
+def parts(docx: bytes) -> dict[str, bytes]:
+    with zipfile.ZipFile(io.BytesIO(docx)) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def core_without_dates(docx: bytes) -> bytes:
+    return re.sub(rb"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ", b"", parts(docx)["docProps/core.xml"])
+
+
+CASES = [
+    "# Title\n\nPlain paragraph.\n",
+    "",
+    "Mixed *emphasis*, __strong__, ***both*** and `code`\nacross a soft break.\n",
+    "See [the **docs**](https://example.com/a?b=1) and <https://example.com/>.\n"
+    "Again: [docs](https://example.com/a?b=1).\n",
+    "# A\n\n## B\n\ntext\n\n# A\n\n### 1 digit first\n\n# " + "long " * 10 + "\n",
+    "- one\n- two\n  - nested\n    1. deep\n- three\n\n3) three\n4) four\n\nAfter.\n",
+    "- loose\n\n- list\n  - tight inside\n\n10. ten\n11. eleven\n",
+    'snake_case_name, 2*3*4, it\'s "quoted" & <https://a.b/c> café\n',
+]
+
+
+@pytest.mark.parametrize("markdown", CASES)
+def test_parity_with_pandoc(markdown: str):
+    fast, reference = gfm_to_docx(markdown), pandoc_docx(markdown)
+
+    assert parts(fast).keys() == parts(reference).keys()
+    for name in PARTS:
+        assert parts(fast)[name] == parts(reference)[name], name
+    assert core_without_dates(fast) == core_without_dates(reference)
+
+
+@pytest.mark.parametrize(
+    "markdown",
+    [
+        "| a | b |\n|---|---|\n| 1 | 2 |\n",
+        "```\ncode\n```\n",
+        "> quote\n",
+        "![image](x.png)\n",
+        "line  \nbreak\n",
+        "~~strike~~\n",
+        "<b>html</b>\n",
+        "bare https://example.com link\n",
+        "escaped \\*star\\*\n",
+        "1. item\n\n   second paragraph\n",
+        "Heading\n=======\n",
+    ],
+)
+def test_unsupported_content_raises(markdown: str):
+    with pytest.raises(UnsupportedContentError):
+        gfm_to_docx(markdown)
+
+
+def test_skeleton_is_built_once_and_persisted(skeleton_cache: Path):
+    with patch.object(
+        markdown_fast, "run_pandoc_bytes", wraps=markdown_fast.run_pandoc_bytes
+    ) as build:
+        gfm_to_docx("# one\n")
+        gfm_to_docx("# two\n")
+    build.assert_called_once()
+    assert len(list(skeleton_cache.glob("pandoc-*.docx"))) == 1
+
+    # A fresh process reuses the skeleton from disk.
+    markdown_fast._skeletons.clear()
+    with patch.object(markdown_fast, "run_pandoc_bytes") as build:
+        gfm_to_docx("# three\n")
+    build.assert_not_called()
+
+
+def test_skeleton_follows_the_active_cache_dir(skeleton_cache: Path, tmp_path: Path):
+    custom = tmp_path / "custom"
+    with conversion_cache(ConversionCache(custom)):
+        gfm_to_docx("# one\n")
+
+    assert len(list((custom / "skeletons").glob("pandoc-*.docx"))) == 1
+    assert not skeleton_cache.exists()
+
+
+def test_fast_path_skips_pandoc(tmp_path: Path):
+    gfm_to_docx("")  # build the skeleton
+    src = tmp_path / "in.md"
+    src.write_text("# Hello\n\n- **world**\n", encoding="utf-8")
+
+    with patch("pypandoc.convert_file") as mock:
+        out = markdown_to_docx(src, fast=True)
+
+    mock.assert_not_called()
+    assert (
+        parts(out.read_bytes())["word/document.xml"]
+        == parts(pandoc_docx(src.read_text()))["word/document.xml"]
+    )
+
+
+def test_unsupported_content_falls_back_to_pandoc(tmp_md: Path):
+    tmp_md.write_text("> quoted\n", encoding="utf-8")
+
+    with patch("pypandoc.convert_file") as mock:
+        markdown_to_docx(tmp_md, fast=True)
+
+    mock.assert_called_once()
@@ -0,0 +1,106 @@
+import re
+import shutil
+import struct
+import subprocess
+import zlib
+from pathlib import Path
+from urllib.parse import unquote
+
+import pytest
+
+from docutil.conversions.batch import batch_convert
+from docutil.conversions.docx_to_markdown import docx_to_markdown
+from docutil.conversions.media import MediaStore
+
+requires_pandoc = pytest.mark.skipif(shutil.which("pandoc") is None, reason="pandoc not installed")
+
+
+def png(rgb: tuple[int, int, int]) -> bytes:
+    """A valid 1×1 PNG of the given colour."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+        )
+
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    pixels = zlib.compress(b"\x00" + bytes(rgb))
+    return (
+        b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", pixels) + chunk(b"IEND", b"")
+    )
+
+
+def make_docx(path: Path, markdown: str, images: dict[str, bytes]) -> Path:
+    for name, data in images.items():
+        (path.parent / name).write_bytes(data)
+    subprocess.run(
+        ["pandoc", "-f", "markdown", "-o", str(path)],
+        input=markdown.encode("utf-8"),
+        cwd=path.parent,
+        check=True,
+    )
+    return path
+
+
+def image_links(markdown: Path) -> list[Path]:
+    refs = re.findall(r'src="([^"]+)"|\]\(([^)]+)\)', markdown.read_text(encoding="utf-8"))
+    return [(markdown.parent / unquote(a or b)).resolve() for a, b in refs]
+
+
+def test_store_deduplicates_by_content(tmp_path: Path):
+    store = MediaStore(tmp_path / "media")
+    store.root.mkdir()
+    first, second = tmp_path / "image1.PNG", tmp_path / "image7.png"
+    first.write_bytes(b"logo")
+    second.write_bytes(b"logo")
+
+    a, b = store.add(first), store.add(second)
+
+    assert a == b and a.suffix == ".png"
+    assert [p.name for p in store.root.iterdir()] == [a.name]
+    assert (store.stored, store.reused, store.bytes_saved) == (1, 1, 4)
+    assert store.link(a, tmp_path / "docs" / "x.md") == f"../media/{a.name}"
+
+
+@requires_pandoc
+def test_single_file_links_media_relative_to_markdown(tmp_path: Path):
+    src = make_docx(
+        tmp_path / "in.docx", "# Doc\n\n![logo](logo.png)\n", {"logo.png": png((255, 0, 0))}
+    )
+    out = tmp_path / "out dir" / "doc.md"
+    out.parent.mkdir()
+
+    docx_to_markdown(src, out, media=MediaStore(tmp_path / "shared media"))
+
+    links = image_links(out)
+    assert len(links) == 1
+    assert links[0].parent == (tmp_path / "shared media").resolve()
+    assert links[0].read_bytes() == png((255, 0, 0))
+    assert not list((tmp_path / "shared media").glob(".extract-*"))
+
+
+@requires_pandoc
+def test_batch_writes_each_unique_image_once(tmp_path: Path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    images = {"logo.png": png((255, 0, 0)), "shot.png": png((0, 0, 255))}
+    make_docx(docs / "a.docx", "![logo](logo.png)\n\n![shot](shot.png)\n", images)
+    make_docx(docs / "b.docx", "# B\n\n![logo](logo.png)\n", images)
+    make_docx(docs / "c.docx", "![again](logo.png) and ![shot](shot.png)\n", images)
+
+    store = MediaStore(tmp_path / "out" / "media")
+    outputs = batch_convert(
+        docs,
+        ".docx",
+        lambda src, dst: docx_to_markdown(src, dst, media=store),
+        output_folder=tmp_path / "out",
+        output_suffix=".md",
+        progress=False,
+        workers=3,
+    )
+
+    assert len(outputs) == 3
+    assert len(list(store.root.iterdir())) == 2
+    assert (store.stored, store.reused) == (2, 3)
+    for output in outputs:
+        assert all(link.exists() for link in image_links(output))
@@ -0,0 +1,113 @@
+import stat
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.cli import app
+from docutil.conversions.batch import batch_convert
+from docutil.conversions.cache import ConversionCache
+from docutil.conversions.metrics import parse_labels, render_metrics
+from docutil.conversions.report import BatchReport, FileResult
+
+
+def sample_report() -> BatchReport:
+    report = BatchReport()
+    for duration in (0.003, 0.07, 1.2):
+        report.add(
+            FileResult("a.md", "converted", duration=duration, input_bytes=10, output_bytes=30)
+        )
+    report.add(FileResult("b.md", "failed", duration=0.5))
+    report.finish()
+    return report
+
+
+def test_render_openmetrics():
+    text = render_metrics(sample_report(), cache_hits=2, cache_misses=1, labels={"job": 'a"b'})
+    lines = text.splitlines()
+
+    assert 'docutil_batch_files_total{job="a\\"b",status="converted"} 3' in lines
+    assert 'docutil_batch_files_total{job="a\\"b",status="failed"} 1' in lines
+    assert 'docutil_batch_input_bytes_total{job="a\\"b"} 30' in lines
+    assert 'docutil_batch_cache_hits_total{job="a\\"b"} 2' in lines
+    assert 'docutil_batch_file_duration_seconds_bucket{job="a\\"b",le="0.1"} 2' in lines
+    assert 'docutil_batch_file_duration_seconds_bucket{job="a\\"b",le="+Inf"} 3' in lines
+    assert "# TYPE docutil_batch_files counter" in lines
+    assert lines[-1] == "# EOF"
+
+
+def test_render_prometheus_text_format():
+    text = render_metrics(sample_report(), fmt="prometheus")
+
+    assert "# TYPE docutil_batch_files_total counter" in text
+    assert "# UNIT" not in text
+    assert "cache" not in text
+    assert "# EOF" not in text
+
+
+def test_output_parses_strictly():
+    parser = pytest.importorskip("prometheus_client.openmetrics.parser")
+    families = {
+        f.name: f for f in parser.text_string_to_metric_families(render_metrics(sample_report()))
+    }
+    assert families["docutil_batch_file_duration_seconds"].type == "histogram"
+
+
+def test_parse_labels():
+    assert parse_labels(["job=nightly", "host=a=b"]) == {"job": "nightly", "host": "a=b"}
+    for bad in ("job", "1x=y", "__name__=x", "le=1"):
+        with pytest.raises(ValueError):
+            parse_labels([bad])
+
+
+def test_batch_writes_metrics_even_when_aborting(tmp_path: Path):
+    src = tmp_path / "in"
+    src.mkdir()
+    (src / "a.md").write_text("a")
+    (src / "b.md").write_text("b")
+    metrics = tmp_path / "textfile" / "docutil.prom"
+
+    def converter(path: Path, out: Path | None) -> Path:
+        if path.name == "b.md":
+            raise ValueError("broken")
+        assert out is not None
+        out.write_text("ok")
+        return out
+
+    with pytest.raises(ValueError):
+        batch_convert(
+            src,
+            ".md",
+            converter,
+            output_folder=tmp_path / "out",
+            output_suffix=".txt",
+            progress=False,
+            cache=ConversionCache(tmp_path / "cache"),
+            metrics_path=metrics,
+            metrics_labels={"job": "nightly"},
+        )
+
+    text = metrics.read_text()
+    assert 'docutil_batch_files_total{job="nightly",status="converted"} 1' in text
+    assert 'docutil_batch_files_total{job="nightly",status="failed"} 1' in text
+    assert 'docutil_batch_cache_misses_total{job="nightly"} 0' in text
+    assert stat.S_IMODE(metrics.stat().st_mode) == 0o644
+    assert [p.name for p in metrics.parent.iterdir()] == ["docutil.prom"]
+
+
+def test_cli_metrics_file(tmp_path: Path):
+    src = tmp_path / "in"
+    src.mkdir()
+    (src / "a.md").write_text("a")
+    metrics = tmp_path / "docutil.prom"
+    runner = CliRunner()
+
+    args = ["batch", "md2docx", str(src), "--dry-run", "--metrics-file", str(metrics)]
+    result = runner.invoke(app, [*args, "--metrics-label", "job=ci"])
+    assert result.exit_code == 0, result.output
+    assert 'docutil_batch_files_total{job="ci",mode="md2docx",status="dry_run"} 1' in (
+        metrics.read_text()
+    )
+
+    result = runner.invoke(app, [*args, "--metrics-label", "job"])
+    assert result.exit_code == 2
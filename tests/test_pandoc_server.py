@@ -0,0 +1,107 @@
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from docutil.conversions import engine
+from docutil.conversions.pandoc_server import PandocServer, PandocServerPool, args_to_options
+from docutil.errors import PandocServerError
+
+
+class _FakePandocHandler(BaseHTTPRequestHandler):
+    """Echo server speaking the subset of the pandoc server API we use."""
+
+    def do_POST(self):  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        if body["to"] == "docx":
+            result = {"output": base64.b64encode(b"PK-docx").decode(), "base64": True}
+        else:
+            result = {"output": "# Hi", "base64": False, "messages": []}
+        raw = json.dumps(result).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_server():
+    httpd = HTTPServer(("127.0.0.1", 0), _FakePandocHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    server = PandocServer("pandoc")
+    server.port = httpd.server_address[1]
+    yield server, httpd
+    server.stop()
+    httpd.shutdown()
+
+
+def test_args_to_options():
+    assert args_to_options(["--wrap=none", "--markdown-headings=atx"]) == {
+        "wrap": "none",
+        "markdown-headings": "atx",
+    }
+    with pytest.raises(PandocServerError):
+        args_to_options(["--standalone"])
+
+
+def test_server_convert_encodes_binary_formats(fake_server):
+    server, httpd = fake_server
+
+    out = server.convert(b"docx-bytes", from_format="docx", to_format="gfm")
+    assert out == b"# Hi\n"
+    assert base64.b64decode(httpd.requests[0]["text"]) == b"docx-bytes"
+
+    out = server.convert(b"# Hi\n", from_format="gfm", to_format="docx", options={"wrap": "none"})
+    assert out == b"PK-docx"
+    assert httpd.requests[1]["text"] == "# Hi\n"
+    assert httpd.requests[1]["wrap"] == "none"
+
+
+def test_engine_falls_back_when_server_unavailable(tmp_path: Path):
+    src = tmp_path / "a.md"
+    src.write_text("# Hi\n")
+
+    with (
+        patch.object(PandocServerPool, "start", side_effect=PandocServerError("no server")),
+        patch("pypandoc.convert_file") as mock,
+    ):
+        with engine.pandoc_engine("server", workers=2):
+            assert engine._active_pool is None
+            engine.run_pandoc(
+                src, tmp_path / "a.docx", to="docx", format="gfm", extra_args=["--wrap=none"]
+            )
+
+    mock.assert_called_once()
+
+
+def test_pool_checkout_gives_up_when_closed():
+    pool = PandocServerPool(size=1)
+    busy = PandocServer("pandoc")
+    # The only server is checked out, so the next caller has to wait.
+    pool._servers.append(busy)
+    errors: list[BaseException] = []
+
+    def convert():
+        try:
+            pool.convert(b"# Hi", from_format="gfm", to_format="docx")
+        except PandocServerError as exc:
+            errors.append(exc)
+
+    with patch("docutil.conversions.pandoc_server._CHECKOUT_POLL", 0.01):
+        waiter = threading.Thread(target=convert, daemon=True)
+        waiter.start()
+        pool.close()
+        waiter.join(timeout=5)
+
+    assert not waiter.is_alive()
+    assert len(errors) == 1
@@ -0,0 +1,56 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from docutil import pandoc_utils
+from docutil.errors import PandocNotFoundError
+
+
+@pytest.fixture
+def fake_pandoc(tmp_path: Path, monkeypatch):
+    """Put a stub `pandoc` on PATH that counts how often it is probed."""
+    calls = tmp_path / "calls"
+    exe = tmp_path / "pandoc"
+    exe.write_text(f'#!/bin/sh\necho x >> "{calls}"\necho "pandoc 3.1.2"\n')
+    exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+
+    monkeypatch.setenv("PATH", str(tmp_path))
+    monkeypatch.delenv("DOCUTIL_SKIP_PANDOC_CHECK", raising=False)
+    pandoc_utils.invalidate_pandoc_status()
+    yield exe, lambda: len(calls.read_text().splitlines()) if calls.exists() else 0
+    pandoc_utils.invalidate_pandoc_status()
+
+
+def test_status_is_probed_once(fake_pandoc):
+    _, probes = fake_pandoc
+
+    for _ in range(5):
+        pandoc_utils.require_pandoc()
+
+    status = pandoc_utils.get_pandoc_status()
+    assert status.available and status.version == "3.1.2"
+    assert probes() == 1
+
+
+def test_status_reprobed_on_mtime_change_or_invalidation(fake_pandoc):
+    exe, probes = fake_pandoc
+
+    pandoc_utils.get_pandoc_status()
+    st = exe.stat()
+    os.utime(exe, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    pandoc_utils.get_pandoc_status()
+    assert probes() == 2
+
+    pandoc_utils.invalidate_pandoc_status()
+    pandoc_utils.get_pandoc_status()
+    assert probes() == 3
+
+
+def test_require_pandoc_missing(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    monkeypatch.delenv("DOCUTIL_SKIP_PANDOC_CHECK", raising=False)
+
+    with pytest.raises(PandocNotFoundError):
+        pandoc_utils.require_pandoc()
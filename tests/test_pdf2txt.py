@@ -0,0 +1,101 @@
+import importlib
+import json
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.cli import app
+from docutil.conversions.batch import batch_convert
+from docutil.conversions.cache import ConversionCache
+from docutil.conversions.pdf_to_text import pdf_to_text
+from docutil.utils.files import default_file_mode
+
+fitz = pytest.importorskip("fitz")
+
+# The package re-exports the function under the module's name.
+pdf_to_text_module = importlib.import_module("docutil.conversions.pdf_to_text")
+
+
+def make_pdf(path: Path, *texts: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = fitz.open()
+    for text in texts:
+        doc.new_page().insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_pdf_to_text_writes_pages_in_order(tmp_path: Path):
+    src = make_pdf(tmp_path / "a.pdf", "first", "second", "third")
+
+    out = pdf_to_text(src, pages="2-")
+
+    assert out == tmp_path / "a.txt"
+    assert out.read_text(encoding="utf-8").split() == ["second", "third"]
+    assert stat.S_IMODE(out.stat().st_mode) == default_file_mode()
+
+
+def test_batch_pdf2txt_reuses_cached_text(tmp_path: Path):
+    make_pdf(tmp_path / "in" / "a.pdf", "alpha")
+    make_pdf(tmp_path / "in" / "sub" / "b.pdf", "beta")
+    cache = ConversionCache(tmp_path / "cache")
+
+    def run() -> list[Path]:
+        return batch_convert(
+            tmp_path / "in",
+            ".pdf",
+            pdf_to_text,
+            output_folder=tmp_path / "out",
+            output_suffix=".txt",
+            recursive=True,
+            progress=False,
+            force=True,
+            cache=cache,
+        )
+
+    outputs = run()
+    assert sorted(p.relative_to(tmp_path / "out").as_posix() for p in outputs) == [
+        "a.txt",
+        "sub/b.txt",
+    ]
+
+    with patch.object(pdf_to_text_module, "iter_pdf_pages") as extract:
+        run()
+    extract.assert_not_called()
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert (tmp_path / "out" / "sub" / "b.txt").read_text(encoding="utf-8").strip() == "beta"
+
+
+def test_cli_inspect_pdf(tmp_path: Path):
+    src = make_pdf(tmp_path / "a.pdf", "one", "two")
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["inspect", "pdf", str(src), "--pages", "2"])
+    assert result.exit_code == 0, result.output
+    assert result.output.split() == ["two"]
+
+    result = runner.invoke(app, ["inspect", "pdf", str(src), "--jsonl"])
+    assert [json.loads(line)["page"] for line in result.output.splitlines()] == [1, 2]
+
+    result = runner.invoke(app, ["inspect", "pdf", str(src), "--pages", "9"])
+    assert result.exit_code == 2
+
+
+def test_cli_batch_pdf2txt_rejects_bad_options(tmp_path: Path):
+    make_pdf(tmp_path / "in" / "a.pdf", "one")
+    runner = CliRunner()
+
+    for extra, hint in (
+        (["--pages", "x"], "--pages"),
+        (["--pages", "3-1"], "--pages"),
+        (["--engine", "server"], "--engine"),
+        (["--fast"], "--fast"),
+    ):
+        result = runner.invoke(app, ["batch", "pdf2txt", str(tmp_path / "in"), *extra])
+        assert result.exit_code == 2, result.output
+        assert hint in result.output
+        assert not (tmp_path / "in" / "a.txt").exists()
@@ -0,0 +1,95 @@
+import io
+import json
+import stat
+from pathlib import Path
+
+import pytest
+
+from docutil.inspect.pdf_extract import (
+    extract_pdf_text,
+    iter_pdf_pages,
+    parse_page_spec,
+    write_pdf_jsonl,
+)
+from docutil.utils.files import default_file_mode
+
+fitz = pytest.importorskip("fitz")
+
+
+@pytest.fixture
+def pdf(tmp_path: Path) -> Path:
+    path = tmp_path / "doc.pdf"
+    doc = fitz.open()
+    for n in range(1, 6):
+        doc.new_page().insert_text((72, 72), f"page {n}")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        (None, [range(0, 5)]),
+        (3, [range(2, 3)]),
+        ("1-2, 4-", [range(0, 2), range(3, 5)]),
+        ("-2,2,3", [range(0, 3)]),
+        ([5, 1, 1], [range(0, 1), range(4, 5)]),
+    ],
+)
+def test_parse_page_spec(spec, expected):
+    assert parse_page_spec(spec, 5) == expected
+
+
+@pytest.mark.parametrize("spec", ["0", "6", "3-1", "a-b"])
+def test_parse_page_spec_rejects_bad_ranges(spec: str):
+    with pytest.raises(ValueError):
+        parse_page_spec(spec, 5)
+
+
+def test_pages_are_streamed_in_range(pdf: Path):
+    pages = list(iter_pdf_pages(pdf, pages="2-3,5"))
+
+    assert [p.page for p in pages] == [2, 3, 5]
+    assert [p.text.strip() for p in pages] == ["page 2", "page 3", "page 5"]
+
+
+def test_early_termination_closes_document(pdf: Path, monkeypatch: pytest.MonkeyPatch):
+    opened = []
+    real_open = fitz.open
+    monkeypatch.setattr(fitz, "open", lambda *a: opened.append(real_open(*a)) or opened[-1])
+
+    gen = iter_pdf_pages(pdf)
+    assert next(gen).page == 1
+    assert not opened[0].is_closed
+    gen.close()
+
+    assert opened[0].is_closed
+
+
+def test_jsonl_writer(pdf: Path, tmp_path: Path):
+    out = tmp_path / "out" / "doc.jsonl"
+
+    assert write_pdf_jsonl(pdf, out, pages="4-") == 2
+    rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [(r["page"], r["text"].strip()) for r in rows] == [(4, "page 4"), (5, "page 5")]
+    assert stat.S_IMODE(out.stat().st_mode) == default_file_mode()
+
+    buf = io.StringIO()
+    write_pdf_jsonl(pdf, buf, pages=1)
+    assert json.loads(buf.getvalue())["page"] == 1
+
+
+def test_extract_pdf_text_is_unchanged(pdf: Path):
+    result = extract_pdf_text(pdf)
+
+    assert result.pages == 5
+    assert result.text.splitlines()[0] == "page 1"
+
+
+def test_parallel_output_is_identical(pdf: Path):
+    sequential = list(iter_pdf_pages(pdf, pages="1,3-5"))
+    parallel = list(iter_pdf_pages(pdf, pages="1,3-5", workers=3))
+
+    assert parallel == sequential
+    assert extract_pdf_text(pdf, workers=2) == extract_pdf_text(pdf)
@@ -0,0 +1,91 @@
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.cli import app
+from docutil.conversions.batch import batch_convert
+from docutil.profiling import active_profiler, profiling, span
+
+
+def copy_converter(src: Path, out: Path | None) -> Path:
+    assert out is not None
+    with span("write"):
+        out.write_bytes(src.read_bytes())
+    return out
+
+
+@pytest.fixture
+def folder(tmp_path: Path) -> Path:
+    src = tmp_path / "in"
+    (src / "sub").mkdir(parents=True)
+    for name in ("a.md", "b.md", "sub/c.md"):
+        (src / name).write_text(name)
+    return src
+
+
+def test_spans_are_free_outside_profiling():
+    with span("convert"):
+        pass
+    assert active_profiler() is None
+
+
+def test_batch_stages_are_recorded(tmp_path: Path, folder: Path):
+    with profiling() as profiler:
+        batch_convert(
+            folder,
+            ".md",
+            copy_converter,
+            output_folder=tmp_path / "out",
+            output_suffix=".txt",
+            recursive=True,
+            versioned=True,
+            progress=False,
+            workers=2,
+        )
+
+    counts = {s.name: s.count for s in profiler.summary()}
+    assert counts["convert"] == counts["plan"] == counts["plan.versioned"] == 3
+    assert counts["write"] == counts["record"] == 3
+    assert counts["discover"] == 4  # three files plus the exhausted step
+    assert "convert" in profiler.format_summary()
+    assert active_profiler() is None
+
+
+def test_chrome_trace_and_pstats_exports(tmp_path: Path):
+    with profiling(tmp_path / "trace.json"):
+        with span("pandoc.run"):
+            pass
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert [e["name"] for e in events if e["ph"] == "X"] == ["pandoc.run"]
+    assert any(e["ph"] == "M" and e["args"]["name"] == "MainThread" for e in events)
+
+    with profiling(tmp_path / "run.prof"):
+        sorted(range(1000))
+    assert pstats.Stats(str(tmp_path / "run.prof")).total_calls > 0
+
+
+def test_profiling_does_not_nest():
+    with profiling(), pytest.raises(RuntimeError):
+        with profiling():
+            pass
+
+
+def test_cli_profile_prints_breakdown(tmp_path: Path, folder: Path):
+    result = CliRunner().invoke(
+        app,
+        [
+            "--profile-out",
+            str(tmp_path / "trace.json"),
+            "batch",
+            "md2docx",
+            str(folder),
+            "--dry-run",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "wall time:" in result.output
+    assert (tmp_path / "trace.json").exists()
@@ -0,0 +1,116 @@
+import importlib
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from docutil.cli import app
+from docutil.search import SearchHit, SearchIndex, parse_query
+from docutil.search.postings import decode, encode, index_text
+
+search_index = importlib.import_module("docutil.search.index")
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    root = tmp_path / "out"
+    (root / "sub").mkdir(parents=True)
+    (root / "policy.md").write_text(
+        "# Data Retention Policy\n\nWe keep data for a year.\nRetention of *data* is audited.\n",
+        encoding="utf-8",
+    )
+    (root / "sub" / "notes.md").write_text("Follow-up: data\nretention meeting\n", encoding="utf-8")
+    (root / "ignored.txt").write_text("data retention", encoding="utf-8")
+    return root
+
+
+def test_postings_roundtrip():
+    occurrences = [(0, 1), (5, 1), (300, 4), (70_000, 900)]
+    assert list(decode(encode(occurrences))) == occurrences
+    assert len(encode([(0, 1), (1, 1), (2, 2)])) == 6
+
+    assert index_text("Hello, hello\nworld")["hello"] == [(0, 1), (1, 1)]
+
+
+def test_parse_query():
+    assert parse_query('"Data Retention" policy follow-up') == [
+        ["data", "retention"],
+        ["policy"],
+        ["follow", "up"],
+    ]
+
+
+def test_term_and_phrase_queries(tmp_path: Path, corpus: Path):
+    with SearchIndex(tmp_path / "search.sqlite") as index:
+        assert index.build(corpus, recursive=True).added == 2
+
+        policy, notes = str(corpus / "policy.md"), str(corpus / "sub" / "notes.md")
+        assert index.search("retention") == [
+            SearchHit(policy, 1),
+            SearchHit(policy, 4),
+            SearchHit(notes, 2),
+        ]
+        # Phrases match across lines, reported at the first term.
+        assert index.search('"data retention"') == [SearchHit(policy, 1), SearchHit(notes, 1)]
+        assert index.search('"retention data"') == []
+        assert index.search("audited retention") == [SearchHit(policy, 1), SearchHit(policy, 4)]
+        assert index.search("missing") == []
+        assert len(index.search("data", limit=2)) == 2
+
+
+def test_update_is_incremental(tmp_path: Path, corpus: Path):
+    index = SearchIndex(tmp_path / "search.sqlite")
+    index.build(corpus, recursive=True)
+
+    (corpus / "sub" / "notes.md").write_text("archived\n", encoding="utf-8")
+    os.utime(corpus / "policy.md", ns=(1, 1))  # touched, content unchanged
+    (corpus / "new.md").write_text("retention schedule\n", encoding="utf-8")
+
+    with patch.object(search_index, "index_text", wraps=search_index.index_text) as tokenize:
+        stats = index.update()
+
+    assert tokenize.call_count == 2
+    assert (stats.added, stats.updated, stats.unchanged) == (1, 1, 1)
+    assert [Path(h.path).name for h in index.search("retention")] == [
+        "new.md",
+        "policy.md",
+        "policy.md",
+    ]
+    assert index.search("archived") == [SearchHit(str(corpus / "sub" / "notes.md"), 1)]
+
+    (corpus / "new.md").unlink()
+    assert index.update().removed == 1
+    assert index.search("schedule") == []
+    index.close()
+
+
+def test_pdf_text_is_indexed(tmp_path: Path):
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "quarterly filing")
+    doc.save(tmp_path / "report.pdf")
+    doc.close()
+
+    with SearchIndex(tmp_path / "search.sqlite") as index:
+        index.build(tmp_path)
+        assert index.search('"quarterly filing"') == [SearchHit(str(tmp_path / "report.pdf"), 1)]
+
+
+def test_cli_build_and_query(tmp_path: Path, corpus: Path):
+    db = str(tmp_path / "search.sqlite")
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["search", "build", str(corpus), "--recursive", "--db", db])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(app, ["search", "query", '"data retention"', "--db", db])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        f"{corpus / 'policy.md'}:1",
+        f"{corpus / 'sub' / 'notes.md'}:1",
+    ]
+
+    result = runner.invoke(app, ["search", "query", "nothing", "--db", db])
+    assert result.exit_code == 1
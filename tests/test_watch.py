@@ -0,0 +1,63 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from docutil.conversions.watch import watch_convert
+
+
+@pytest.mark.parametrize("polling", [False, True])
+def test_watch_converts_changed_files_once(tmp_path: Path, polling: bool):
+    src_dir = tmp_path / "in"
+    out_dir = tmp_path / "out"
+    (src_dir / "sub").mkdir(parents=True)
+    (src_dir / "untouched.md").write_text("x")
+
+    calls: list[str] = []
+    rounds: list[list[Path]] = []
+    converted = threading.Event()
+    stop = threading.Event()
+
+    def fake_converter(src: Path, out: Path | None) -> Path:
+        assert out is not None
+        calls.append(src.name)
+        out.write_text(src.read_text())
+        return out
+
+    def on_converted(outputs: list[Path]) -> None:
+        rounds.append(outputs)
+        converted.set()
+
+    thread = threading.Thread(
+        target=watch_convert,
+        args=(src_dir, ".md", fake_converter),
+        kwargs={
+            "output_folder": out_dir,
+            "output_suffix": ".txt",
+            "recursive": True,
+            "debounce": 0.3,
+            "poll_interval": 0.05,
+            "polling": polling,
+            "stop_event": stop,
+            "on_converted": on_converted,
+        },
+        daemon=True,
+    )
+    thread.start()
+    time.sleep(0.2)
+
+    # A burst of saves to the same file plus one other file and a non-match.
+    target = src_dir / "sub" / "a.md"
+    for i in range(5):
+        target.write_text(f"v{i}")
+    (src_dir / "b.md").write_text("b")
+    (src_dir / "ignored.docx").write_text("nope")
+
+    assert converted.wait(10)
+    stop.set()
+    thread.join(5)
+
+    assert sorted(calls) == ["a.md", "b.md"]
+    assert len(rounds) == 1
+    assert (out_dir / "sub" / "a.txt").read_text() == "v4"